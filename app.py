@@ -1,26 +1,12 @@
 import streamlit as st
-import pandas as pd
 from datetime import datetime, timedelta
 import time
-from data.lllt_data import (
-    get_lllt_daily_data,
-    get_supplement_data,
-    get_weekly_schedule,
-    get_adjustments_data
-)
-from data.mobility_data import (
-    get_phase1_data,
-    get_phase2_data,
-    get_phase3_data,
-    get_progress_metrics,
-    get_key_adjustments
-)
-from models.lllt import LLLTProtocol
-from models.mobility import MobilityProtocol
-from playsound import playsound
-import os
-import plotly.express as px
+from app.components.countdown import countdown_timer
+from app.data.watcher import data_watcher
+from app.utils.duration import parse_duration
+from app.utils.theme import link_stylesheet
 import math
+from typing import List, Optional
 
 # Page config with custom theme and responsive layout
 st.set_page_config(
@@ -35,330 +21,8 @@ st.set_page_config(
     }
 )
 
-# Update the CSS with refined color scheme
-st.markdown("""
-<style>
-    /* Modern color scheme - Inspired by 2024 design trends */
-    :root {
-        /* Primary Background Colors */
-        --bg-gradient-1: #1e1b4b;  /* Deep Navy */
-        --bg-gradient-2: #312e81;  /* Rich Indigo */
-        
-        /* Surface Colors */
-        --surface-primary: rgba(255, 255, 255, 0.08);
-        --surface-secondary: rgba(255, 255, 255, 0.04);
-        
-        /* Accent Colors */
-        --accent-primary: #818cf8;    /* Soft Indigo */
-        --accent-secondary: #4f46e5;  /* Electric Indigo */
-        --accent-success: #34d399;    /* Emerald */
-        --accent-warning: #fbbf24;    /* Amber */
-        
-        /* Text Colors */
-        --text-primary: #ffffff;
-        --text-secondary: rgba(255, 255, 255, 0.7);
-        --text-tertiary: rgba(255, 255, 255, 0.5);
-    }
-
-    /* Global styles */
-    .stApp {
-        background: linear-gradient(135deg, var(--bg-gradient-1) 0%, var(--bg-gradient-2) 100%);
-        color: var(--text-primary);
-    }
-
-    /* Card styling */
-    .exercise-card {
-        background: rgba(255,255,255,0.1);
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        border: 1px solid rgba(255,255,255,0.2);
-        transition: all 0.3s ease;
-    }
-    
-    .exercise-card.active {
-        border: 2px solid #5BC0BE;
-        box-shadow: 0 4px 12px rgba(91, 192, 190, 0.3);
-    }
-    
-    .card-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        margin-bottom: 1rem;
-    }
-    
-    .duration-badge {
-        background: rgba(91, 192, 190, 0.3);
-        padding: 0.5rem 1rem;
-        border-radius: 8px;
-        font-weight: 600;
-    }
-
-    /* Timer container */
-    .timer-container {
-        background: var(--surface-primary);
-        backdrop-filter: blur(20px);
-        border: 1px solid rgba(255, 255, 255, 0.1);
-        border-radius: 24px;
-        padding: 2rem;
-        text-align: center;
-        margin: 1rem 0;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-    }
-
-    /* Timer display */
-    .timer-display {
-        font-size: 2.5rem;
-        font-weight: 700;
-        color: var(--text-primary);
-        text-shadow: 0 2px 4px rgba(0, 0, 0, 0.2);
-        transform: none !important;
-    }
-
-    /* Progress ring */
-    .progress-ring circle.background {
-        stroke: var(--surface-secondary);
-    }
-    .progress-ring circle.progress {
-        stroke: var(--accent-primary);
-        filter: drop-shadow(0 0 4px var(--accent-primary));
-    }
-
-    /* Button styles */
-    .stButton>button {
-        background: var(--accent-secondary);
-        color: var(--text-primary);
-        border: none;
-        padding: 0.75rem 1.5rem;
-        border-radius: 12px;
-        font-weight: 600;
-        transition: all 0.2s ease;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-    }
-    .stButton>button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 16px rgba(0, 0, 0, 0.2);
-        background: var(--accent-primary);
-    }
-
-    /* Specific button styles */
-    .start-button button {
-        background: linear-gradient(135deg, var(--accent-secondary) 0%, var(--accent-primary) 100%);
-    }
-    .pause-button button {
-        background: var(--accent-warning);
-    }
-    .complete-button button {
-        background: var(--accent-success);
-    }
-
-    /* Text styles */
-    h1, h2, h3 {
-        color: var(--text-primary);
-        font-weight: 600;
-        letter-spacing: -0.02em;
-    }
-    p {
-        color: var(--text-secondary);
-        line-height: 1.6;
-    }
-
-    /* Tabs styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 1rem;
-        background-color: transparent;
-    }
-    .stTabs [data-baseweb="tab"] {
-        background-color: var(--surface-primary);
-        border-radius: 12px;
-        padding: 0.75rem 1.25rem;
-        color: var(--text-primary);
-    }
-    .stTabs [aria-selected="true"] {
-        background: var(--accent-secondary);
-    }
-
-    /* Metrics and progress */
-    .metric-container {
-        background: var(--surface-primary);
-        border-radius: 16px;
-        padding: 1.5rem;
-        border: 1px solid rgba(255, 255, 255, 0.1);
-    }
-    .metric-value {
-        color: var(--accent-primary);
-        font-size: 2rem;
-        font-weight: 700;
-    }
-    .metric-label {
-        color: var(--text-secondary);
-        font-size: 0.875rem;
-    }
-
-    /* Sidebar */
-    .css-1d391kg {
-        background: var(--surface-primary);
-    }
-
-    /* Sidebar text colors */
-    .css-1d391kg, .css-1d391kg p {
-        color: var(--text-primary) !important;
-    }
-    
-    /* Sidebar text */
-    [data-testid="stSidebarNav"] {
-        background-color: var(--surface-primary);
-    }
-    .sidebar .sidebar-content {
-        background-color: var(--surface-primary);
-    }
-    
-    /* Radio buttons in sidebar */
-    .stRadio > label {
-        color: var(--text-primary) !important;
-    }
-    
-    /* Button text alignment */
-    .stButton>button {
-        white-space: nowrap;
-        min-width: 120px;
-        padding: 0.75rem 1.25rem;
-        display: inline-flex;
-        align-items: center;
-        justify-content: center;
-        gap: 0.5rem;
-        font-size: 0.875rem;
-    }
-    
-    /* Sidebar background */
-    section[data-testid="stSidebar"] > div {
-        background: var(--bg-gradient-1);
-    }
-    
-    /* Sidebar text */
-    .sidebar-content {
-        color: var(--text-primary) !important;
-    }
-    
-    /* Radio button text */
-    .stRadio label {
-        color: var(--text-primary) !important;
-    }
-    
-    /* Help text */
-    .stRadio div[data-testid="stMarkdownContainer"] {
-        color: var(--text-secondary) !important;
-    }
-
-    /* Metrics styling */
-    .metric-value, .metric-delta {
-        color: var(--text-primary) !important;
-    }
-    [data-testid="stMetricValue"] > div {
-        color: var(--text-primary) !important;
-    }
-    [data-testid="stMetricDelta"] > div {
-        color: var(--text-secondary) !important;
-    }
-    
-    /* Help icon color */
-    .stMarkdown div[data-testid="StyledLinkIconContainer"] {
-        color: var(--text-primary) !important;
-    }
-    
-    /* Protocol selector styling */
-    .protocol-selector {
-        display: flex;
-        flex-direction: column;
-        gap: 0.75rem;
-        margin: 1rem 0;
-    }
-    
-    .protocol-option {
-        background: var(--surface-primary);
-        border: 1px solid rgba(255, 255, 255, 0.1);
-        border-radius: 12px;
-        padding: 1rem;
-        cursor: pointer;
-        transition: all 0.2s ease;
-        display: flex;
-        align-items: center;
-        gap: 0.75rem;
-    }
-    
-    .protocol-option:hover {
-        background: var(--surface-secondary);
-        transform: translateY(-2px);
-    }
-    
-    .protocol-option.selected {
-        background: var(--accent-primary);
-        border-color: var(--accent-secondary);
-    }
-    
-    .protocol-icon {
-        font-size: 1.5rem;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        width: 40px;
-        height: 40px;
-        background: rgba(255, 255, 255, 0.1);
-        border-radius: 50%;
-    }
-    
-    .protocol-info {
-        flex: 1;
-    }
-    
-    .protocol-name {
-        font-weight: 600;
-        color: var(--text-primary);
-        margin: 0;
-    }
-    
-    .protocol-desc {
-        color: var(--text-secondary);
-        font-size: 0.875rem;
-        margin: 0;
-    }
-
-    /* Timer styling */
-    .progress-ring {
-        position: relative;
-        width: 200px;
-        height: 200px;
-        margin: 0 auto;
-    }
-    
-    .progress-ring circle {
-        fill: none;
-        stroke-width: 8;
-    }
-    
-    .progress-ring .background {
-        stroke: var(--surface-secondary);
-    }
-    
-    .progress-ring .progress {
-        stroke: var(--accent-primary);
-        filter: drop-shadow(0 0 4px var(--accent-primary));
-        transition: stroke-dashoffset 0.3s ease;
-    }
-    
-    /* Timer display container */
-    .timer-display-container {
-        position: absolute;
-        top: 50%;
-        left: 50%;
-        transform: translate(-50%, -50%);
-        display: flex;
-        align-items: center;
-        justify-content: center;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Dashboard theme; a cached stylesheet, so reruns carry no CSS
+link_stylesheet("app.css")
 
 # Update the main header style
 st.markdown("""
@@ -380,9 +44,25 @@ with st.sidebar:
         </div>
     """, unsafe_allow_html=True)
 
-# Initialize protocols
-@st.cache_data
+# Initialize protocols once per process; every session shares the same objects
+@st.cache_resource
 def load_protocols():
+    # The protocol models and their data modules load pandas and bs4, so they
+    # are imported when first used rather than with the page
+    from data.lllt_data import (
+        get_lllt_daily_data,
+        get_supplement_data,
+        get_weekly_schedule
+    )
+    from data.mobility_data import (
+        get_phase1_data,
+        get_phase2_data,
+        get_phase3_data,
+        get_progress_metrics
+    )
+    from models.lllt import LLLTProtocol
+    from models.mobility import MobilityProtocol
+    
     lllt_protocol = LLLTProtocol(
         name="LLLT Protocol",
         description="Low-Level Light Therapy Protocol for Hair and Body Optimization",
@@ -418,46 +98,6 @@ def load_protocols():
     
     return lllt_protocol, mobility_protocol
 
-# Movement demonstrations dictionary
-MOVEMENT_DEMOS = {
-    "Dynamic Cat-Cow": {
-        "youtube": "https://www.youtube.com/watch?v=kqnua4rHVVA",
-        "how_to": [
-            "Start on hands and knees in tabletop position",
-            "Inhale: Drop belly, lift chest and tailbone (Cow)",
-            "Exhale: Round spine, tuck chin and tailbone (Cat)",
-            "Flow smoothly between positions",
-            "Keep movements synchronized with breath"
-        ]
-    },
-    "90/90 Hip Switch": {
-        "youtube": "https://www.youtube.com/watch?v=nLuvQCTPrcY",
-        "how_to": [
-            "Sit with one leg bent 90° in front, other leg 90° to side",
-            "Keep back straight and core engaged",
-            "Lift hips and switch leg positions smoothly",
-            "Control the movement throughout",
-            "Keep feet flexed to protect knees"
-        ]
-    },
-    "Sun Salutation A": {
-        "youtube": "https://www.youtube.com/watch?v=8AakYeM_iRQ",
-        "how_to": [
-            "Start in Mountain Pose (Tadasana)",
-            "Flow through sequence: Forward Fold → Plank → Chaturanga",
-            "Upward Dog → Downward Dog → Forward Fold",
-            "Return to Mountain Pose",
-            "Coordinate movement with breath"
-        ]
-    }
-    # Add more exercises as needed
-}
-
-# Load data
-lllt_protocol, mobility_protocol = load_protocols()
-lllt_dfs = lllt_protocol.to_dataframe()
-mobility_dfs = mobility_protocol.to_dataframe()
-
 # Initialize session state variables at the top level
 def init_session_state():
     """Initialize all session state variables in one place"""
@@ -470,85 +110,43 @@ def init_session_state():
         'timer_duration': 0,
         'timer_paused': False,
         'pause_time': None,
-        'last_update': None,
-        'should_play_sound': False
+        'last_update': None
     }
     for k, v in defaults.items():
         if k not in st.session_state:
             st.session_state[k] = v
 
-def parse_duration(duration_str: str, default_seconds: int = 60) -> int:
-    """Convert duration string to seconds with unified parsing logic"""
-    duration = 0
-    parts = duration_str.lower().replace('/', ' ').split()
-    
-    for i, part in enumerate(parts):
-        try:
-            if 'min' in part:
-                num = int(parts[i-1])
-                duration += num * 60
-            elif 'sec' in part:
-                num = int(parts[i-1])
-                duration += num
-            elif 'rep' in part:
-                num = int(parts[i-1])
-                duration += num * 5  # Assume 5 seconds per rep
-        except (ValueError, IndexError):
-            continue
-    
-    return duration if duration > 0 else default_seconds
-
-def update_timer_state():
-    """Update timer state without blocking"""
-    if not st.session_state.timer_active:
-        return
-        
+def timer_elapsed() -> float:
+    """Seconds elapsed on the current timer, excluding pauses"""
     if st.session_state.timer_paused:
-        return
-        
-    current_time = time.time()
-    if st.session_state.last_update is None:
-        st.session_state.last_update = current_time
-        
-    # Calculate elapsed time
-    elapsed = current_time - st.session_state.timer_start
-    remaining = st.session_state.timer_duration - elapsed
-    
-    # Check if timer is complete
-    if remaining <= 0:
-        st.session_state.timer_active = False
-        st.session_state.should_play_sound = True
-        if st.session_state.current_exercise:
-            st.session_state.completed_exercises.add(st.session_state.current_exercise['Exercise'])
-            st.session_state.current_exercise = None
-        st.rerun()
-    
-    # Update every second
-    if current_time - st.session_state.last_update >= 1:
-        st.session_state.last_update = current_time
-        st.rerun()
+        return st.session_state.pause_time - st.session_state.timer_start
+    return time.time() - st.session_state.timer_start
 
 def start_exercise(exercise: dict):
-    """Start an exercise with non-blocking timer"""
+    """Start an exercise; its countdown runs in the browser"""
     st.session_state.current_exercise = exercise
     if not st.session_state.session_start:
         st.session_state.session_start = datetime.now()
     
-    # Parse duration and start timer
-    duration_str = exercise.get('Sets/Reps/Duration', '60 seconds')
-    st.session_state.timer_duration = parse_duration(duration_str)
+    # Time the row being started: an exercise's prescription differs between
+    # phases and sessions. Catalog rows carry their parsed seconds.
+    seconds = exercise.get('Seconds')
+    if seconds:
+        st.session_state.timer_duration = int(seconds)
+    else:
+        st.session_state.timer_duration = parse_duration(exercise.get('Sets/Reps/Duration', '60 seconds'))
     st.session_state.timer_start = time.time()
     st.session_state.timer_active = True
     st.session_state.timer_paused = False
-    st.session_state.last_update = None
     st.rerun()
 
-def pause_timer():
-    """Pause the current timer"""
-    if st.session_state.timer_active:
-        st.session_state.timer_paused = True
+def pause_timer(elapsed: Optional[float] = None):
+    """Pause the current timer, at the browser's elapsed time if given"""
+    if st.session_state.timer_active and not st.session_state.timer_paused:
         st.session_state.pause_time = time.time()
-        st.rerun()
+        if elapsed is not None:
+            st.session_state.timer_start = st.session_state.pause_time - elapsed
+        st.session_state.timer_paused = True
 
 def resume_timer():
     """Resume the paused timer"""
@@ -556,16 +154,12 @@ def resume_timer():
         elapsed_pause = time.time() - st.session_state.pause_time
         st.session_state.timer_start += elapsed_pause
         st.session_state.timer_paused = False
-        st.session_state.last_update = None
-        st.rerun()
 
 def restart_timer():
     """Restart the current timer"""
     if st.session_state.current_exercise:
         st.session_state.timer_start = time.time()
         st.session_state.timer_paused = False
-        st.session_state.last_update = None
-        st.rerun()
 
 def complete_exercise():
     """Mark current exercise as complete"""
@@ -573,68 +167,44 @@ def complete_exercise():
         st.session_state.completed_exercises.add(st.session_state.current_exercise['Exercise'])
         st.session_state.current_exercise = None
         st.session_state.timer_active = False
-        st.rerun()
+
+def handle_timer_event(event: dict):
+    """Apply a pause, resume, restart or complete event reported by the countdown"""
+    if not st.session_state.current_exercise or not st.session_state.timer_active:
+        return
+    
+    action = event['event']
+    if action == 'pause':
+        pause_timer(event.get('elapsed'))
+    elif action == 'resume':
+        resume_timer()
+    elif action == 'restart':
+        restart_timer()
+    elif action == 'complete':
+        complete_exercise()
+
+def exercise_countdown(key: str):
+    """Render the countdown for the current exercise"""
+    countdown_timer(
+        st.session_state.timer_duration,
+        timer_elapsed(),
+        st.session_state.timer_paused,
+        key=key,
+        on_event=handle_timer_event,
+        run_id=st.session_state.timer_start
+    )
 
 def display_timer():
-    """Display timer with improved styling and non-blocking updates"""
+    """Display the current exercise's countdown, which ticks and chimes in the browser"""
     if not st.session_state.current_exercise:
         return
-        
-    # Update timer state
-    update_timer_state()
-    
-    # Calculate time remaining
-    if st.session_state.timer_paused:
-        elapsed = st.session_state.pause_time - st.session_state.timer_start
-    else:
-        elapsed = time.time() - st.session_state.timer_start
-    
-    remaining = max(0, st.session_state.timer_duration - int(elapsed))
-    progress = min(1.0, elapsed / st.session_state.timer_duration)
-    mins, secs = divmod(remaining, 60)
     
-    # Play sound if needed
-    if st.session_state.should_play_sound:
-        st.session_state.should_play_sound = False
-        st.markdown(
-            """
-            <audio autoplay>
-                <source src="data:audio/wav;base64,..." type="audio/wav">
-            </audio>
-            """,
-            unsafe_allow_html=True
-        )
-    
-    # Timer display
-    st.markdown(f"""
-        <div style='text-align: center; padding: 1rem; background: var(--surface-secondary); border-radius: 12px;'>
-            <div style='font-size: 3rem; font-weight: bold; color: var(--text-primary);'>
-                {mins:02d}:{secs:02d}
-            </div>
-        </div>
-    """, unsafe_allow_html=True)
-    
-    st.progress(progress)
-    
-    # Timer controls
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        if st.session_state.timer_paused:
-            if st.button("▶️ Resume", use_container_width=True):
-                resume_timer()
-        else:
-            if st.button("⏸️ Pause", use_container_width=True):
-                pause_timer()
-    
-    with col2:
-        if st.button("🔄 Restart", use_container_width=True):
-            restart_timer()
-    
-    with col3:
-        if st.button("✅ Complete", use_container_width=True):
-            complete_exercise()
+    exercise_countdown("exercise_timer")
 
 def main():
+    # Refresh cached protocol data when its files change
+    data_watcher.start()
+    
     # Initialize session state
     init_session_state()
     
@@ -725,8 +295,96 @@ def display_lllt_daily_protocol():
                     if st.button("Complete", key=f"complete_{protocol['area']}"):
                         mark_complete(protocol['area'])
 
+# Collapsed exercise cards shown per page of a routine
+EXERCISES_PER_PAGE = 4
+
+def select_exercise(name: str):
+    """Show the detail tabs of one exercise card"""
+    st.session_state.selected_exercise = name
+
+def is_active_exercise(exercise: dict) -> bool:
+    """Whether the exercise's timer is running"""
+    current = st.session_state.current_exercise
+    return bool(current) and current.get('Exercise', '') == exercise.get('Exercise', '')
+
+def is_expanded_exercise(exercise: dict) -> bool:
+    """Whether the exercise's card shows its details and timer"""
+    return is_active_exercise(exercise) or st.session_state.get('selected_exercise') == exercise['Exercise']
+
+def display_exercise_details(exercise: dict):
+    """Equipment, notes and how-to tabs of one exercise"""
+    tab1, tab2 = st.tabs(["Equipment & Notes", "How to Perform"])
+    
+    with tab1:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("#### Equipment")
+            st.markdown(exercise.get('Equipment', 'None required'))
+        with col2:
+            st.markdown("#### Key Notes")
+            st.markdown(exercise.get('Key Notes', ''))
+    
+    with tab2:
+        from app.data.exercise_index import get_exercise_index
+        demo = get_exercise_index().demo(exercise) or {}
+        steps = exercise.get('Steps') or demo.get('how_to', [])
+        for step in steps:
+            st.markdown(f"- {step}")
+        
+        demo_url = exercise.get('Demo') or demo.get('youtube')
+        if demo_url:
+            st.markdown(f"[🎥 Watch Demo]({demo_url})")
+
+def display_exercise_card(exercise: dict, time_of_day: str, i: int):
+    """Display one exercise; only the selected or active one builds its details"""
+    is_completed = exercise['Exercise'] in st.session_state.completed_exercises
+    
+    if is_expanded_exercise(exercise):
+        with st.expander(f"{exercise['Exercise']}", expanded=True):
+            # Exercise title and duration in large, prominent text
+            st.markdown(f"""
+                <div style='background: var(--surface-primary); padding: 1rem; border-radius: 12px; margin-bottom: 1rem;'>
+                    <h2 style='margin: 0; color: var(--text-primary); font-size: 1.8rem;'>{exercise['Exercise']}</h2>
+                    <p style='margin: 0.5rem 0 0 0; color: var(--accent-primary); font-size: 1.2rem; font-weight: 600;'>
+                        {exercise.get('Sets/Reps/Duration', '')}
+                    </p>
+                </div>
+            """, unsafe_allow_html=True)
+            
+            # Timer and controls first if exercise is active
+            if is_active_exercise(exercise):
+                exercise_countdown(f"timer_{time_of_day}_{i}")
+            elif not is_completed:
+                if st.button("▶️ Start", key=f"start_{time_of_day}_{i}", use_container_width=True):
+                    start_exercise(exercise)
+            
+            display_exercise_details(exercise)
+        return
+    
+    # Collapsed card: name, prescription and actions only
+    with st.container(border=True):
+        col1, col2, col3 = st.columns([4, 1, 1])
+        col1.markdown(f"**{exercise['Exercise']}**  \n{exercise.get('Sets/Reps/Duration', '')}")
+        col2.button("Details", key=f"details_{time_of_day}_{i}", on_click=select_exercise,
+                    args=(exercise['Exercise'],), use_container_width=True)
+        if is_completed:
+            col3.markdown("✅")
+        elif col3.button("▶️ Start", key=f"start_{time_of_day}_{i}", use_container_width=True):
+            start_exercise(exercise)
+
+def display_page(count: int, key: str, pinned=()) -> List[int]:
+    """Pick a page of a long list; returns the indices on it and the pinned ones"""
+    pages = math.ceil(count / EXERCISES_PER_PAGE)
+    page = 0
+    if pages > 1:
+        page = st.radio("Page", range(pages), format_func=lambda p: f"{p + 1} of {pages}",
+                        horizontal=True, key=key)
+    first = page * EXERCISES_PER_PAGE
+    return sorted(set(range(first, min(first + EXERCISES_PER_PAGE, count))) | set(pinned))
+
 def display_mobility_exercises():
     """Display mobility exercises with improved organization and clarity"""
+    from data.mobility_data import get_phase1_data
     exercises = get_phase1_data()
     
     # Group exercises by time of day
@@ -741,97 +399,15 @@ def display_mobility_exercises():
             time_of_day = exercise.get('Time', 'morning').lower().replace(' ', '_').replace('-', '_')
             exercise_groups[time_of_day].append(exercise)
     
-    # Display each group
+    # Display each group, one page of collapsed cards at a time
     for time_of_day, group_exercises in exercise_groups.items():
         if group_exercises:
             st.header(f"{time_of_day.replace('_', ' ').title()} Routine")
             
-            for i, exercise in enumerate(group_exercises):
-                with st.expander(f"{exercise['Exercise']}", expanded=True):
-                    # Exercise title and duration in large, prominent text
-                    st.markdown(f"""
-                        <div style='background: var(--surface-primary); padding: 1rem; border-radius: 12px; margin-bottom: 1rem;'>
-                            <h2 style='margin: 0; color: var(--text-primary); font-size: 1.8rem;'>{exercise['Exercise']}</h2>
-                            <p style='margin: 0.5rem 0 0 0; color: var(--accent-primary); font-size: 1.2rem; font-weight: 600;'>
-                                {exercise.get('Sets/Reps/Duration', '')}
-                            </p>
-                        </div>
-                    """, unsafe_allow_html=True)
-                    
-                    # Timer and controls first if exercise is active
-                    if st.session_state.current_exercise and st.session_state.current_exercise.get('Exercise', '') == exercise.get('Exercise', ''):
-                        col1, col2 = st.columns([3, 1])
-                        with col1:
-                            if st.session_state.timer_paused:
-                                elapsed = st.session_state.pause_time - st.session_state.timer_start
-                            else:
-                                elapsed = time.time() - st.session_state.timer_start
-                            
-                            remaining = max(0, st.session_state.timer_duration - int(elapsed))
-                            progress = min(1.0, elapsed / st.session_state.timer_duration)
-                            mins, secs = divmod(remaining, 60)
-                            
-                            # Timer display
-                            st.markdown(f"""
-                                <div style='text-align: center; padding: 1rem; background: var(--surface-secondary); border-radius: 12px;'>
-                                    <div style='font-size: 3rem; font-weight: bold; color: var(--text-primary);'>
-                                        {mins:02d}:{secs:02d}
-                                    </div>
-                                </div>
-                            """, unsafe_allow_html=True)
-                            st.progress(progress)
-                            
-                            if remaining <= 0 and not st.session_state.timer_paused:
-                                st.session_state.completed_exercises.add(exercise['Exercise'])
-                                st.session_state.current_exercise = None
-                                st.rerun()
-                        
-                        with col2:
-                            if st.session_state.timer_paused:
-                                if st.button("▶️ Resume", key=f"resume_{time_of_day}_{i}", use_container_width=True):
-                                    st.session_state.timer_paused = False
-                                    st.session_state.timer_start = time.time() - (st.session_state.pause_time - st.session_state.timer_start)
-                                    st.rerun()
-                            else:
-                                if st.button("⏸️ Pause", key=f"pause_{time_of_day}_{i}", use_container_width=True):
-                                    st.session_state.timer_paused = True
-                                    st.session_state.pause_time = time.time()
-                                    st.rerun()
-                            
-                            if st.button("🔄 Restart", key=f"restart_{time_of_day}_{i}", use_container_width=True):
-                                st.session_state.timer_start = time.time()
-                                st.session_state.timer_paused = False
-                                st.rerun()
-                            
-                            if st.button("✅ Complete", key=f"complete_{time_of_day}_{i}", use_container_width=True):
-                                st.session_state.completed_exercises.add(exercise['Exercise'])
-                                st.session_state.current_exercise = None
-                                st.rerun()
-                    else:
-                        # Start button if exercise is not active
-                        if exercise['Exercise'] not in st.session_state.completed_exercises:
-                            if st.button("▶️ Start", key=f"start_{time_of_day}_{i}", use_container_width=True):
-                                start_exercise(exercise)
-                    
-                    # Exercise details in tabs
-                    tab1, tab2 = st.tabs(["Equipment & Notes", "How to Perform"])
-                    
-                    with tab1:
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            st.markdown("#### Equipment")
-                            st.markdown(exercise.get('Equipment', 'None required'))
-                        with col2:
-                            st.markdown("#### Key Notes")
-                            st.markdown(exercise.get('Key Notes', ''))
-                    
-                    with tab2:
-                        if exercise.get('Steps'):
-                            for step in exercise['Steps']:
-                                st.markdown(f"- {step}")
-                            
-                            if exercise.get('Demo'):
-                                st.markdown(f"[🎥 Watch Demo]({exercise['Demo']})")
+            # The active card runs the exercise timer, so it stays on every page
+            expanded = [i for i, exercise in enumerate(group_exercises) if is_expanded_exercise(exercise)]
+            for i in display_page(len(group_exercises), key=f"page_{time_of_day}", pinned=expanded):
+                display_exercise_card(group_exercises[i], time_of_day, i)
 
 def display_mobility_timer():
     if st.session_state.current_exercise:
@@ -841,6 +417,7 @@ def display_mobility_timer():
         display_timer()
         
         # Progress metrics
+        from data.mobility_data import get_phase1_data
         progress = len(st.session_state.completed_exercises)
         total = len(get_phase1_data())
         
@@ -853,14 +430,19 @@ def display_mobility_timer():
                 delta_color="normal"
             )
         with col2:
-            if st.session_state.session_start:
-                elapsed = datetime.now() - st.session_state.session_start
-                st.metric(
-                    "Time",
-                    str(elapsed).split('.')[0],
-                    delta="Active",
-                    delta_color="normal"
-                )
+            session_clock()
+
+@st.fragment(run_every=1)
+def session_clock():
+    """Session time; only this fragment reruns every second"""
+    if st.session_state.session_start:
+        elapsed = datetime.now() - st.session_state.session_start
+        st.metric(
+            "Time",
+            str(elapsed).split('.')[0],
+            delta="Active",
+            delta_color="normal"
+        )
 
 def display_lllt_metrics():
     st.subheader("Today's Progress")
@@ -921,7 +503,8 @@ def display_lllt_progress():
         "Current Week": 92
     }
     
-    # Create progress chart
+    # Create progress chart (plotly is only loaded once a chart is shown)
+    import plotly.express as px
     fig = px.line(
         x=list(progress_data.keys()),
         y=list(progress_data.values()),
@@ -957,6 +540,7 @@ def display_mobility_progress():
     }
     
     # Create radar chart
+    import plotly.express as px
     categories = list(progress_data.keys())
     values = list(progress_data.values())
     
@@ -5,7 +5,11 @@ Health Protocol App package.
 __version__ = "0.1.0"
 __author__ = "Daniel Fugisawa"
 
-from app.views.lllt_view import render as render_lllt
-from app.views.mobility_view import render as render_mobility
+__all__ = ["render_lllt", "render_mobility"]
 
-__all__ = ["render_lllt", "render_mobility"] 
\ No newline at end of file
+def __getattr__(name):
+    # Views load on first access so importing app.data or app.utils stays light
+    if name in __all__:
+        from app import views
+        return getattr(views, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
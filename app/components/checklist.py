@@ -0,0 +1,54 @@
+"""Exercise checklist table.
+
+A session's exercises are shown as one ``st.data_editor`` with a checkbox
+column, instead of a row of columns holding a checkbox and a markdown
+element per field. A session of eleven exercises is then a single widget
+rather than about sixty, and completion is read from the editor's return
+value, so callers only write storage when it differs from what they hold.
+"""
+from typing import Any, Dict, Iterable, Mapping, Sequence, Set
+
+import streamlit as st
+
+DONE_COLUMN = "✓"
+
+def _revision(completed: Iterable[int]) -> str:
+    """Identify a completion state for the editor's key."""
+    return "-".join(str(idx) for idx in sorted(completed))
+
+def exercise_row(exercise: Mapping[str, Any]) -> Dict[str, Any]:
+    """Display row of a mobility exercise."""
+    return {
+        "Exercise": exercise['name'],
+        "Sets/Reps": exercise['sets_reps'],
+        "Equipment": exercise['equipment'],
+        "Notes": exercise['notes']
+    }
+
+def checklist(rows: Sequence[Mapping[str, Any]], completed: Set[int], key: str) -> Set[int]:
+    """Render rows as a table whose only editable column is a checkbox.
+
+    The editor keeps its edits relative to the data it was given, so its key
+    changes with ``completed``: completion changed elsewhere (a timer, a reset
+    button) is shown as is instead of being overridden by stale edits.
+
+    Args:
+        rows: Display rows, one per exercise, mapping column title to value
+        completed: Indices of the completed rows
+        key: Widget key prefix; must be unique per rendered checklist
+
+    Returns:
+        Indices of the rows ticked in the table
+    """
+    import pandas as pd
+
+    table = pd.DataFrame(list(rows))
+    table.insert(0, DONE_COLUMN, [idx in completed for idx in range(len(table))])
+    edited = st.data_editor(
+        table,
+        key=f"{key}_{_revision(completed)}",
+        hide_index=True,
+        disabled=[column for column in table.columns if column != DONE_COLUMN],
+        column_config={DONE_COLUMN: st.column_config.CheckboxColumn(DONE_COLUMN, width="small")}
+    )
+    return {int(idx) for idx in edited.index[edited[DONE_COLUMN].astype(bool)]}
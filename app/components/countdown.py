@@ -0,0 +1,78 @@
+"""Client-side countdown timer component.
+
+The countdown runs in the browser: the component receives the duration and
+the elapsed time once per script run and ticks locally. It only reports
+back to Python when the user pauses, resumes or restarts the timer, marks
+the exercise complete, the countdown passes one of its marks (e.g. the end
+of an exercise in a session timeline) or reaches zero, so a running timer
+costs a handful of reruns per exercise instead of one per second. The
+completion and mark cues are played by the browser too, from the cached
+files of ``app.components.cues``.
+"""
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from app.components.cues import cue_urls
+
+FRONTEND_DIR = Path(__file__).resolve().parent / "frontend" / "countdown"
+
+# Events reported by the browser
+TIMER_EVENTS = ("pause", "resume", "restart", "complete", "mark")
+
+TimerEventHandler = Callable[[Dict[str, Any]], None]
+
+_component = components.declare_component("countdown_timer", path=str(FRONTEND_DIR))
+
+def _dispatch(key: str, on_event: TimerEventHandler) -> None:
+    """Pass the component's latest event to ``on_event``."""
+    event = st.session_state.get(key)
+    if isinstance(event, dict) and event.get("event") in TIMER_EVENTS:
+        on_event(event)
+
+def countdown_timer(duration_seconds: float, elapsed_seconds: float, paused: bool,
+                    key: str, on_event: TimerEventHandler, run_id: Any = None,
+                    segments: Sequence[Tuple[float, str]] = (), marks: Sequence[float] = (),
+                    sound: bool = True, height: int = 150) -> Optional[Dict[str, Any]]:
+    """Render a countdown that ticks in the browser.
+
+    ``on_event`` runs as a widget callback, before the rerun the event
+    triggers, so the rerun already renders the updated timer state.
+
+    Args:
+        duration_seconds: Total timer duration
+        elapsed_seconds: Time already elapsed when this run rendered
+        paused: Whether the timer is paused
+        key: Widget key; must be unique per rendered timer
+        on_event: Called with ``{"event", "elapsed", "seq"}``, where ``event``
+            is one of ``TIMER_EVENTS`` and ``elapsed`` the browser's elapsed
+            seconds at that moment; ``"mark"`` events also carry the index
+            of the last ``mark`` passed
+        run_id: Identifies one run of the timer (e.g. its start time); the
+            browser reports completion once per run
+        segments: ``(start_seconds, label)`` pairs; the label of the current
+            segment is shown above the countdown
+        marks: Elapsed seconds at which the browser reports a ``"mark"``
+        sound: Whether the browser plays a cue at each mark and when the
+            countdown runs out
+        height: Component height in pixels
+
+    Returns:
+        The last event reported by the browser, if any
+    """
+    return _component(
+        duration=float(duration_seconds),
+        elapsed=float(max(0.0, elapsed_seconds)),
+        paused=bool(paused),
+        runId=str(run_id),
+        segments=[[float(start), str(label)] for start, label in segments],
+        marks=[float(mark) for mark in marks],
+        cues=cue_urls() if sound else {},
+        height=height,
+        key=key,
+        on_change=partial(_dispatch, key, on_event),
+        default=None
+    )
@@ -0,0 +1,49 @@
+"""Audio cues served as static component assets.
+
+The cue sounds are short WAV files (8 kHz, 8-bit mono sine chimes of a few
+kilobytes) in this component's frontend directory. Streamlit serves
+component files other than HTML with ``Cache-Control: public``, so a browser
+fetches each cue once and the cues are played client-side: the countdown
+plays them itself, and ``audio_cue`` plays one from a zero-height frame. A
+script run that triggers a cue only sends its name, never the audio.
+"""
+from pathlib import Path
+from typing import Any, Dict
+
+import streamlit.components.v1 as components
+
+FRONTEND_DIR = Path(__file__).resolve().parent / "frontend" / "cues"
+
+# Cue name -> file in FRONTEND_DIR
+CUES = {
+    "complete": "complete.wav",
+    "mark": "mark.wav"
+}
+
+_component = components.declare_component("audio_cue", path=str(FRONTEND_DIR))
+
+def cue_url(name: str) -> str:
+    """URL of a cue, relative to any component frame.
+
+    Component frames are served from ``component/<component name>/``, so
+    another component reaches this one's files through its sibling path.
+
+    Raises:
+        KeyError: If ``name`` is not one of ``CUES``
+    """
+    return f"../{_component.name}/{CUES[name]}"
+
+def cue_urls() -> Dict[str, str]:
+    """URLs of all cues, by name."""
+    return {name: cue_url(name) for name in CUES}
+
+def audio_cue(name: str, token: Any, key: str) -> None:
+    """Play a cue once in the browser.
+
+    Args:
+        name: One of ``CUES``
+        token: Identifies one occurrence (e.g. a timer's start time); the
+            frame plays the cue once per token
+        key: Widget key; must be unique per rendered cue
+    """
+    _component(file=CUES[name], token=str(token), key=key, height=0, default=None)
@@ -0,0 +1,63 @@
+"""Client-side rep counter component.
+
+Taps are counted in the browser: the component receives the targets and the
+current set and reps once per script run and counts locally. It only reports
+back to Python when a set is finished (the last rep of the set is tapped or
+the set is ended early) or the whole exercise is, so a 3x15 exercise costs
+three reruns instead of one per rep.
+"""
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from app.utils.rep_counter import REP_EVENTS
+
+FRONTEND_DIR = Path(__file__).resolve().parent / "frontend" / "rep_counter"
+
+RepEventHandler = Callable[[Dict[str, Any]], None]
+
+_component = components.declare_component("rep_counter", path=str(FRONTEND_DIR))
+
+def _dispatch(key: str, on_event: RepEventHandler) -> None:
+    """Pass the component's latest event to ``on_event``."""
+    event = st.session_state.get(key)
+    if isinstance(event, dict) and event.get("event") in REP_EVENTS:
+        on_event(event)
+
+def rep_counter(target_reps: int, target_sets: int, current_set: int, current_reps: int,
+                key: str, on_event: RepEventHandler, label: str = "",
+                height: int = 170) -> Optional[Dict[str, Any]]:
+    """Render a rep counter that counts taps in the browser.
+
+    ``on_event`` runs as a widget callback, before the rerun the event
+    triggers, so the rerun already renders the next set.
+
+    Args:
+        target_reps: Reps per set
+        target_sets: Number of sets
+        current_set: Set the counter starts at (1-based)
+        current_reps: Reps already done in ``current_set``
+        key: Widget key; must be unique per rendered counter
+        on_event: Called with ``{"event", "set", "reps", "seq"}``, where
+            ``event`` is one of ``REP_EVENTS``, ``set`` the finished set and
+            ``reps`` the reps done in it
+        label: Shown above the count, e.g. the exercise name
+        height: Component height in pixels
+
+    Returns:
+        The last event reported by the browser, if any
+    """
+    return _component(
+        targetReps=int(target_reps),
+        targetSets=max(1, int(target_sets)),
+        currentSet=max(1, int(current_set)),
+        currentReps=max(0, int(current_reps)),
+        label=str(label),
+        height=height,
+        key=key,
+        on_change=partial(_dispatch, key, on_event),
+        default=None
+    )
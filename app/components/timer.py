@@ -1,72 +1,98 @@
 """Timer component for Streamlit."""
 import streamlit as st
-import time
-from datetime import datetime, timedelta
+from typing import Optional
+
+from app.components.cues import audio_cue
+from app.utils.engine import Clock, TimerEngine, TimerState
+
+# Seconds between timer refreshes; each one reruns only the timer fragment
+TICK_SECONDS = 1
+
+# Duration of the timer before ``render`` starts it
+DEFAULT_DURATION_SECONDS = 300
 
 class TimerComponent:
-    """Enhanced timer component with pause/resume and sound notification."""
+    """Enhanced timer component with pause/resume and sound notification.
+    
+    The countdown logic is ``TimerEngine``'s; this class keeps a
+    ``TimerState`` in session state and renders it.
+    """
+    
+    def __init__(self, clock: Optional[Clock] = None, key: str = "timer_component"):
+        """Initialize timer state.
+        
+        Args:
+            clock: Time source in seconds (default: ``time.time``)
+            key: Session state key holding this timer's state
+        """
+        self.engine = TimerEngine(clock) if clock else TimerEngine()
+        self.key = key
+        if key not in st.session_state:
+            st.session_state[key] = TimerState()
+    
+    @property
+    def state(self) -> TimerState:
+        """The timer's state object."""
+        return st.session_state[self.key]
     
-    def __init__(self):
-        """Initialize timer state."""
-        if 'start_time' not in st.session_state:
-            st.session_state.start_time = None
-        if 'paused_time' not in st.session_state:
-            st.session_state.paused_time = None
-        if 'is_paused' not in st.session_state:
-            st.session_state.is_paused = False
+    def start_timer(self, duration_seconds: float = DEFAULT_DURATION_SECONDS) -> None:
+        """Start the countdown."""
+        self.engine.start(self.state, duration_seconds)
     
-    def render(self, duration_seconds=300):
+    def pause_timer(self) -> None:
+        """Pause the countdown."""
+        self.engine.pause(self.state)
+    
+    def resume_timer(self) -> None:
+        """Resume the countdown."""
+        self.engine.resume(self.state)
+    
+    def restart_timer(self) -> None:
+        """Start the countdown over."""
+        self.engine.restart(self.state)
+    
+    def stop_timer(self) -> None:
+        """Stop the countdown."""
+        self.engine.stop(self.state)
+    
+    def render(self, duration_seconds=DEFAULT_DURATION_SECONDS):
         """Render the timer component.
         
         Args:
             duration_seconds: Timer duration in seconds (default: 5 minutes)
         """
-        if st.session_state.start_time is None:
-            st.session_state.start_time = datetime.now()
-            st.session_state.paused_time = None
-            st.session_state.is_paused = False
+        if not self.state.timer_active:
+            self.start_timer(duration_seconds)
+        
+        self._render_timer()
+    
+    @st.fragment(run_every=TICK_SECONDS)
+    def _render_timer(self):
+        """Render the countdown; refreshes rerun this fragment, not the page."""
+        state = self.state
+        if not state.timer_active:
+            return
         
         col1, col2 = st.columns([3, 1])
         
         with col1:
-            # Calculate elapsed time
-            if st.session_state.is_paused:
-                elapsed = st.session_state.paused_time - st.session_state.start_time
-            else:
-                elapsed = datetime.now() - st.session_state.start_time
-            
-            remaining = timedelta(seconds=duration_seconds) - elapsed
-            remaining_seconds = max(0, int(remaining.total_seconds()))
-            
-            # Display progress bar
-            progress = 1 - (remaining_seconds / duration_seconds)
-            st.progress(min(1.0, progress))
-            
-            # Display time remaining
-            mins, secs = divmod(remaining_seconds, 60)
-            st.markdown(f"**Time Remaining:** {mins:02d}:{secs:02d}")
+            # Display progress bar and time remaining
+            st.progress(self.engine.progress(state))
+            st.markdown(f"**Time Remaining:** {self.engine.display(state)}")
         
         with col2:
             # Pause/Resume button
             if st.button("⏯️ Pause/Resume"):
-                if st.session_state.is_paused:
-                    # Resume - adjust start time to account for pause duration
-                    pause_duration = datetime.now() - st.session_state.paused_time
-                    st.session_state.start_time += pause_duration
-                    st.session_state.is_paused = False
+                if state.timer_paused:
+                    self.resume_timer()
                 else:
-                    # Pause
-                    st.session_state.paused_time = datetime.now()
-                    st.session_state.is_paused = True
+                    self.pause_timer()
             
             # Reset button
             if st.button("🔄 Reset"):
-                st.session_state.start_time = datetime.now()
-                st.session_state.paused_time = None
-                st.session_state.is_paused = False
+                self.restart_timer()
         
-        # Play sound when timer completes
-        if remaining_seconds <= 0 and not st.session_state.is_paused:
+        # Play the cached completion cue when the timer completes
+        if self.engine.update(state):
             st.balloons()
-            st.audio("data:audio/wav;base64,UklGRjIAAABXQVZFZm10IBAAAAABAAEAQB8AAEAfAAABAAgAAABmYWN0BAAAAAAAAABkYXRhAAAAAA==", format='audio/wav')
-            st.session_state.start_time = None 
\ No newline at end of file
+            audio_cue("complete", token=state.timer_start, key=f"{self.key}_cue")
@@ -0,0 +1,223 @@
+"""Long-format protocol catalog.
+
+Every protocol row (mobility exercises from the phase lists in
+``app.data.health``, which the home page and mobility views show, and LLLT
+sessions from ``lllt_days_df.csv``) lives in one DataFrame indexed by a
+sorted ``(protocol, phase, session)`` MultiIndex, with repeated text columns
+stored as categoricals. Phase, session and day-type queries are index
+lookups (binary searches on the sorted index) instead of per-key dicts of
+DataFrames. Durations, sets and reps are parsed into columns as the catalog
+is built, which happens once per process and again when the data watcher
+reports a changed LLLT table.
+"""
+import threading
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.data.data_loader import DataLoader, SESSION_ORDER, normalize_session
+from app.data.health import PHASE_EXERCISES
+from app.data.watcher import data_watcher
+from app.utils.duration import Prescription, parse_prescription
+
+CATALOG_DATA_DIR = Path(__file__).resolve().parent
+INDEX_LEVELS = ("protocol", "phase", "session")
+
+# Sessions in daily order; LLLT adds an evening session
+CATALOG_SESSIONS = SESSION_ORDER[:2] + ("evening",) + SESSION_ORDER[2:]
+
+# LLLT sessions are not phased
+UNPHASED = 0
+
+# Mobility sessions run on every day type, LLLT sessions only on LLLT days
+EVERY_DAY = "Every Day"
+LLLT_DAY_TYPE = "LLLT Days"
+
+# Mobility exercise fields stored as catalog columns
+MOBILITY_COLUMNS = {
+    "name": "Exercise",
+    "sets_reps": "Sets/Reps/Duration",
+    "equipment": "Equipment",
+    "notes": "Key Notes"
+}
+
+# LLLT columns stored under the matching mobility column
+LLLT_COLUMNS = {
+    "Body Area": "Exercise",
+    "Time": "Sets/Reps/Duration",
+    "Device Mode": "Equipment",
+    "Target": "Key Notes"
+}
+CATEGORICAL_COLUMNS = ("Equipment", "Phase", "Session", "Day Type")
+
+# Columns parsed from Sets/Reps/Duration when the catalog loads
+PRESCRIPTION_COLUMNS = {
+    "Seconds": "seconds",
+    "Sets": "sets",
+    "Reps": "reps",
+    "Sides": "sides",
+    "Set Seconds": "set_seconds"
+}
+
+def _mobility_rows(phases: Mapping[int, Mapping[str, Sequence[Mapping[str, Any]]]]) -> pd.DataFrame:
+    """Stack the phase/session exercise lists into long format."""
+    return pd.DataFrame([
+        {
+            **{column: exercise.get(field, "") for field, column in MOBILITY_COLUMNS.items()},
+            "protocol": "mobility",
+            "phase": phase,
+            "session": normalize_session(session),
+            "Day Type": EVERY_DAY
+        }
+        for phase, sessions in phases.items()
+        for session, exercises in sessions.items()
+        for exercise in exercises
+    ])
+
+def _lllt_rows(loader: DataLoader) -> pd.DataFrame:
+    """Map the LLLT sessions onto the catalog columns."""
+    try:
+        df = loader.load_lllt_data()["lllt_days"]
+    except FileNotFoundError:
+        return pd.DataFrame()
+    if df.empty:
+        return df
+    df = df.rename(columns=LLLT_COLUMNS)
+    return df.assign(protocol="lllt", phase=UNPHASED,
+                     session=df["Session"].map(normalize_session),
+                     **{"Day Type": LLLT_DAY_TYPE})
+
+def _add_prescriptions(df: pd.DataFrame) -> None:
+    """Store the parsed prescription of every row as integer columns."""
+    parsed = {text: parse_prescription(text) for text in df["Sets/Reps/Duration"].dropna().unique()}
+    empty = parse_prescription("")
+    prescriptions = [parsed.get(text, empty) for text in df["Sets/Reps/Duration"]]
+    for column, attribute in PRESCRIPTION_COLUMNS.items():
+        df[column] = np.array([getattr(p, attribute) for p in prescriptions], dtype="int64")
+
+def row_prescription(row: Mapping[str, Any]) -> Prescription:
+    """The parsed prescription stored in a catalog row."""
+    return Prescription(**{attribute: int(row[column]) for column, attribute in PRESCRIPTION_COLUMNS.items()})
+
+def _categorical(values: pd.Series, order: Sequence[str] = ()) -> pd.Categorical:
+    """Categorical with ``order`` first and any other values after it."""
+    present = [value for value in pd.unique(values.dropna()) if value not in order]
+    return pd.Categorical(values, categories=list(order) + sorted(present))
+
+class ProtocolCatalog:
+    """All protocol rows in one sorted long-format table.
+
+    Accessors return slices of ``frame``; with copy-on-write they cannot
+    modify the catalog. Besides the source columns every row carries its
+    parsed prescription (``PRESCRIPTION_COLUMNS``).
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        self._day_types: Dict[str, np.ndarray] = {
+            str(day_type): positions
+            for day_type, positions in frame.groupby("Day Type", observed=True, sort=False).indices.items()
+        } if "Day Type" in frame else {}
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def _slice(self, key: Tuple) -> pd.DataFrame:
+        """Rows whose index starts with ``key``."""
+        try:
+            start, stop = self.frame.index.slice_locs(key, key)
+        except (KeyError, TypeError):
+            start = stop = 0
+        return self.frame.iloc[start:stop]
+
+    def protocol(self, protocol: str) -> pd.DataFrame:
+        """Rows of one protocol, indexed by ``(phase, session)``."""
+        return self._slice((protocol,)).droplevel("protocol")
+
+    def phase(self, phase: int, protocol: str = "mobility") -> pd.DataFrame:
+        """Rows of one phase, indexed by session."""
+        return self._slice((protocol, phase)).droplevel(["protocol", "phase"])
+
+    def session(self, session: str, phase: int = 1, protocol: str = "mobility") -> pd.DataFrame:
+        """Rows of one session in display order, like the source table.
+
+        Args:
+            session: Session name, e.g. ``"morning"`` or ``"Pre-Bed"``
+            phase: Phase number (``UNPHASED`` for LLLT)
+            protocol: ``"mobility"`` or ``"lllt"``
+
+        Returns:
+            The session's rows with a fresh ``RangeIndex``; empty if unknown
+        """
+        return self._slice((protocol, phase, normalize_session(session))).reset_index(drop=True)
+
+    def day_type(self, day_type: str) -> pd.DataFrame:
+        """Rows scheduled on a day type, including those run every day."""
+        positions = [self._day_types.get(name) for name in (day_type, EVERY_DAY)]
+        positions = [p for p in positions if p is not None]
+        if not positions:
+            return self.frame.iloc[:0]
+        return self.frame.iloc[np.sort(np.concatenate(positions))]
+
+    def phases(self, protocol: str = "mobility") -> Tuple[int, ...]:
+        """Phase numbers of a protocol, in order."""
+        return tuple(self.protocol(protocol).index.unique(level="phase"))
+
+    def sessions(self, phase: int = 1, protocol: str = "mobility") -> Tuple[str, ...]:
+        """Session names of a phase, in daily order."""
+        return tuple(str(session) for session in self.phase(phase, protocol).index.unique())
+
+    def count(self, protocol: str) -> int:
+        """Number of rows of a protocol."""
+        return len(self.protocol(protocol))
+
+def build_catalog(data_dir: Path = CATALOG_DATA_DIR,
+                  mobility: Mapping[int, Mapping[str, Sequence[Mapping[str, Any]]]] = PHASE_EXERCISES
+                  ) -> ProtocolCatalog:
+    """Build the catalog from the mobility exercises and the LLLT table.
+
+    Args:
+        data_dir: Directory containing ``lllt_days_df.csv``
+        mobility: Exercise dicts by phase number and session
+
+    Returns:
+        Catalog sorted by ``(protocol, phase, session)``, keeping the source
+        order of each session's rows
+    """
+    loader = DataLoader(data_dir)
+    frames = [df for df in (_mobility_rows(mobility), _lllt_rows(loader)) if not df.empty]
+    if not frames:
+        empty = pd.DataFrame(columns=list(INDEX_LEVELS) + ["Exercise", "Sets/Reps/Duration"])
+        return ProtocolCatalog(empty.set_index(list(INDEX_LEVELS)))
+
+    df = pd.concat(frames, ignore_index=True)
+    _add_prescriptions(df)
+    df["protocol"] = _categorical(df["protocol"], ("lllt", "mobility"))
+    df["phase"] = df["phase"].astype("int64")
+    df["session"] = _categorical(df["session"], CATALOG_SESSIONS)
+    for column in CATEGORICAL_COLUMNS:
+        if column in df:
+            df[column] = df[column].astype("category")
+
+    frame = df.set_index(list(INDEX_LEVELS)).sort_index(kind="stable")
+    return ProtocolCatalog(frame)
+
+_catalog: Optional[ProtocolCatalog] = None
+_catalog_lock = threading.Lock()
+
+def _invalidate_catalog(path: Path) -> None:
+    """Drop the catalog after the LLLT table changed."""
+    global _catalog
+    with _catalog_lock:
+        _catalog = None
+
+def get_catalog() -> ProtocolCatalog:
+    """Return the process-wide protocol catalog, building it on first use."""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            data_watcher.watch(CATALOG_DATA_DIR, _invalidate_catalog, suffixes=(".csv",))
+            _catalog = build_catalog()
+        return _catalog
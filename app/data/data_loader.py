@@ -1,10 +1,158 @@
 """Data loading utilities for the Health Protocol Dashboard."""
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator, Tuple
 import pandas as pd
 
+from app.data.watcher import data_watcher
+
+# Parsed CSVs shared by every loader (and so every Streamlit session) in the process
+CSV_CACHE_SIZE = 64
+_csv_cache: "OrderedDict[Tuple[str, int, int], pd.DataFrame]" = OrderedDict()
+_csv_cache_lock = threading.Lock()
+# Bumped whenever the watcher reports a change to a CSV file
+_csv_versions: Dict[str, int] = {}
+
+# Mobility tables on disk, e.g. phase1_prebed_df.csv
+PHASE_FILE_RE = re.compile(r"^phase(\d+)_([a-z_]+)_df\.csv$")
+SESSION_ORDER = ("morning", "lunch", "prebed")
+
+# With copy-on-write a shallow copy cannot write through to the cached frame
+_COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3
+
+def read_csv_cached(file_path: Path) -> pd.DataFrame:
+    """Read a CSV file, parsing it only when its mtime or size changed.
+    
+    Args:
+        file_path: CSV file to read
+        
+    Returns:
+        A copy of the cached DataFrame that cannot modify the cache
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    stat = file_path.stat()
+    key = (str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    
+    with _csv_cache_lock:
+        df = _csv_cache.get(key)
+        if df is not None:
+            _csv_cache.move_to_end(key)
+    
+    if df is None:
+        df = pd.read_csv(file_path)
+        with _csv_cache_lock:
+            _csv_cache[key] = df
+            # Entries for older versions of the same file are never hit again
+            for stale in [k for k in _csv_cache if k[0] == key[0] and k != key]:
+                del _csv_cache[stale]
+            while len(_csv_cache) > CSV_CACHE_SIZE:
+                _csv_cache.popitem(last=False)
+    
+    return df.copy(deep=not _COPY_ON_WRITE)
+
+def clear_csv_cache() -> None:
+    """Drop all cached CSV frames."""
+    with _csv_cache_lock:
+        _csv_cache.clear()
+
+def invalidate_csv(file_path: Path) -> None:
+    """Drop the cached frames of a changed CSV file."""
+    path = str(Path(file_path).resolve())
+    with _csv_cache_lock:
+        for stale in [k for k in _csv_cache if k[0] == path]:
+            del _csv_cache[stale]
+        _csv_versions[path] = _csv_versions.get(path, 0) + 1
+
+def csv_version(file_path: Path) -> int:
+    """Return how often a CSV file has been reported as changed."""
+    return _csv_versions.get(str(Path(file_path).resolve()), 0)
+
+def normalize_session(session: str) -> str:
+    """Normalize a session name so ``pre_bed``/``Pre-Bed`` match ``prebed`` files."""
+    return re.sub(r"[\s_-]", "", session.lower())
+
+def _session_sort_key(session: str) -> Tuple[int, str]:
+    """Sort sessions in daily order, unknown sessions last."""
+    if session in SESSION_ORDER:
+        return SESSION_ORDER.index(session), session
+    return len(SESSION_ORDER), session
+
+class LazySessionData(Mapping):
+    """Session tables of one phase, each read on first access."""
+    
+    def __init__(self, loader: "DataLoader", phase: int, sessions: Tuple[str, ...]):
+        self._loader = loader
+        self._phase = phase
+        self._sessions = sessions
+        self._frames: Dict[str, Tuple[int, pd.DataFrame]] = {}
+    
+    def __getitem__(self, session: str) -> pd.DataFrame:
+        key = normalize_session(session)
+        if key not in self._sessions:
+            raise KeyError(session)
+        version = csv_version(self._loader.phase_file(self._phase, key))
+        cached = self._frames.get(key)
+        if cached is None or cached[0] != version:
+            cached = self._frames[key] = (version, self._loader.load_phase_data(self._phase, key))
+        return cached[1]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sessions)
+    
+    def __len__(self) -> int:
+        return len(self._sessions)
+    
+    def __contains__(self, session: object) -> bool:
+        return isinstance(session, str) and normalize_session(session) in self._sessions
+    
+    def __repr__(self) -> str:
+        return f"LazySessionData(phase={self._phase}, sessions={list(self._sessions)})"
+
+class LazyMobilityData(Mapping):
+    """Mobility tables by phase key and session, discovered from ``phase*_*_df.csv`` files.
+    
+    Only the directory listing happens up front; each table is read the
+    first time it is looked up.
+    """
+    
+    def __init__(self, loader: "DataLoader"):
+        sessions: Dict[int, list] = {}
+        for file_path in loader.data_dir.glob("phase*_*_df.csv"):
+            match = PHASE_FILE_RE.match(file_path.name)
+            if match:
+                sessions.setdefault(int(match.group(1)), []).append(match.group(2))
+        
+        self._phases = {
+            f"phase{phase}": LazySessionData(loader, phase, tuple(sorted(names, key=_session_sort_key)))
+            for phase, names in sorted(sessions.items())
+        }
+    
+    def __getitem__(self, phase_key: str) -> LazySessionData:
+        return self._phases[phase_key]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._phases)
+    
+    def __len__(self) -> int:
+        return len(self._phases)
+    
+    def __repr__(self) -> str:
+        return f"LazyMobilityData({list(self._phases.values())})"
+
 class DataLoader:
-    """Data loader for protocol data."""
+    """Data loader for protocol data.
+    
+    CSV files are parsed once per process and served from a shared cache
+    keyed by path, mtime and size, so edited files are picked up on the
+    next load. The data directory is registered with the data watcher, so
+    once the app starts it, changed files are also dropped from the cache
+    and from lazily loaded mobility tables.
+    """
     
     def __init__(self, data_dir: str = "data"):
         """Initialize the data loader.
@@ -13,20 +161,25 @@ class DataLoader:
             data_dir: Directory containing the data files
         """
         self.data_dir = Path(data_dir)
+        data_watcher.watch(self.data_dir, invalidate_csv, suffixes=(".csv",))
+    
+    def phase_file(self, phase: int, session: str) -> Path:
+        """Return the CSV path of a phase and session."""
+        return self.data_dir / f"phase{phase}_{session}_df.csv"
     
     def load_phase_data(self, phase: int, session: str) -> pd.DataFrame:
         """Load data for a specific phase and session.
         
         Args:
             phase: Phase number
-            session: Session name (morning, lunch, evening)
+            session: Session name (morning, lunch, prebed)
             
         Returns:
             DataFrame containing the phase data
         """
-        file_path = self.data_dir / f"phase{phase}_{session}_df.csv"
+        file_path = self.phase_file(phase, session)
         try:
-            return pd.read_csv(file_path)
+            return read_csv_cached(file_path)
         except FileNotFoundError:
             return pd.DataFrame()
     
@@ -38,30 +191,18 @@ class DataLoader:
         """
         file_path = self.data_dir / "supplements_df.csv"
         try:
-            return pd.read_csv(file_path)
+            return read_csv_cached(file_path)
         except FileNotFoundError:
             return pd.DataFrame()
     
-    def load_all_mobility_data(self) -> Dict[str, Dict[str, pd.DataFrame]]:
+    def load_all_mobility_data(self) -> LazyMobilityData:
         """Load all mobility protocol data.
         
         Returns:
-            Dictionary containing all mobility data organized by phase and session
+            Mapping of phase key to a mapping of session to DataFrame; tables
+            are read on first access
         """
-        data = {}
-        phases = [1]  # Currently only phase 1
-        sessions = ["morning", "lunch", "evening"]
-        
-        for phase in phases:
-            phase_key = f"phase{phase}"
-            data[phase_key] = {}
-            
-            for session in sessions:
-                df = self.load_phase_data(phase, session)
-                if not df.empty:
-                    data[phase_key][session] = df
-        
-        return data
+        return LazyMobilityData(self)
     
     def load_lllt_data(self) -> Dict[str, pd.DataFrame]:
         """Load LLLT protocol data.
@@ -79,7 +220,7 @@ class DataLoader:
         for key, filename in data_files.items():
             file_path = self.data_dir / filename
             try:
-                data[key] = pd.read_csv(file_path)
+                data[key] = read_csv_cached(file_path)
             except FileNotFoundError:
                 data[key] = pd.DataFrame()
         
@@ -0,0 +1,179 @@
+"""Global exercise index across all mobility phases and sessions.
+
+The index is built once per process from the mobility rows of the protocol
+catalog and maps a normalized exercise name (or its ID, which is the same slug) to a
+single record with the phases and sessions it appears in, its parsed
+duration in each of them and its demonstration, if any. It is rebuilt
+whenever the catalog is.
+"""
+import re
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+from app.data.catalog import ProtocolCatalog, get_catalog
+
+# Timer duration of exercises whose prescription has no duration or reps
+DEFAULT_DURATION_SECONDS = 60
+
+# Movement demonstrations by exercise name
+MOVEMENT_DEMOS = {
+    "Dynamic Cat-Cow": {
+        "youtube": "https://www.youtube.com/watch?v=kqnua4rHVVA",
+        "how_to": [
+            "Start on hands and knees in tabletop position",
+            "Inhale: Drop belly, lift chest and tailbone (Cow)",
+            "Exhale: Round spine, tuck chin and tailbone (Cat)",
+            "Flow smoothly between positions",
+            "Keep movements synchronized with breath"
+        ]
+    },
+    "90/90 Hip Switch": {
+        "youtube": "https://www.youtube.com/watch?v=nLuvQCTPrcY",
+        "how_to": [
+            "Sit with one leg bent 90° in front, other leg 90° to side",
+            "Keep back straight and core engaged",
+            "Lift hips and switch leg positions smoothly",
+            "Control the movement throughout",
+            "Keep feet flexed to protect knees"
+        ]
+    },
+    "Sun Salutation A": {
+        "youtube": "https://www.youtube.com/watch?v=8AakYeM_iRQ",
+        "how_to": [
+            "Start in Mountain Pose (Tadasana)",
+            "Flow through sequence: Forward Fold → Plank → Chaturanga",
+            "Upward Dog → Downward Dog → Forward Fold",
+            "Return to Mountain Pose",
+            "Coordinate movement with breath"
+        ]
+    }
+    # Add more exercises as needed
+}
+
+@lru_cache(maxsize=1024)
+def exercise_id(name: str) -> str:
+    """Normalize an exercise name to its ID, e.g. ``"Dynamic Cat-Cow"`` -> ``"dynamic-cat-cow"``."""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+def exercise_name(exercise: Union[str, Mapping[str, Any], None]) -> str:
+    """Return the name of an exercise given as a name or a row/dict."""
+    if isinstance(exercise, Mapping):
+        return str(exercise.get('Exercise', exercise.get('name', '')) or '')
+    return exercise or ''
+
+@dataclass(frozen=True)
+class ExerciseRecord:
+    """One exercise across every phase and session it appears in."""
+    id: str
+    name: str
+    occurrences: Tuple[Tuple[int, str], ...]
+    sets_reps: str
+    equipment: str
+    notes: str
+    duration_seconds: int
+    demo: Optional[Mapping[str, Any]] = None
+    durations: Mapping[Tuple[int, str], int] = field(default_factory=lambda: MappingProxyType({}))
+
+    @property
+    def phases(self) -> Tuple[int, ...]:
+        """Phases containing the exercise, in order."""
+        return tuple(sorted({phase for phase, _ in self.occurrences}))
+
+    @property
+    def sessions(self) -> Tuple[str, ...]:
+        """Sessions containing the exercise, in order of first appearance."""
+        return tuple(dict.fromkeys(session for _, session in self.occurrences))
+
+    def duration_for(self, phase: int, session: str) -> int:
+        """Duration in one phase and session; ``duration_seconds`` if it is not there."""
+        return self.durations.get((phase, session), self.duration_seconds)
+
+class ExerciseIndex(Mapping):
+    """Read-only mapping of exercise ID to ``ExerciseRecord``."""
+
+    def __init__(self, records: Dict[str, ExerciseRecord], demos: Mapping[str, Mapping[str, Any]]):
+        self._records = MappingProxyType(records)
+        self._demos = MappingProxyType({exercise_id(name): demo for name, demo in demos.items()})
+
+    def __getitem__(self, key: str) -> ExerciseRecord:
+        return self._records[exercise_id(key)]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and exercise_id(key) in self._records
+
+    def find(self, exercise: Union[str, Mapping[str, Any], None]) -> Optional[ExerciseRecord]:
+        """Resolve an exercise name, ID or row to its record."""
+        return self._records.get(exercise_id(exercise_name(exercise)))
+
+    def canonical_name(self, exercise: Union[str, Mapping[str, Any], None]) -> str:
+        """Return the indexed name of an exercise, or its own name if unknown."""
+        name = exercise_name(exercise)
+        record = self._records.get(exercise_id(name))
+        return record.name if record else name.strip()
+
+    def demo(self, exercise: Union[str, Mapping[str, Any], None]) -> Optional[Mapping[str, Any]]:
+        """Return the demonstration of an exercise, indexed or not."""
+        return self._demos.get(exercise_id(exercise_name(exercise)))
+
+def build_exercise_index(catalog: ProtocolCatalog,
+                         demos: Mapping[str, Mapping[str, Any]] = MOVEMENT_DEMOS) -> ExerciseIndex:
+    """Build the exercise index from the catalog's mobility rows.
+
+    Args:
+        catalog: Protocol catalog
+        demos: Demonstrations by exercise name
+
+    Returns:
+        Index keyed by exercise ID; details and ``duration_seconds`` come
+        from the first occurrence, ``durations`` from every occurrence
+    """
+    demo_by_id = {exercise_id(name): demo for name, demo in demos.items()}
+    rows: Dict[str, List[Tuple[int, str, Dict[str, Any]]]] = {}
+    mobility = catalog.protocol("mobility")
+    for (phase, session), row in zip(mobility.index, mobility.astype(object).fillna('').to_dict('records')):
+        name = str(row.get('Exercise', '')).strip()
+        if name:
+            rows.setdefault(exercise_id(name), []).append((int(phase), str(session), row))
+
+    records = {}
+    for key, occurrences in rows.items():
+        _, _, first = occurrences[0]
+        sets_reps = str(first.get('Sets/Reps/Duration', ''))
+        durations = {}
+        for phase, session, row in occurrences:
+            durations.setdefault((phase, session), int(row.get('Seconds') or DEFAULT_DURATION_SECONDS))
+        records[key] = ExerciseRecord(
+            id=key,
+            name=str(first['Exercise']).strip(),
+            occurrences=tuple((phase, session) for phase, session, _ in occurrences),
+            sets_reps=sets_reps,
+            equipment=str(first.get('Equipment', '')),
+            notes=str(first.get('Key Notes', '')),
+            duration_seconds=int(first.get('Seconds') or DEFAULT_DURATION_SECONDS),
+            demo=demo_by_id.get(key),
+            durations=MappingProxyType(durations)
+        )
+    return ExerciseIndex(records, demos)
+
+_index: Optional[ExerciseIndex] = None
+_index_catalog: Optional[ProtocolCatalog] = None
+_index_lock = threading.Lock()
+
+def get_exercise_index() -> ExerciseIndex:
+    """Return the process-wide exercise index of the current catalog."""
+    global _index, _index_catalog
+    catalog = get_catalog()
+    with _index_lock:
+        if _index is None or _index_catalog is not catalog:
+            _index = build_exercise_index(catalog)
+            _index_catalog = catalog
+        return _index
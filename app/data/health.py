@@ -1,5 +1,4 @@
 #!/usr/bin/env python3
-import pandas as pd
 import os
 from pathlib import Path
 import shutil
@@ -7,7 +6,15 @@ from datetime import datetime
 import json
 import hashlib
 import sys
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Any, Mapping, Tuple
+
+from data.frozen import freeze
+
+def _pd():
+    """Import pandas on first use; only the DataFrame builders need it."""
+    import pandas as pd
+    return pd
 
 class HealthDataProcessor:
     def __init__(self, output_dir=None):
@@ -56,7 +63,7 @@ class HealthDataProcessor:
 
     def _calculate_checksum(self, df):
         """Calculate checksum of DataFrame for integrity verification."""
-        return hashlib.md5(pd.util.hash_pandas_object(df).values).hexdigest()
+        return hashlib.md5(_pd().util.hash_pandas_object(df).values).hexdigest()
 
     def _archive_old_version(self, file_path):
         """Archive the old version of a file if it exists."""
@@ -112,7 +119,7 @@ class HealthDataProcessor:
             should_save = True
             if file_path.exists():
                 try:
-                    existing_df = pd.read_csv(file_path)
+                    existing_df = _pd().read_csv(file_path)
                     existing_checksum = self._calculate_checksum(existing_df)
                     if existing_checksum == checksum:
                         print(f"No changes detected in {name}, skipping save")
@@ -198,12 +205,12 @@ class HealthDataProcessor:
                     "Session": "Morning"
                 }
             ]
-            df = pd.DataFrame(data)
+            df = _pd().DataFrame(data)
             self._validate_dataframe(df, ["Exercise", "Sets/Reps/Duration", "Equipment", "Key Notes", "Phase", "Session"], "phase1_morning")
             return df
         except Exception as e:
             print(f"Error creating Phase 1 Morning DataFrame: {e}")
-            return pd.DataFrame()
+            return _pd().DataFrame()
 
     def create_phase1_lunch_df(self):
         """Create Phase 1 (Months 1-6) Lunch Mobility DataFrame."""
@@ -234,12 +241,12 @@ class HealthDataProcessor:
                     "Session": "Lunch"
                 }
             ]
-            df = pd.DataFrame(data)
+            df = _pd().DataFrame(data)
             self._validate_dataframe(df, ["Exercise", "Sets/Reps/Duration", "Equipment", "Key Notes", "Phase", "Session"], "phase1_lunch")
             return df
         except Exception as e:
             print(f"Error creating Phase 1 Lunch DataFrame: {e}")
-            return pd.DataFrame()
+            return _pd().DataFrame()
 
     def create_phase1_prebed_df(self):
         """Create Phase 1 (Months 1-6) Pre-Bed Mobility DataFrame."""
@@ -262,12 +269,12 @@ class HealthDataProcessor:
                     "Session": "Pre-Bed"
                 }
             ]
-            df = pd.DataFrame(data)
+            df = _pd().DataFrame(data)
             self._validate_dataframe(df, ["Exercise", "Sets/Reps/Duration", "Equipment", "Key Notes", "Phase", "Session"], "phase1_prebed")
             return df
         except Exception as e:
             print(f"Error creating Phase 1 Pre-Bed DataFrame: {e}")
-            return pd.DataFrame()
+            return _pd().DataFrame()
 
     def create_phase2_morning_df(self):
         """Create Phase 2 (Months 7-12) Morning Mobility DataFrame."""
@@ -298,12 +305,12 @@ class HealthDataProcessor:
                     "Session": "Morning"
                 }
             ]
-            df = pd.DataFrame(data)
+            df = _pd().DataFrame(data)
             self._validate_dataframe(df, ["Exercise", "Sets/Reps/Duration", "Equipment", "Key Notes", "Phase", "Session"], "phase2_morning")
             return df
         except Exception as e:
             print(f"Error creating Phase 2 Morning DataFrame: {e}")
-            return pd.DataFrame()
+            return _pd().DataFrame()
 
     def create_phase2_lunch_df(self):
         """Create Phase 2 (Months 7-12) Lunch Mobility DataFrame."""
@@ -326,12 +333,12 @@ class HealthDataProcessor:
                     "Session": "Lunch"
                 }
             ]
-            df = pd.DataFrame(data)
+            df = _pd().DataFrame(data)
             self._validate_dataframe(df, ["Exercise", "Sets/Reps/Duration", "Equipment", "Key Notes", "Phase", "Session"], "phase2_lunch")
             return df
         except Exception as e:
             print(f"Error creating Phase 2 Lunch DataFrame: {e}")
-            return pd.DataFrame()
+            return _pd().DataFrame()
 
     def create_phase2_prebed_df(self):
         """Create Phase 2 (Months 7-12) Pre-Bed Mobility DataFrame."""
@@ -354,12 +361,12 @@ class HealthDataProcessor:
                     "Session": "Pre-Bed"
                 }
             ]
-            df = pd.DataFrame(data)
+            df = _pd().DataFrame(data)
             self._validate_dataframe(df, ["Exercise", "Sets/Reps/Duration", "Equipment", "Key Notes", "Phase", "Session"], "phase2_prebed")
             return df
         except Exception as e:
             print(f"Error creating Phase 2 Pre-Bed DataFrame: {e}")
-            return pd.DataFrame()
+            return _pd().DataFrame()
 
     def create_phase3_morning_df(self):
         """Create Phase 3 (Months 13-18) Morning Mobility DataFrame."""
@@ -382,12 +389,12 @@ class HealthDataProcessor:
                     "Session": "Morning"
                 }
             ]
-            df = pd.DataFrame(data)
+            df = _pd().DataFrame(data)
             self._validate_dataframe(df, ["Exercise", "Sets/Reps/Duration", "Equipment", "Key Notes", "Phase", "Session"], "phase3_morning")
             return df
         except Exception as e:
             print(f"Error creating Phase 3 Morning DataFrame: {e}")
-            return pd.DataFrame()
+            return _pd().DataFrame()
 
     def create_phase3_lunch_df(self):
         """Create Phase 3 (Months 13-18) Lunch Mobility DataFrame."""
@@ -410,12 +417,12 @@ class HealthDataProcessor:
                     "Session": "Lunch"
                 }
             ]
-            df = pd.DataFrame(data)
+            df = _pd().DataFrame(data)
             self._validate_dataframe(df, ["Exercise", "Sets/Reps/Duration", "Equipment", "Key Notes", "Phase", "Session"], "phase3_lunch")
             return df
         except Exception as e:
             print(f"Error creating Phase 3 Lunch DataFrame: {e}")
-            return pd.DataFrame()
+            return _pd().DataFrame()
 
     def create_phase3_prebed_df(self):
         """Create Phase 3 (Months 13-18) Pre-Bed Mobility DataFrame."""
@@ -438,12 +445,12 @@ class HealthDataProcessor:
                     "Session": "Pre-Bed"
                 }
             ]
-            df = pd.DataFrame(data)
+            df = _pd().DataFrame(data)
             self._validate_dataframe(df, ["Exercise", "Sets/Reps/Duration", "Equipment", "Key Notes", "Phase", "Session"], "phase3_prebed")
             return df
         except Exception as e:
             print(f"Error creating Phase 3 Pre-Bed DataFrame: {e}")
-            return pd.DataFrame()
+            return _pd().DataFrame()
 
     def create_supplements_df(self):
         """Create Supplements DataFrame."""
@@ -471,12 +478,12 @@ class HealthDataProcessor:
                     "Notes": "Take away from other minerals"
                 }
             ]
-            df = pd.DataFrame(data)
+            df = _pd().DataFrame(data)
             self._validate_dataframe(df, ["Time", "Supplement", "Dosage", "Purpose", "Notes"], "supplements")
             return df
         except Exception as e:
             print(f"Error creating Supplements DataFrame: {e}")
-            return pd.DataFrame()
+            return _pd().DataFrame()
 
     def save_dataframes(self):
         """Save all DataFrames to CSV files."""
@@ -533,693 +540,707 @@ def get_current_session() -> str:
     else:
         return "pre_bed"
 
-def get_phase1_exercises() -> Dict[str, List[Dict[str, Any]]]:
+PHASE1_EXERCISES = freeze({
+    "morning": [
+        {
+            "name": "Dynamic Cat-Cow",
+            "sets_reps": "2 mins",
+            "equipment": "None",
+            "notes": "Mobilize the entire spine. Inhale to arch, exhale to round."
+        },
+        {
+            "name": "Dynamic Leg Swings",
+            "sets_reps": "15 reps/side",
+            "equipment": "None",
+            "notes": "Front/back and lateral swings. Prioritize controlled motion."
+        },
+        {
+            "name": "90/90 Hip Switch",
+            "sets_reps": "10 reps/side",
+            "equipment": "None",
+            "notes": "Improve internal/external hip rotation. Keep pelvis neutral."
+        },
+        {
+            "name": "Baddha Konasana (PNF)",
+            "sets_reps": "3x30s hold",
+            "equipment": "Yoga blocks",
+            "notes": "Contract hips inward for 5s, relax deeper. Critical for lotus progression."
+        },
+        {
+            "name": "Half-Lotus Prep with Band",
+            "sets_reps": "2x30s/side",
+            "equipment": "Resistance band",
+            "notes": "Gently traction foot into external rotation. Avoid knee pain."
+        },
+        {
+            "name": "Quadruped Thoracic Rotation",
+            "sets_reps": "10 reps/side",
+            "equipment": "None",
+            "notes": "Enhance spinal rotation for twists like Marichyasana. Exhale into rotation."
+        },
+        {
+            "name": "Seated Wide-Legged Forward Fold",
+            "sets_reps": "2x45s",
+            "equipment": "Yoga strap",
+            "notes": "Targets adductors for Upavistha Konasana. Keep knees bent if tight."
+        },
+        {
+            "name": "Supported Bridge Pose",
+            "sets_reps": "2x60s",
+            "equipment": "Yoga block",
+            "notes": "Passive thoracic extension for backbend prep. Block under sacrum."
+        },
+        {
+            "name": "Foam Roller IT Band Release",
+            "sets_reps": "2 mins/side",
+            "equipment": "Foam roller",
+            "notes": "Slow rolling + pauses. Avoid bony areas."
+        },
+        {
+            "name": "Dynamic Pigeon Pose",
+            "sets_reps": "8 reps/side",
+            "equipment": "None",
+            "notes": "Pulse gently to open hips. Focus on glute/hip flexor mobility."
+        },
+        {
+            "name": "Scapular Wall Slides",
+            "sets_reps": "3x10 reps",
+            "equipment": "Wall",
+            "notes": "Improve shoulder/scapular control for arm balances."
+        },
+        {
+            "name": "Supine Spinal Twist",
+            "sets_reps": "1 min/side",
+            "equipment": "None",
+            "notes": "Release lower back tension. Keep shoulders grounded."
+        }
+    ],
+    "lunch": [
+        {
+            "name": "Wall Angels",
+            "sets_reps": "3x10 reps",
+            "equipment": "Wall",
+            "notes": "Enhances scapular control and thoracic extension. Keep lower back flat."
+        },
+        {
+            "name": "Chair-Assisted Thoracic Extension",
+            "sets_reps": "2x8 reps",
+            "equipment": "Office chair",
+            "notes": "Arch upper back over chair edge. Prepares for Urdhva Dhanurasana."
+        },
+        {
+            "name": "Median Nerve Glides",
+            "sets_reps": "8–10 reps/arm",
+            "equipment": "None",
+            "notes": "Gentle nerve mobilization for thoracic/shoulder health. No pain."
+        },
+        {
+            "name": "Bent-Knee Eccentric Sliders",
+            "sets_reps": "3x10 reps/side",
+            "equipment": "Chair/sliders",
+            "notes": "Rehab for hamstring tendinopathy. Control eccentric phase."
+        },
+        {
+            "name": "Side-Lying Thoracic Opener",
+            "sets_reps": "2x45s/side",
+            "equipment": "Yoga block",
+            "notes": "Stretch chest/shoulders. Block under ribcage for support."
+        },
+        {
+            "name": "Standing Forward Fold (Bent Knee)",
+            "sets_reps": "2x60s",
+            "equipment": "Yoga strap",
+            "notes": "Safe hamstring stretch. Keep knees bent to protect tendons."
+        },
+        {
+            "name": "Kettlebell Goblet Cossack Squat",
+            "sets_reps": "2x6 reps/side",
+            "equipment": "20kg kettlebell",
+            "notes": "Loaded hip mobility for Utthita Parsvakonasana. Go slow."
+        },
+        {
+            "name": "Diaphragmatic Breathing",
+            "sets_reps": "5 mins",
+            "equipment": "None",
+            "notes": "Activates parasympathetic nervous system. Inhale 4s, exhale 6s."
+        },
+        {
+            "name": "Scapular Push-Ups",
+            "sets_reps": "3x10 reps",
+            "equipment": "None",
+            "notes": "Strengthen serratus anterior for shoulder stability."
+        },
+        {
+            "name": "Prone Cobra",
+            "sets_reps": "3x10 reps",
+            "equipment": "None",
+            "notes": "Strengthen spinal extensors. Lift chest and legs while squeezing glutes."
+        },
+        {
+            "name": "Foam Roll Thoracic Spine",
+            "sets_reps": "2 mins",
+            "equipment": "Foam roller",
+            "notes": "Roll mid-back to improve extension."
+        },
+        {
+            "name": "Child's Pose with Side Reach",
+            "sets_reps": "1 min/side",
+            "equipment": "None",
+            "notes": "Stretch lats and improve thoracic rotation."
+        }
+    ],
+    "pre_bed": [
+        {
+            "name": "Nordic Curl Negatives",
+            "sets_reps": "3x5 reps",
+            "equipment": "Resistance band",
+            "notes": "Eccentric hamstring rehab. Lower slowly (3–5s)."
+        },
+        {
+            "name": "PNF Pancake Stretch",
+            "sets_reps": "3x30s",
+            "equipment": "Yoga blocks",
+            "notes": "Contract adductors for 5s, relax deeper. Blocks under knees if needed."
+        },
+        {
+            "name": "IT Band Massage Gun Therapy",
+            "sets_reps": "2 mins/side",
+            "equipment": "Massage gun",
+            "notes": "Glide along lateral thigh. Avoid direct pressure on bone."
+        },
+        {
+            "name": "Supported Reclined Hero Pose",
+            "sets_reps": "2x60s",
+            "equipment": "Yoga chair",
+            "notes": "Stretch quads/hip flexors. Use chair for depth control."
+        },
+        {
+            "name": "Legs-Up-The-Wall + Breathing",
+            "sets_reps": "5 mins",
+            "equipment": "None",
+            "notes": "Enhances circulation and parasympathetic tone."
+        },
+        {
+            "name": "Infrared Mat Therapy",
+            "sets_reps": "10 mins",
+            "equipment": "Infrared/NIR mat",
+            "notes": "Boosts tissue healing. Focus on lower back/hips."
+        },
+        {
+            "name": "Yin Yoga Frog Pose",
+            "sets_reps": "3x90s",
+            "equipment": "Yoga blocks",
+            "notes": "Passive adductor stretch. Blocks under knees for support."
+        },
+        {
+            "name": "Supine Bound Angle",
+            "sets_reps": "5 mins",
+            "equipment": "Strap",
+            "notes": "Passive hip/internal rotation stretch. Strap around thighs for support."
+        },
+        {
+            "name": "Lacrosse Ball Glute Release",
+            "sets_reps": "2 mins/side",
+            "equipment": "Lacrosse ball",
+            "notes": "Target gluteus medius/minimus for hip stability."
+        },
+        {
+            "name": "Gentle Neck Release",
+            "sets_reps": "1 min/side",
+            "equipment": "None",
+            "notes": "Tilt head side-to-side to relieve tension."
+        },
+        {
+            "name": "Alternate Nostril Breathing",
+            "sets_reps": "5 mins",
+            "equipment": "None",
+            "notes": "Balance the nervous system and reduce stress."
+        },
+        {
+            "name": "Child's Pose",
+            "sets_reps": "2 mins",
+            "equipment": "Mat",
+            "notes": "Final relaxation. Focus on deep breathing."
+        }
+    ]
+})
+
+def get_phase1_exercises() -> Mapping[str, Tuple[Mapping[str, Any], ...]]:
     """Return Phase 1 (Months 1-6) mobility protocol data."""
-    return {
-        "morning": [
-            {
-                "name": "Dynamic Cat-Cow",
-                "sets_reps": "2 mins",
-                "equipment": "None",
-                "notes": "Mobilize the entire spine. Inhale to arch, exhale to round."
-            },
-            {
-                "name": "Dynamic Leg Swings",
-                "sets_reps": "15 reps/side",
-                "equipment": "None",
-                "notes": "Front/back and lateral swings. Prioritize controlled motion."
-            },
-            {
-                "name": "90/90 Hip Switch",
-                "sets_reps": "10 reps/side",
-                "equipment": "None",
-                "notes": "Improve internal/external hip rotation. Keep pelvis neutral."
-            },
-            {
-                "name": "Baddha Konasana (PNF)",
-                "sets_reps": "3x30s hold",
-                "equipment": "Yoga blocks",
-                "notes": "Contract hips inward for 5s, relax deeper. Critical for lotus progression."
-            },
-            {
-                "name": "Half-Lotus Prep with Band",
-                "sets_reps": "2x30s/side",
-                "equipment": "Resistance band",
-                "notes": "Gently traction foot into external rotation. Avoid knee pain."
-            },
-            {
-                "name": "Quadruped Thoracic Rotation",
-                "sets_reps": "10 reps/side",
-                "equipment": "None",
-                "notes": "Enhance spinal rotation for twists like Marichyasana. Exhale into rotation."
-            },
-            {
-                "name": "Seated Wide-Legged Forward Fold",
-                "sets_reps": "2x45s",
-                "equipment": "Yoga strap",
-                "notes": "Targets adductors for Upavistha Konasana. Keep knees bent if tight."
-            },
-            {
-                "name": "Supported Bridge Pose",
-                "sets_reps": "2x60s",
-                "equipment": "Yoga block",
-                "notes": "Passive thoracic extension for backbend prep. Block under sacrum."
-            },
-            {
-                "name": "Foam Roller IT Band Release",
-                "sets_reps": "2 mins/side",
-                "equipment": "Foam roller",
-                "notes": "Slow rolling + pauses. Avoid bony areas."
-            },
-            {
-                "name": "Dynamic Pigeon Pose",
-                "sets_reps": "8 reps/side",
-                "equipment": "None",
-                "notes": "Pulse gently to open hips. Focus on glute/hip flexor mobility."
-            },
-            {
-                "name": "Scapular Wall Slides",
-                "sets_reps": "3x10 reps",
-                "equipment": "Wall",
-                "notes": "Improve shoulder/scapular control for arm balances."
-            },
-            {
-                "name": "Supine Spinal Twist",
-                "sets_reps": "1 min/side",
-                "equipment": "None",
-                "notes": "Release lower back tension. Keep shoulders grounded."
-            }
-        ],
-        "lunch": [
-            {
-                "name": "Wall Angels",
-                "sets_reps": "3x10 reps",
-                "equipment": "Wall",
-                "notes": "Enhances scapular control and thoracic extension. Keep lower back flat."
-            },
-            {
-                "name": "Chair-Assisted Thoracic Extension",
-                "sets_reps": "2x8 reps",
-                "equipment": "Office chair",
-                "notes": "Arch upper back over chair edge. Prepares for Urdhva Dhanurasana."
-            },
-            {
-                "name": "Median Nerve Glides",
-                "sets_reps": "8–10 reps/arm",
-                "equipment": "None",
-                "notes": "Gentle nerve mobilization for thoracic/shoulder health. No pain."
-            },
-            {
-                "name": "Bent-Knee Eccentric Sliders",
-                "sets_reps": "3x10 reps/side",
-                "equipment": "Chair/sliders",
-                "notes": "Rehab for hamstring tendinopathy. Control eccentric phase."
-            },
-            {
-                "name": "Side-Lying Thoracic Opener",
-                "sets_reps": "2x45s/side",
-                "equipment": "Yoga block",
-                "notes": "Stretch chest/shoulders. Block under ribcage for support."
-            },
-            {
-                "name": "Standing Forward Fold (Bent Knee)",
-                "sets_reps": "2x60s",
-                "equipment": "Yoga strap",
-                "notes": "Safe hamstring stretch. Keep knees bent to protect tendons."
-            },
-            {
-                "name": "Kettlebell Goblet Cossack Squat",
-                "sets_reps": "2x6 reps/side",
-                "equipment": "20kg kettlebell",
-                "notes": "Loaded hip mobility for Utthita Parsvakonasana. Go slow."
-            },
-            {
-                "name": "Diaphragmatic Breathing",
-                "sets_reps": "5 mins",
-                "equipment": "None",
-                "notes": "Activates parasympathetic nervous system. Inhale 4s, exhale 6s."
-            },
-            {
-                "name": "Scapular Push-Ups",
-                "sets_reps": "3x10 reps",
-                "equipment": "None",
-                "notes": "Strengthen serratus anterior for shoulder stability."
-            },
-            {
-                "name": "Prone Cobra",
-                "sets_reps": "3x10 reps",
-                "equipment": "None",
-                "notes": "Strengthen spinal extensors. Lift chest and legs while squeezing glutes."
-            },
-            {
-                "name": "Foam Roll Thoracic Spine",
-                "sets_reps": "2 mins",
-                "equipment": "Foam roller",
-                "notes": "Roll mid-back to improve extension."
-            },
-            {
-                "name": "Child's Pose with Side Reach",
-                "sets_reps": "1 min/side",
-                "equipment": "None",
-                "notes": "Stretch lats and improve thoracic rotation."
-            }
-        ],
-        "pre_bed": [
-            {
-                "name": "Nordic Curl Negatives",
-                "sets_reps": "3x5 reps",
-                "equipment": "Resistance band",
-                "notes": "Eccentric hamstring rehab. Lower slowly (3–5s)."
-            },
-            {
-                "name": "PNF Pancake Stretch",
-                "sets_reps": "3x30s",
-                "equipment": "Yoga blocks",
-                "notes": "Contract adductors for 5s, relax deeper. Blocks under knees if needed."
-            },
-            {
-                "name": "IT Band Massage Gun Therapy",
-                "sets_reps": "2 mins/side",
-                "equipment": "Massage gun",
-                "notes": "Glide along lateral thigh. Avoid direct pressure on bone."
-            },
-            {
-                "name": "Supported Reclined Hero Pose",
-                "sets_reps": "2x60s",
-                "equipment": "Yoga chair",
-                "notes": "Stretch quads/hip flexors. Use chair for depth control."
-            },
-            {
-                "name": "Legs-Up-The-Wall + Breathing",
-                "sets_reps": "5 mins",
-                "equipment": "None",
-                "notes": "Enhances circulation and parasympathetic tone."
-            },
-            {
-                "name": "Infrared Mat Therapy",
-                "sets_reps": "10 mins",
-                "equipment": "Infrared/NIR mat",
-                "notes": "Boosts tissue healing. Focus on lower back/hips."
-            },
-            {
-                "name": "Yin Yoga Frog Pose",
-                "sets_reps": "3x90s",
-                "equipment": "Yoga blocks",
-                "notes": "Passive adductor stretch. Blocks under knees for support."
-            },
-            {
-                "name": "Supine Bound Angle",
-                "sets_reps": "5 mins",
-                "equipment": "Strap",
-                "notes": "Passive hip/internal rotation stretch. Strap around thighs for support."
-            },
-            {
-                "name": "Lacrosse Ball Glute Release",
-                "sets_reps": "2 mins/side",
-                "equipment": "Lacrosse ball",
-                "notes": "Target gluteus medius/minimus for hip stability."
-            },
-            {
-                "name": "Gentle Neck Release",
-                "sets_reps": "1 min/side",
-                "equipment": "None",
-                "notes": "Tilt head side-to-side to relieve tension."
-            },
-            {
-                "name": "Alternate Nostril Breathing",
-                "sets_reps": "5 mins",
-                "equipment": "None",
-                "notes": "Balance the nervous system and reduce stress."
-            },
-            {
-                "name": "Child's Pose",
-                "sets_reps": "2 mins",
-                "equipment": "Mat",
-                "notes": "Final relaxation. Focus on deep breathing."
-            }
-        ]
-    }
+    return PHASE1_EXERCISES
 
-def get_phase2_exercises() -> Dict[str, List[Dict[str, Any]]]:
+PHASE2_EXERCISES = freeze({
+    "morning": [
+        {
+            "name": "Sun Salutation A (Full Vinyasa)",
+            "sets_reps": "5 rounds",
+            "equipment": "None",
+            "notes": "Link breath to movement. Focus on smooth transitions."
+        },
+        {
+            "name": "Lizard Pose with PNF",
+            "sets_reps": "3x30s/side",
+            "equipment": "Yoga blocks",
+            "notes": "Contract front hip into block for 5s, relax deeper. Targets Hanumanasana prep."
+        },
+        {
+            "name": "Marichyasana C Prep (Strap-Assisted)",
+            "sets_reps": "3x30s/side",
+            "equipment": "Strap",
+            "notes": "Loop strap around foot and opposite hip to simulate bind. Rotate spine actively."
+        },
+        {
+            "name": "Kettlebell Overhead Squat Hold",
+            "sets_reps": "3x20s/side",
+            "equipment": "20kg kettlebell",
+            "notes": "Loaded shoulder/hip mobility for Utkatasana. Keep core braced."
+        },
+        {
+            "name": "Dolphin Push-Ups",
+            "sets_reps": "3x8 reps",
+            "equipment": "None",
+            "notes": "Strengthen shoulders and core for Pincha Mayurasana. Lower chest toward floor."
+        },
+        {
+            "name": "Standing Splits (Active Pulses)",
+            "sets_reps": "3x10 pulses/side",
+            "equipment": "Wall",
+            "notes": "Build hamstring strength in lengthened position. Avoid bouncing."
+        },
+        {
+            "name": "Kapotasana Prep (Wall Walk)",
+            "sets_reps": "3x5 reps",
+            "equipment": "Wall",
+            "notes": "Walk hands down wall into backbend. Tuck ribs to protect lumbar spine."
+        },
+        {
+            "name": "Dynamic Spinal Waves",
+            "sets_reps": "2 mins",
+            "equipment": "None",
+            "notes": "Flow between cat-cow and cobra for segmental spinal control."
+        },
+        {
+            "name": "PNF Pancake Stretch with Kettlebell",
+            "sets_reps": "3x30s",
+            "equipment": "20kg kettlebell",
+            "notes": "Press knees outward gently for adductor flexibility. Avoid strain."
+        },
+        {
+            "name": "Foam Roller IT Band Release",
+            "sets_reps": "2 mins/side",
+            "equipment": "Foam roller",
+            "notes": "Reduce lateral thigh stiffness. Roll slowly with pauses."
+        },
+        {
+            "name": "Scapular Wall Slides",
+            "sets_reps": "3x10 reps",
+            "equipment": "Wall",
+            "notes": "Strengthen serratus anterior for shoulder stability in arm balances."
+        },
+        {
+            "name": "Supine Leg Circles",
+            "sets_reps": "10 reps/side",
+            "equipment": "None",
+            "notes": "Improve hip joint mobility for Supta Kurmasana. Keep pelvis stable."
+        }
+    ],
+    "lunch": [
+        {
+            "name": "Camel Pose (Dynamic Pulses)",
+            "sets_reps": "3x8 reps",
+            "equipment": "None",
+            "notes": "Pulse into backbend with hands on heels. Focus on thoracic extension."
+        },
+        {
+            "name": "Scapular Push-Ups",
+            "sets_reps": "3x10 reps",
+            "equipment": "None",
+            "notes": "Strengthen serratus anterior for Bakasana and Karandavasana."
+        },
+        {
+            "name": "Bow Pose (Dhanurasana) with PNF",
+            "sets_reps": "3x20s hold",
+            "equipment": "Strap",
+            "notes": "Contract glutes/hamstrings, then deepen backbend. Use strap if needed."
+        },
+        {
+            "name": "Side Crow Prep (Koundinyasana)",
+            "sets_reps": "3x5 reps/side",
+            "equipment": "Yoga blocks",
+            "notes": "Shift weight forward onto hands, knees on blocks. Build lateral core strength."
+        },
+        {
+            "name": "Bridge Pose to Wheel (Progression)",
+            "sets_reps": "3x5 reps",
+            "equipment": "Yoga block",
+            "notes": "Lift from bridge to wheel pose. Use block under sacrum for support."
+        },
+        {
+            "name": "Forearm Stand Drills",
+            "sets_reps": "3x30s hold",
+            "equipment": "Wall",
+            "notes": "Kick up to forearm stand against wall. Engage core and shoulders."
+        },
+        {
+            "name": "Nadi Shodhana Breathwork",
+            "sets_reps": "5 mins",
+            "equipment": "None",
+            "notes": "Alternate nostril breathing to balance energy for intense backbends."
+        },
+        {
+            "name": "Thoracic Release with Lacrosse Ball",
+            "sets_reps": "2 mins",
+            "equipment": "Lacrosse ball",
+            "notes": "Target rhomboids and mid-traps. Roll slowly between shoulder blades."
+        },
+        {
+            "name": "Prone T-Spine Extension",
+            "sets_reps": "3x10 reps",
+            "equipment": "None",
+            "notes": "Lift chest and arms while squeezing scapulae. Strengthen spinal extensors."
+        },
+        {
+            "name": "Standing Quad Stretch with PNF",
+            "sets_reps": "2x30s/side",
+            "equipment": "Wall",
+            "notes": "Contract quads against wall for 5s, then relax deeper."
+        },
+        {
+            "name": "Seated Spinal Twist",
+            "sets_reps": "1 min/side",
+            "equipment": "None",
+            "notes": "Improve rotational mobility for Marichyasana D. Exhale into the twist."
+        },
+        {
+            "name": "Child's Pose with Side Reach",
+            "sets_reps": "1 min/side",
+            "equipment": "None",
+            "notes": "Stretch lats and improve thoracic rotation."
+        }
+    ],
+    "pre_bed": [
+        {
+            "name": "Yin Yoga Pigeon Pose",
+            "sets_reps": "3x90s/side",
+            "equipment": "Bolster",
+            "notes": "Passive hip opener with forward fold. Bolster under knee if needed."
+        },
+        {
+            "name": "Supported Fish Pose",
+            "sets_reps": "3x60s",
+            "equipment": "Bolster/blanket",
+            "notes": "Stretch anterior thoracic spine. Place bolster vertically under spine."
+        },
+        {
+            "name": "Eccentric Nordic Curls",
+            "sets_reps": "3x6 reps",
+            "equipment": "Resistance band",
+            "notes": "Lower over 6s, assist up. Maintain hamstring tendon resilience."
+        },
+        {
+            "name": "Adductor Ball Release",
+            "sets_reps": "2 mins/side",
+            "equipment": "Lacrosse ball",
+            "notes": "Release inner thighs for splits and leg-behind-head poses."
+        },
+        {
+            "name": "Supine Spinal Twist with Traction",
+            "sets_reps": "3x60s/side",
+            "equipment": "Strap",
+            "notes": "Use strap to gently pull knee toward floor while grounding shoulders."
+        },
+        {
+            "name": "Legs-Up-The-Wall w/ Pelvic Tilts",
+            "sets_reps": "5 mins",
+            "equipment": "None",
+            "notes": "Enhance circulation and decompress lumbar spine."
+        },
+        {
+            "name": "Infrared Mat + Guided Visualization",
+            "sets_reps": "10 mins",
+            "equipment": "Infrared/NIR mat",
+            "notes": "Pair heat therapy with mental rehearsal of complex asanas."
+        },
+        {
+            "name": "Yin Yoga Dragon Pose",
+            "sets_reps": "2x90s/side",
+            "equipment": "Yoga blocks",
+            "notes": "Deep hip flexor stretch. Blocks under hands for support."
+        },
+        {
+            "name": "Gentle Neck Release",
+            "sets_reps": "1 min/side",
+            "equipment": "None",
+            "notes": "Tilt head side-to-side to relieve tension."
+        },
+        {
+            "name": "Alternate Nostril Breathing",
+            "sets_reps": "5 mins",
+            "equipment": "None",
+            "notes": "Balance the nervous system and reduce stress."
+        },
+        {
+            "name": "Foam Roll Glutes/Hamstrings",
+            "sets_reps": "2 mins/side",
+            "equipment": "Foam roller",
+            "notes": "Roll posterior chain to release tension from weightlifting."
+        },
+        {
+            "name": "Supported Shoulderstand",
+            "sets_reps": "3x60s",
+            "equipment": "Wall",
+            "notes": "Use wall for support to decompress spine and improve circulation."
+        }
+    ]
+})
+
+def get_phase2_exercises() -> Mapping[str, Tuple[Mapping[str, Any], ...]]:
     """Return Phase 2 (Months 7-12) mobility protocol data."""
-    return {
-        "morning": [
-            {
-                "name": "Sun Salutation A (Full Vinyasa)",
-                "sets_reps": "5 rounds",
-                "equipment": "None",
-                "notes": "Link breath to movement. Focus on smooth transitions."
-            },
-            {
-                "name": "Lizard Pose with PNF",
-                "sets_reps": "3x30s/side",
-                "equipment": "Yoga blocks",
-                "notes": "Contract front hip into block for 5s, relax deeper. Targets Hanumanasana prep."
-            },
-            {
-                "name": "Marichyasana C Prep (Strap-Assisted)",
-                "sets_reps": "3x30s/side",
-                "equipment": "Strap",
-                "notes": "Loop strap around foot and opposite hip to simulate bind. Rotate spine actively."
-            },
-            {
-                "name": "Kettlebell Overhead Squat Hold",
-                "sets_reps": "3x20s/side",
-                "equipment": "20kg kettlebell",
-                "notes": "Loaded shoulder/hip mobility for Utkatasana. Keep core braced."
-            },
-            {
-                "name": "Dolphin Push-Ups",
-                "sets_reps": "3x8 reps",
-                "equipment": "None",
-                "notes": "Strengthen shoulders and core for Pincha Mayurasana. Lower chest toward floor."
-            },
-            {
-                "name": "Standing Splits (Active Pulses)",
-                "sets_reps": "3x10 pulses/side",
-                "equipment": "Wall",
-                "notes": "Build hamstring strength in lengthened position. Avoid bouncing."
-            },
-            {
-                "name": "Kapotasana Prep (Wall Walk)",
-                "sets_reps": "3x5 reps",
-                "equipment": "Wall",
-                "notes": "Walk hands down wall into backbend. Tuck ribs to protect lumbar spine."
-            },
-            {
-                "name": "Dynamic Spinal Waves",
-                "sets_reps": "2 mins",
-                "equipment": "None",
-                "notes": "Flow between cat-cow and cobra for segmental spinal control."
-            },
-            {
-                "name": "PNF Pancake Stretch with Kettlebell",
-                "sets_reps": "3x30s",
-                "equipment": "20kg kettlebell",
-                "notes": "Press knees outward gently for adductor flexibility. Avoid strain."
-            },
-            {
-                "name": "Foam Roller IT Band Release",
-                "sets_reps": "2 mins/side",
-                "equipment": "Foam roller",
-                "notes": "Reduce lateral thigh stiffness. Roll slowly with pauses."
-            },
-            {
-                "name": "Scapular Wall Slides",
-                "sets_reps": "3x10 reps",
-                "equipment": "Wall",
-                "notes": "Strengthen serratus anterior for shoulder stability in arm balances."
-            },
-            {
-                "name": "Supine Leg Circles",
-                "sets_reps": "10 reps/side",
-                "equipment": "None",
-                "notes": "Improve hip joint mobility for Supta Kurmasana. Keep pelvis stable."
-            }
-        ],
-        "lunch": [
-            {
-                "name": "Camel Pose (Dynamic Pulses)",
-                "sets_reps": "3x8 reps",
-                "equipment": "None",
-                "notes": "Pulse into backbend with hands on heels. Focus on thoracic extension."
-            },
-            {
-                "name": "Scapular Push-Ups",
-                "sets_reps": "3x10 reps",
-                "equipment": "None",
-                "notes": "Strengthen serratus anterior for Bakasana and Karandavasana."
-            },
-            {
-                "name": "Bow Pose (Dhanurasana) with PNF",
-                "sets_reps": "3x20s hold",
-                "equipment": "Strap",
-                "notes": "Contract glutes/hamstrings, then deepen backbend. Use strap if needed."
-            },
-            {
-                "name": "Side Crow Prep (Koundinyasana)",
-                "sets_reps": "3x5 reps/side",
-                "equipment": "Yoga blocks",
-                "notes": "Shift weight forward onto hands, knees on blocks. Build lateral core strength."
-            },
-            {
-                "name": "Bridge Pose to Wheel (Progression)",
-                "sets_reps": "3x5 reps",
-                "equipment": "Yoga block",
-                "notes": "Lift from bridge to wheel pose. Use block under sacrum for support."
-            },
-            {
-                "name": "Forearm Stand Drills",
-                "sets_reps": "3x30s hold",
-                "equipment": "Wall",
-                "notes": "Kick up to forearm stand against wall. Engage core and shoulders."
-            },
-            {
-                "name": "Nadi Shodhana Breathwork",
-                "sets_reps": "5 mins",
-                "equipment": "None",
-                "notes": "Alternate nostril breathing to balance energy for intense backbends."
-            },
-            {
-                "name": "Thoracic Release with Lacrosse Ball",
-                "sets_reps": "2 mins",
-                "equipment": "Lacrosse ball",
-                "notes": "Target rhomboids and mid-traps. Roll slowly between shoulder blades."
-            },
-            {
-                "name": "Prone T-Spine Extension",
-                "sets_reps": "3x10 reps",
-                "equipment": "None",
-                "notes": "Lift chest and arms while squeezing scapulae. Strengthen spinal extensors."
-            },
-            {
-                "name": "Standing Quad Stretch with PNF",
-                "sets_reps": "2x30s/side",
-                "equipment": "Wall",
-                "notes": "Contract quads against wall for 5s, then relax deeper."
-            },
-            {
-                "name": "Seated Spinal Twist",
-                "sets_reps": "1 min/side",
-                "equipment": "None",
-                "notes": "Improve rotational mobility for Marichyasana D. Exhale into the twist."
-            },
-            {
-                "name": "Child's Pose with Side Reach",
-                "sets_reps": "1 min/side",
-                "equipment": "None",
-                "notes": "Stretch lats and improve thoracic rotation."
-            }
-        ],
-        "pre_bed": [
-            {
-                "name": "Yin Yoga Pigeon Pose",
-                "sets_reps": "3x90s/side",
-                "equipment": "Bolster",
-                "notes": "Passive hip opener with forward fold. Bolster under knee if needed."
-            },
-            {
-                "name": "Supported Fish Pose",
-                "sets_reps": "3x60s",
-                "equipment": "Bolster/blanket",
-                "notes": "Stretch anterior thoracic spine. Place bolster vertically under spine."
-            },
-            {
-                "name": "Eccentric Nordic Curls",
-                "sets_reps": "3x6 reps",
-                "equipment": "Resistance band",
-                "notes": "Lower over 6s, assist up. Maintain hamstring tendon resilience."
-            },
-            {
-                "name": "Adductor Ball Release",
-                "sets_reps": "2 mins/side",
-                "equipment": "Lacrosse ball",
-                "notes": "Release inner thighs for splits and leg-behind-head poses."
-            },
-            {
-                "name": "Supine Spinal Twist with Traction",
-                "sets_reps": "3x60s/side",
-                "equipment": "Strap",
-                "notes": "Use strap to gently pull knee toward floor while grounding shoulders."
-            },
-            {
-                "name": "Legs-Up-The-Wall w/ Pelvic Tilts",
-                "sets_reps": "5 mins",
-                "equipment": "None",
-                "notes": "Enhance circulation and decompress lumbar spine."
-            },
-            {
-                "name": "Infrared Mat + Guided Visualization",
-                "sets_reps": "10 mins",
-                "equipment": "Infrared/NIR mat",
-                "notes": "Pair heat therapy with mental rehearsal of complex asanas."
-            },
-            {
-                "name": "Yin Yoga Dragon Pose",
-                "sets_reps": "2x90s/side",
-                "equipment": "Yoga blocks",
-                "notes": "Deep hip flexor stretch. Blocks under hands for support."
-            },
-            {
-                "name": "Gentle Neck Release",
-                "sets_reps": "1 min/side",
-                "equipment": "None",
-                "notes": "Tilt head side-to-side to relieve tension."
-            },
-            {
-                "name": "Alternate Nostril Breathing",
-                "sets_reps": "5 mins",
-                "equipment": "None",
-                "notes": "Balance the nervous system and reduce stress."
-            },
-            {
-                "name": "Foam Roll Glutes/Hamstrings",
-                "sets_reps": "2 mins/side",
-                "equipment": "Foam roller",
-                "notes": "Roll posterior chain to release tension from weightlifting."
-            },
-            {
-                "name": "Supported Shoulderstand",
-                "sets_reps": "3x60s",
-                "equipment": "Wall",
-                "notes": "Use wall for support to decompress spine and improve circulation."
-            }
-        ]
-    }
+    return PHASE2_EXERCISES
 
-def get_phase3_exercises() -> Dict[str, List[Dict[str, Any]]]:
+PHASE3_EXERCISES = freeze({
+    "morning": [
+        {
+            "name": "Sun Salutation B (Full Vinyasa)",
+            "sets_reps": "5 rounds",
+            "equipment": "None",
+            "notes": "Link breath to movement. Emphasize jump-backs and jump-throughs."
+        },
+        {
+            "name": "Kapotasana Prep (Resistance Bands)",
+            "sets_reps": "3x30s hold",
+            "equipment": "Resistance bands",
+            "notes": "Loop bands around thighs to engage glutes while deepening backbend. Focus on thoracic extension."
+        },
+        {
+            "name": "Dwi Pada Sirsasana Drills",
+            "sets_reps": "3x30s/side",
+            "equipment": "Yoga blocks",
+            "notes": "Elevate hips with blocks to reduce strain. Gradually work toward full pose."
+        },
+        {
+            "name": "Handstand Push-Up Negatives",
+            "sets_reps": "3x5 reps",
+            "equipment": "Wall",
+            "notes": "Lower slowly from handstand to build shoulder stability for Karandavasana."
+        },
+        {
+            "name": "Marichyasana D Strap Simulation",
+            "sets_reps": "3x30s/side",
+            "equipment": "Strap",
+            "notes": "Loop strap around foot and opposite hip to mimic bind mechanics."
+        },
+        {
+            "name": "Dynamic Spinal Waves",
+            "sets_reps": "2 mins",
+            "equipment": "None",
+            "notes": "Flow between cat-cow and cobra to enhance segmental spinal control."
+        },
+        {
+            "name": "PNF Pancake Stretch with Kettlebell",
+            "sets_reps": "3x30s",
+            "equipment": "20kg kettlebell",
+            "notes": "Gently press knees outward for adductor flexibility. Avoid strain."
+        },
+        {
+            "name": "IT Band Release + Glute Activation",
+            "sets_reps": "2 mins/side",
+            "equipment": "Foam roller/massage gun",
+            "notes": "Target TFL and glute medius to support leg-behind-head poses."
+        },
+        {
+            "name": "Scapular Wall Slides",
+            "sets_reps": "3x10 reps",
+            "equipment": "Wall",
+            "notes": "Strengthen serratus anterior for shoulder stability in arm balances."
+        },
+        {
+            "name": "Supine Leg Circles",
+            "sets_reps": "10 reps/side",
+            "equipment": "None",
+            "notes": "Improve hip joint mobility for Supta Kurmasana. Keep pelvis stable."
+        },
+        {
+            "name": "Drop-Backs with Spotter/Strap",
+            "sets_reps": "5 reps",
+            "equipment": "Strap/Wall",
+            "notes": "Transition from standing to Urdhva Dhanurasana with controlled eccentric phase."
+        },
+        {
+            "name": "L-Sit to Compass Pose",
+            "sets_reps": "3x8 reps/side",
+            "equipment": "None",
+            "notes": "Strengthen hip flexors and obliques for Parivrtta Surya Yantrasana."
+        }
+    ],
+    "lunch": [
+        {
+            "name": "Weighted Back Extensions",
+            "sets_reps": "3x10 reps",
+            "equipment": "24kg kettlebell",
+            "notes": "Hold kettlebell to chest while extending spine. Strengthen erectors for backbends."
+        },
+        {
+            "name": "Advanced Crow to Handstand",
+            "sets_reps": "3x5 reps",
+            "equipment": "Yoga blocks",
+            "notes": "Transition from Bakasana to handstand against wall. Builds explosive power."
+        },
+        {
+            "name": "Bow Pose (Dhanurasana) with PNF",
+            "sets_reps": "3x30s hold",
+            "equipment": "Strap",
+            "notes": "Contract glutes/hamstrings, then deepen backbend. Use strap if unable to reach ankles."
+        },
+        {
+            "name": "Resistance Band Rotator Cuff Drills",
+            "sets_reps": "3x15 reps/side",
+            "equipment": "Resistance band",
+            "notes": "External/internal rotations to protect shoulders in arm balances."
+        },
+        {
+            "name": "Kapalabhati Breathwork",
+            "sets_reps": "5 mins",
+            "equipment": "None",
+            "notes": "'Skull-shining breath' to energize and enhance focus for intense sequences."
+        },
+        {
+            "name": "Thoracic Release with Lacrosse Ball",
+            "sets_reps": "2 mins",
+            "equipment": "Lacrosse ball",
+            "notes": "Target rhomboids and mid-traps to maintain upper back mobility."
+        },
+        {
+            "name": "Prone T-Spine Extension",
+            "sets_reps": "3x10 reps",
+            "equipment": "None",
+            "notes": "Lift chest and arms while squeezing scapulae. Strengthen spinal extensors."
+        },
+        {
+            "name": "Standing Quad Stretch with PNF",
+            "sets_reps": "2x30s/side",
+            "equipment": "Wall",
+            "notes": "Contract quads against wall for 5s, then relax deeper."
+        },
+        {
+            "name": "Seated Spinal Twist",
+            "sets_reps": "1 min/side",
+            "equipment": "None",
+            "notes": "Improve rotational mobility for Marichyasana D. Exhale into the twist."
+        },
+        {
+            "name": "Child's Pose with Side Reach",
+            "sets_reps": "1 min/side",
+            "equipment": "None",
+            "notes": "Stretch lats and improve thoracic rotation."
+        },
+        {
+            "name": "Forearm Stand to Scorpion Prep",
+            "sets_reps": "3x30s hold",
+            "equipment": "Wall",
+            "notes": "Lift one leg toward head while in forearm stand. Engage core and shoulders."
+        },
+        {
+            "name": "Dynamic Dragon Pose",
+            "sets_reps": "8 reps/side",
+            "equipment": "None",
+            "notes": "Pulse in lunge position to open hip flexors and deepen backbend."
+        }
+    ],
+    "pre_bed": [
+        {
+            "name": "Yin Yoga Dragon Pose",
+            "sets_reps": "3x90s/side",
+            "equipment": "Bolster",
+            "notes": "Deep hip flexor stretch with forward fold. Bolster under knee if needed."
+        },
+        {
+            "name": "Supported Kapotasana",
+            "sets_reps": "3x60s",
+            "equipment": "Yoga chair",
+            "notes": "Rest forearms on chair seat to safely deepen backbend. Focus on breath."
+        },
+        {
+            "name": "Eccentric Nordic Curls",
+            "sets_reps": "3x8 reps",
+            "equipment": "Resistance band",
+            "notes": "Lower over 6s, assist up. Maintain hamstring tendon resilience."
+        },
+        {
+            "name": "Adductor Ball Release",
+            "sets_reps": "2 mins/side",
+            "equipment": "Lacrosse ball",
+            "notes": "Release inner thighs for splits and leg-behind-head poses."
+        },
+        {
+            "name": "Supine Spinal Twist with Traction",
+            "sets_reps": "3x60s/side",
+            "equipment": "Strap",
+            "notes": "Use strap to gently pull knee toward floor while grounding shoulders."
+        },
+        {
+            "name": "Legs-Up-The-Wall w/ Pelvic Tilts",
+            "sets_reps": "5 mins",
+            "equipment": "None",
+            "notes": "Enhance circulation and decompress lumbar spine."
+        },
+        {
+            "name": "Infrared Mat + Guided Visualization",
+            "sets_reps": "10 mins",
+            "equipment": "Infrared/NIR mat",
+            "notes": "Pair heat therapy with mental rehearsal of complex asanas."
+        },
+        {
+            "name": "Yin Yoga Sphinx Pose",
+            "sets_reps": "3x90s",
+            "equipment": "Bolster",
+            "notes": "Passive thoracic extension. Place bolster under forearms for support."
+        },
+        {
+            "name": "Gentle Neck Release",
+            "sets_reps": "1 min/side",
+            "equipment": "None",
+            "notes": "Tilt head side-to-side to relieve tension."
+        },
+        {
+            "name": "Alternate Nostril Breathing",
+            "sets_reps": "5 mins",
+            "equipment": "None",
+            "notes": "Balance the nervous system and reduce stress."
+        },
+        {
+            "name": "Foam Roll Glutes/Hamstrings",
+            "sets_reps": "2 mins/side",
+            "equipment": "Foam roller",
+            "notes": "Roll posterior chain to release tension from weightlifting."
+        },
+        {
+            "name": "Supported Shoulderstand",
+            "sets_reps": "3x60s",
+            "equipment": "Wall",
+            "notes": "Use wall for support to decompress spine and improve circulation."
+        }
+    ]
+})
+
+def get_phase3_exercises() -> Mapping[str, Tuple[Mapping[str, Any], ...]]:
     """Return Phase 3 (Advanced) mobility protocol data."""
-    return {
-        "morning": [
-            {
-                "name": "Sun Salutation B (Full Vinyasa)",
-                "sets_reps": "5 rounds",
-                "equipment": "None",
-                "notes": "Link breath to movement. Emphasize jump-backs and jump-throughs."
-            },
-            {
-                "name": "Kapotasana Prep (Resistance Bands)",
-                "sets_reps": "3x30s hold",
-                "equipment": "Resistance bands",
-                "notes": "Loop bands around thighs to engage glutes while deepening backbend. Focus on thoracic extension."
-            },
-            {
-                "name": "Dwi Pada Sirsasana Drills",
-                "sets_reps": "3x30s/side",
-                "equipment": "Yoga blocks",
-                "notes": "Elevate hips with blocks to reduce strain. Gradually work toward full pose."
-            },
-            {
-                "name": "Handstand Push-Up Negatives",
-                "sets_reps": "3x5 reps",
-                "equipment": "Wall",
-                "notes": "Lower slowly from handstand to build shoulder stability for Karandavasana."
-            },
-            {
-                "name": "Marichyasana D Strap Simulation",
-                "sets_reps": "3x30s/side",
-                "equipment": "Strap",
-                "notes": "Loop strap around foot and opposite hip to mimic bind mechanics."
-            },
-            {
-                "name": "Dynamic Spinal Waves",
-                "sets_reps": "2 mins",
-                "equipment": "None",
-                "notes": "Flow between cat-cow and cobra to enhance segmental spinal control."
-            },
-            {
-                "name": "PNF Pancake Stretch with Kettlebell",
-                "sets_reps": "3x30s",
-                "equipment": "20kg kettlebell",
-                "notes": "Gently press knees outward for adductor flexibility. Avoid strain."
-            },
-            {
-                "name": "IT Band Release + Glute Activation",
-                "sets_reps": "2 mins/side",
-                "equipment": "Foam roller/massage gun",
-                "notes": "Target TFL and glute medius to support leg-behind-head poses."
-            },
-            {
-                "name": "Scapular Wall Slides",
-                "sets_reps": "3x10 reps",
-                "equipment": "Wall",
-                "notes": "Strengthen serratus anterior for shoulder stability in arm balances."
-            },
-            {
-                "name": "Supine Leg Circles",
-                "sets_reps": "10 reps/side",
-                "equipment": "None",
-                "notes": "Improve hip joint mobility for Supta Kurmasana. Keep pelvis stable."
-            },
-            {
-                "name": "Drop-Backs with Spotter/Strap",
-                "sets_reps": "5 reps",
-                "equipment": "Strap/Wall",
-                "notes": "Transition from standing to Urdhva Dhanurasana with controlled eccentric phase."
-            },
-            {
-                "name": "L-Sit to Compass Pose",
-                "sets_reps": "3x8 reps/side",
-                "equipment": "None",
-                "notes": "Strengthen hip flexors and obliques for Parivrtta Surya Yantrasana."
-            }
-        ],
-        "lunch": [
-            {
-                "name": "Weighted Back Extensions",
-                "sets_reps": "3x10 reps",
-                "equipment": "24kg kettlebell",
-                "notes": "Hold kettlebell to chest while extending spine. Strengthen erectors for backbends."
-            },
-            {
-                "name": "Advanced Crow to Handstand",
-                "sets_reps": "3x5 reps",
-                "equipment": "Yoga blocks",
-                "notes": "Transition from Bakasana to handstand against wall. Builds explosive power."
-            },
-            {
-                "name": "Bow Pose (Dhanurasana) with PNF",
-                "sets_reps": "3x30s hold",
-                "equipment": "Strap",
-                "notes": "Contract glutes/hamstrings, then deepen backbend. Use strap if unable to reach ankles."
-            },
-            {
-                "name": "Resistance Band Rotator Cuff Drills",
-                "sets_reps": "3x15 reps/side",
-                "equipment": "Resistance band",
-                "notes": "External/internal rotations to protect shoulders in arm balances."
-            },
-            {
-                "name": "Kapalabhati Breathwork",
-                "sets_reps": "5 mins",
-                "equipment": "None",
-                "notes": "'Skull-shining breath' to energize and enhance focus for intense sequences."
-            },
-            {
-                "name": "Thoracic Release with Lacrosse Ball",
-                "sets_reps": "2 mins",
-                "equipment": "Lacrosse ball",
-                "notes": "Target rhomboids and mid-traps to maintain upper back mobility."
-            },
-            {
-                "name": "Prone T-Spine Extension",
-                "sets_reps": "3x10 reps",
-                "equipment": "None",
-                "notes": "Lift chest and arms while squeezing scapulae. Strengthen spinal extensors."
-            },
-            {
-                "name": "Standing Quad Stretch with PNF",
-                "sets_reps": "2x30s/side",
-                "equipment": "Wall",
-                "notes": "Contract quads against wall for 5s, then relax deeper."
-            },
-            {
-                "name": "Seated Spinal Twist",
-                "sets_reps": "1 min/side",
-                "equipment": "None",
-                "notes": "Improve rotational mobility for Marichyasana D. Exhale into the twist."
-            },
-            {
-                "name": "Child's Pose with Side Reach",
-                "sets_reps": "1 min/side",
-                "equipment": "None",
-                "notes": "Stretch lats and improve thoracic rotation."
-            },
-            {
-                "name": "Forearm Stand to Scorpion Prep",
-                "sets_reps": "3x30s hold",
-                "equipment": "Wall",
-                "notes": "Lift one leg toward head while in forearm stand. Engage core and shoulders."
-            },
-            {
-                "name": "Dynamic Dragon Pose",
-                "sets_reps": "8 reps/side",
-                "equipment": "None",
-                "notes": "Pulse in lunge position to open hip flexors and deepen backbend."
-            }
-        ],
-        "pre_bed": [
-            {
-                "name": "Yin Yoga Dragon Pose",
-                "sets_reps": "3x90s/side",
-                "equipment": "Bolster",
-                "notes": "Deep hip flexor stretch with forward fold. Bolster under knee if needed."
-            },
-            {
-                "name": "Supported Kapotasana",
-                "sets_reps": "3x60s",
-                "equipment": "Yoga chair",
-                "notes": "Rest forearms on chair seat to safely deepen backbend. Focus on breath."
-            },
-            {
-                "name": "Eccentric Nordic Curls",
-                "sets_reps": "3x8 reps",
-                "equipment": "Resistance band",
-                "notes": "Lower over 6s, assist up. Maintain hamstring tendon resilience."
-            },
-            {
-                "name": "Adductor Ball Release",
-                "sets_reps": "2 mins/side",
-                "equipment": "Lacrosse ball",
-                "notes": "Release inner thighs for splits and leg-behind-head poses."
-            },
-            {
-                "name": "Supine Spinal Twist with Traction",
-                "sets_reps": "3x60s/side",
-                "equipment": "Strap",
-                "notes": "Use strap to gently pull knee toward floor while grounding shoulders."
-            },
-            {
-                "name": "Legs-Up-The-Wall w/ Pelvic Tilts",
-                "sets_reps": "5 mins",
-                "equipment": "None",
-                "notes": "Enhance circulation and decompress lumbar spine."
-            },
-            {
-                "name": "Infrared Mat + Guided Visualization",
-                "sets_reps": "10 mins",
-                "equipment": "Infrared/NIR mat",
-                "notes": "Pair heat therapy with mental rehearsal of complex asanas."
-            },
-            {
-                "name": "Yin Yoga Sphinx Pose",
-                "sets_reps": "3x90s",
-                "equipment": "Bolster",
-                "notes": "Passive thoracic extension. Place bolster under forearms for support."
-            },
-            {
-                "name": "Gentle Neck Release",
-                "sets_reps": "1 min/side",
-                "equipment": "None",
-                "notes": "Tilt head side-to-side to relieve tension."
-            },
-            {
-                "name": "Alternate Nostril Breathing",
-                "sets_reps": "5 mins",
-                "equipment": "None",
-                "notes": "Balance the nervous system and reduce stress."
-            },
-            {
-                "name": "Foam Roll Glutes/Hamstrings",
-                "sets_reps": "2 mins/side",
-                "equipment": "Foam roller",
-                "notes": "Roll posterior chain to release tension from weightlifting."
-            },
-            {
-                "name": "Supported Shoulderstand",
-                "sets_reps": "3x60s",
-                "equipment": "Wall",
-                "notes": "Use wall for support to decompress spine and improve circulation."
-            }
-        ]
-    }
+    return PHASE3_EXERCISES
 
-def get_current_exercises() -> List[Dict[str, Any]]:
-    """Get exercises for current phase and session."""
-    phase = get_current_phase()
-    session = get_current_session()
-    
-    # Get exercises based on phase
+# Mobility exercises by phase number; the protocol catalog is built from these
+PHASE_EXERCISES = freeze({
+    1: PHASE1_EXERCISES,
+    2: PHASE2_EXERCISES,
+    3: PHASE3_EXERCISES
+})
+
+def phase_number(phase: str) -> int:
+    """Number of a phase name such as ``"Phase 1"``."""
+    return int(phase.split()[-1])
+
+@lru_cache(maxsize=None)
+def get_phase_exercises(phase: str, session: str) -> Tuple[Mapping[str, Any], ...]:
+    """Get exercises for a phase and session (memoized, read-only)."""
     if phase == "Phase 1":
         exercises = get_phase1_exercises()
     elif phase == "Phase 2":
@@ -1227,7 +1248,11 @@ def get_current_exercises() -> List[Dict[str, Any]]:
     else:
         exercises = get_phase3_exercises()
     
-    return exercises.get(session, [])
+    return exercises.get(session, ())
+
+def get_current_exercises() -> Tuple[Mapping[str, Any], ...]:
+    """Get exercises for current phase and session."""
+    return get_phase_exercises(get_current_phase(), get_current_session())
 
 def main():
     """Process health data and save to CSV files."""
@@ -7,6 +7,20 @@ import json
 import sys
 import subprocess
 import os
+import argparse
+
+if __package__ in (None, ""):
+    # Run as a script: make the repo's top-level data package importable
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from data.html_postprocess import REPORT_FILENAME, format_size_report, postprocess_pages
+from data.search_index import build_search_index, search_box_html, write_search_index
+
+SESSIONS = [
+    ("Morning", "morning"),
+    ("Lunch", "lunch"),
+    ("Pre-Bed", "prebed")
+]
 
 class ProtocolHTMLGenerator:
     def __init__(self, data_dir=None, output_dir=None):
@@ -21,6 +35,9 @@ class ProtocolHTMLGenerator:
         print(f"Data directory: {self.data_dir}")
         print(f"Output directory: {self.output_dir}")
         
+        # Per-page sizes of the last post-processed build
+        self.size_report = []
+        
         # Create necessary directories
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
@@ -332,10 +349,6 @@ class ProtocolHTMLGenerator:
 
     def generate_phase_protocol(self, phase_number, phase_name):
         """Generate HTML for a specific phase's mobility protocol."""
-        morning_df = getattr(self, f"phase{phase_number}_morning_df")
-        lunch_df = getattr(self, f"phase{phase_number}_lunch_df")
-        prebed_df = getattr(self, f"phase{phase_number}_prebed_df")
-        
         content = f"""
         <h1>Phase {phase_number} - {phase_name} Protocol</h1>
         <div class="phase-header">
@@ -343,13 +356,10 @@ class ProtocolHTMLGenerator:
         </div>
         """
         
-        for session_name, df in [
-            ("Morning", morning_df),
-            ("Lunch", lunch_df),
-            ("Pre-Bed", prebed_df)
-        ]:
+        for session_name, session_key in SESSIONS:
+            df = getattr(self, f"phase{phase_number}_{session_key}_df")
             equipment_needed = sorted(list(set(
-                equipment for equipment in df["Equipment"].unique()
+                equipment for equipment in df["Equipment"].dropna().unique()
                 if equipment != "None"
             )))
             
@@ -369,7 +379,7 @@ class ProtocolHTMLGenerator:
             
             for idx, exercise in df.iterrows():
                 content += f"""
-                <div class="exercise-card">
+                <div class="exercise-card" id="{session_key}-{idx + 1}">
                     <h4>{idx + 1}. {exercise['Exercise']}</h4>
                     <table>
                         <tr>
@@ -451,8 +461,29 @@ class ProtocolHTMLGenerator:
         
         return output_file
 
-    def generate_all_protocols(self):
-        """Generate all protocol HTML files."""
+    def _search_records(self, phases):
+        """Collect one search record per exercise card of the phase pages."""
+        records = []
+        for phase_number, phase_name in phases:
+            for session_name, session_key in SESSIONS:
+                df = getattr(self, f"phase{phase_number}_{session_key}_df")
+                for idx, exercise in enumerate(df.to_dict("records")):
+                    records.append({
+                        "name": exercise["Exercise"],
+                        "label": f"Phase {phase_number} - {phase_name} / {session_name}",
+                        "href": f"phase{phase_number}_protocol.html#{session_key}-{idx + 1}",
+                        "equipment": exercise["Equipment"],
+                        "notes": exercise["Key Notes"]
+                    })
+        return records
+
+    def generate_all_protocols(self, minify=False, compress=False):
+        """Generate all protocol HTML files.
+        
+        Args:
+            minify: Minify the generated pages in place
+            compress: Write a .gz sibling next to every page
+        """
         generated_files = []
         
         # Generate phase protocols
@@ -470,10 +501,17 @@ class ProtocolHTMLGenerator:
         file = self.generate_supplements_protocol()
         generated_files.append(str(file))
         
+        # Write the search index used by the index page
+        search_index = build_search_index(self._search_records(phases))
+        index_script = write_search_index(search_index, self.output_dir)
+        generated_files.append(str(self.output_dir / index_script))
+        
         # Create index page
         index_content = """
         <h1>Health Protocols Index</h1>
-        
+        """
+        index_content += search_box_html(index_script)
+        index_content += """
         <div class="nav-links">
         """
         
@@ -497,21 +535,38 @@ class ProtocolHTMLGenerator:
         
         generated_files.append(str(index_file))
         
+        if minify or compress:
+            self.size_report = postprocess_pages(
+                generated_files,
+                minify=minify,
+                compress=compress,
+                report_path=str(self.output_dir / REPORT_FILENAME)
+            )
+        
         return generated_files
 
 def main():
     """Generate all protocol HTML files."""
+    parser = argparse.ArgumentParser(description="Generate protocol HTML files.")
+    parser.add_argument("--minify", action="store_true", help="Minify the generated pages")
+    parser.add_argument("--gzip", action="store_true", help="Write precompressed .gz siblings")
+    args = parser.parse_args()
+    
     try:
         print("Initializing Protocol HTML Generator...")
         generator = ProtocolHTMLGenerator()
         
         print("Generating protocol files...")
-        files = generator.generate_all_protocols()
+        files = generator.generate_all_protocols(minify=args.minify, compress=args.gzip)
         
         print("\nSuccessfully generated protocol files:")
         for file in files:
             print(f"- {file}")
         
+        if args.minify or args.gzip:
+            print("\nSize report:")
+            print(format_size_report(generator.size_report))
+        
         print("\nYou can now open index.html in your browser to view all protocols.")
         
     except Exception as e:
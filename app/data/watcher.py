@@ -0,0 +1,131 @@
+"""Filesystem watching for cached protocol data.
+
+Caches register the directories their data comes from together with an
+invalidation callback. A single watchdog observer per process reports
+changed files, and only the callbacks registered for that directory (and
+file type) run, so untouched data stays cached.
+
+Registering does not start a thread: the app entry points call
+``data_watcher.start()``, so importing or constructing loaders (in tests,
+scripts or notebooks) never starts an observer.
+"""
+import logging
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+
+logger = logging.getLogger(__name__)
+
+ChangeCallback = Callable[[Path], None]
+
+class _ChangeHandler(FileSystemEventHandler):
+    """Forward file events to the watcher."""
+
+    def __init__(self, watcher: "DataWatcher"):
+        self._watcher = watcher
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        if event.is_directory or event.event_type not in ("created", "modified", "deleted", "moved"):
+            return
+        self._watcher.notify(Path(event.src_path))
+        dest_path = getattr(event, "dest_path", "")
+        if dest_path:
+            self._watcher.notify(Path(dest_path))
+
+class DataWatcher:
+    """Run invalidation callbacks when files in watched directories change."""
+
+    def __init__(self):
+        self._callbacks: Dict[Path, List[Tuple[Optional[Tuple[str, ...]], ChangeCallback]]] = {}
+        self._observer: Optional[Observer] = None
+        self._lock = threading.Lock()
+
+    def watch(self, directory: Path, callback: ChangeCallback,
+              suffixes: Optional[Iterable[str]] = None) -> bool:
+        """Call ``callback`` with the path of every changed file in ``directory``.
+
+        Registering the same callback twice for a directory has no effect.
+        Changes are only reported once the watcher is started.
+
+        Args:
+            directory: Directory to watch (not recursive)
+            callback: Invalidation callback taking the changed path
+            suffixes: Only report files with these suffixes, e.g. ``(".csv",)``
+
+        Returns:
+            True if the callback is registered, False if the directory does
+            not exist or could not be watched
+        """
+        directory = Path(directory).resolve()
+        if not directory.is_dir():
+            return False
+        suffixes = tuple(s.lower() for s in suffixes) if suffixes is not None else None
+
+        with self._lock:
+            entries = self._callbacks.get(directory)
+            if entries is None:
+                if self._observer is not None and not self._schedule(directory):
+                    return False
+                entries = self._callbacks[directory] = []
+            if (suffixes, callback) not in entries:
+                entries.append((suffixes, callback))
+        return True
+
+    def start(self) -> None:
+        """Start the observer and watch every registered directory.
+
+        Safe to call on every script run; only the first call starts a thread.
+        """
+        with self._lock:
+            if self._observer is not None:
+                return
+            observer = Observer()
+            observer.daemon = True
+            observer.start()
+            self._observer = observer
+            for directory in list(self._callbacks):
+                if not self._schedule(directory):
+                    del self._callbacks[directory]
+
+    @property
+    def running(self) -> bool:
+        """Whether the observer has been started."""
+        return self._observer is not None
+
+    def notify(self, path: Path) -> None:
+        """Run the callbacks registered for the directory of ``path``."""
+        path = Path(path)
+        with self._lock:
+            entries = list(self._callbacks.get(path.parent.resolve(), ()))
+
+        for suffixes, callback in entries:
+            if suffixes is not None and path.suffix.lower() not in suffixes:
+                continue
+            try:
+                callback(path)
+            except Exception:
+                logger.exception("Cache invalidation failed for %s", path)
+
+    def stop(self) -> None:
+        """Stop the observer and forget all registrations."""
+        with self._lock:
+            observer, self._observer = self._observer, None
+            self._callbacks.clear()
+        if observer is not None:
+            observer.stop()
+            observer.join()
+
+    def _schedule(self, directory: Path) -> bool:
+        """Watch ``directory`` with the running observer; returns whether it could."""
+        try:
+            self._observer.schedule(_ChangeHandler(self), str(directory), recursive=False)
+        except OSError as e:
+            logger.warning("Cannot watch %s, cached data will not refresh: %s", directory, e)
+            return False
+        return True
+
+# One observer thread per process
+data_watcher = DataWatcher()
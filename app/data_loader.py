@@ -1,5 +1,7 @@
 """Unified data loading interface for both app and notebook use."""
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable
+import threading
+import time
 import pandas as pd
 from datetime import datetime
 
@@ -11,9 +13,7 @@ from data.lllt_data import (
 )
 from data.mobility_data import (
     get_mobility_phases,
-    get_phase_by_key,
-    get_progress_metrics as get_mobility_metrics,
-    PHASE_KEYS
+    get_progress_metrics as get_mobility_metrics
 )
 from app.utils.validation import DataValidator
 
@@ -24,11 +24,32 @@ PHASE_NAMES = {
     "phase3": "advanced_mastery"
 }
 
+# Default time-to-live of cached datasets in seconds
+DEFAULT_CACHE_DURATION = 300
+
 class DataLoader:
-    """Unified data loader for the application."""
+    """Unified data loader for the application.
+    
+    Each dataset is cached separately for ``cache_duration`` seconds, so
+    repeated lookups reuse the loaded dicts and DataFrames instead of
+    rebuilding them. Cached values are shared between callers and must not
+    be mutated.
+    """
+    
+    def __init__(self, cache_duration: Optional[int] = DEFAULT_CACHE_DURATION):
+        self._initialize()
+        self.cache_duration = cache_duration
     
     def load_lllt_data(self) -> Dict[str, Any]:
-        """Load LLLT protocol data."""
+        """Load LLLT protocol data (cached)."""
+        return self._get_cached("lllt", self._build_lllt_data)
+    
+    def load_mobility_data(self) -> Dict[str, Any]:
+        """Load mobility protocol data (cached)."""
+        return self._get_cached("mobility", self._build_mobility_data)
+    
+    def _build_lllt_data(self) -> Dict[str, Any]:
+        """Build LLLT protocol data."""
         daily_schedule = {
             "Upper Back": [
                 {
@@ -88,8 +109,8 @@ class DataLoader:
             "last_updated": datetime.now().isoformat()
         }
     
-    def load_mobility_data(self) -> Dict[str, Any]:
-        """Load mobility protocol data."""
+    def _build_mobility_data(self) -> Dict[str, Any]:
+        """Build mobility protocol data."""
         exercises = {
             "Phase 1": [
                 {
@@ -152,16 +173,26 @@ class DataLoader:
         return PHASE_NAMES.copy()
     
     @property
-    def cache_duration(self) -> int:
-        """Get cache duration in seconds."""
-        return 300  # Assuming a default cache duration
+    def cache_duration(self) -> Optional[int]:
+        """Get cache duration in seconds (None: cached until cleared)."""
+        return self._cache_duration
     
     @cache_duration.setter
-    def cache_duration(self, seconds: int) -> None:
-        """Set cache duration in seconds."""
-        if seconds < 0:
+    def cache_duration(self, seconds: Optional[int]) -> None:
+        """Set cache duration in seconds, or None to cache until cleared."""
+        if seconds is not None and seconds < 0:
             raise ValueError("Cache duration must be non-negative")
-        # Implementation of setting cache duration
+        self._cache_duration = seconds
+    
+    @property
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get cache hit and miss counts per dataset."""
+        with self._lock:
+            datasets = set(self._hits) | set(self._misses)
+            return {
+                dataset: {"hits": self._hits.get(dataset, 0), "misses": self._misses.get(dataset, 0)}
+                for dataset in sorted(datasets)
+            }
     
     def _validate_and_transform_lllt_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate and transform LLLT data."""
@@ -210,25 +241,44 @@ class DataLoader:
     
     def _initialize(self):
         """Initialize data loader state."""
-        self._lllt_data = None
-        self._mobility_data = None
-        self._last_load = None
+        self._cache_duration = DEFAULT_CACHE_DURATION
+        self._cache: Dict[str, Any] = {}
+        self._last_load: Dict[str, float] = {}
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+        self._lock = threading.RLock()
     
-    def _should_reload(self) -> bool:
-        """Check if data should be reloaded based on cache duration."""
-        if self._last_load is None:
+    def _get_cached(self, dataset: str, build: Callable[[], Any]) -> Any:
+        """Return cached data for a dataset, rebuilding it once expired."""
+        with self._lock:
+            if not self._should_reload(dataset):
+                self._hits[dataset] = self._hits.get(dataset, 0) + 1
+                return self._cache[dataset]
+            self._misses[dataset] = self._misses.get(dataset, 0) + 1
+            data = build()
+            self._update_cache(dataset, data)
+            return data
+    
+    def _should_reload(self, dataset: str) -> bool:
+        """Check if a dataset should be reloaded based on cache duration."""
+        last_load = self._last_load.get(dataset)
+        if last_load is None:
             return True
-        elapsed = (datetime.now() - self._last_load).total_seconds()
-        return elapsed > self.cache_duration
-    
-    def _update_cache(self, data: Dict[str, Any]) -> None:
-        """Update the cache with new data."""
-        self._lllt_data = data
-        self._mobility_data = data
-        self._last_load = datetime.now()
-    
-    def clear_cache(self) -> None:
-        """Clear all cached data."""
-        self._lllt_data = None
-        self._mobility_data = None
-        self._last_load = None 
\ No newline at end of file
+        if self.cache_duration is None:
+            return False
+        return time.monotonic() - last_load >= self.cache_duration
+    
+    def _update_cache(self, dataset: str, data: Any) -> None:
+        """Update the cache for a dataset with new data."""
+        self._cache[dataset] = data
+        self._last_load[dataset] = time.monotonic()
+    
+    def clear_cache(self, dataset: Optional[str] = None) -> None:
+        """Clear cached data for one dataset, or all datasets if none is given."""
+        with self._lock:
+            if dataset is None:
+                self._cache.clear()
+                self._last_load.clear()
+            else:
+                self._cache.pop(dataset, None)
+                self._last_load.pop(dataset, None)
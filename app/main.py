@@ -1,8 +1,6 @@
 """Main entry point for the Health Protocol Dashboard."""
 import streamlit as st
 from app.utils.state import AppState
-from app.views.lllt import LLLTView
-from app.views.mobility import MobilityView
 
 def main():
     """Main entry point for the application."""
@@ -14,6 +12,10 @@ def main():
         initial_sidebar_state="expanded"
     )
     
+    # Refresh cached protocol data when its files change
+    from app.data.watcher import data_watcher
+    data_watcher.start()
+    
     # Initialize application state
     if 'app_state' not in st.session_state:
         st.session_state.app_state = AppState()
@@ -31,9 +33,12 @@ def main():
         state.switch_protocol(protocol)
     
     # Render selected protocol view
+    # Only the selected view is imported
     if state.selected_protocol == "lllt":
+        from app.views.lllt import LLLTView
         LLLTView(state).render()
     else:
+        from app.views.mobility import MobilityView
         MobilityView(state).render()
 
 if __name__ == "__main__":
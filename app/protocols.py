@@ -1,12 +1,14 @@
 """Protocol initialization and management."""
-from dataclasses import dataclass
-from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional
 import pandas as pd
 import streamlit as st
 from datetime import datetime
 
 from app.data_loader import DataLoader
 from app.utils.validation import DataValidator, ValidationError
+from data.frozen import freeze
 
 # Protocol phase names
 PHASE_NAMES = {
@@ -18,6 +20,11 @@ PHASE_NAMES = {
 # Current protocol version
 CURRENT_VERSION = "1.0.0"
 
+# Shared loader so its dataset cache outlives a single load_protocols call.
+# It builds the protocols from literals rather than files, so there is nothing
+# to watch: the data only changes through update_protocol, which clears it.
+data_loader = DataLoader(cache_duration=None)
+
 @dataclass
 class Protocol:
     """Base protocol class."""
@@ -47,9 +54,9 @@ class Protocol:
 @dataclass
 class LLLTProtocol(Protocol):
     """LLLT protocol data structure."""
-    daily_schedule: Dict[str, List[Dict[str, Any]]]
-    supplement_schedule: List[Dict[str, Any]]
-    weekly_schedule: List[Dict[str, Any]]
+    daily_schedule: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    supplement_schedule: List[Dict[str, Any]] = field(default_factory=list)
+    weekly_schedule: List[Dict[str, Any]] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert LLLT protocol to dictionary format."""
@@ -84,8 +91,8 @@ class LLLTProtocol(Protocol):
 @dataclass
 class MobilityProtocol(Protocol):
     """Mobility protocol data structure."""
-    phases: Dict[str, pd.DataFrame]
-    phase_details: Dict[str, Dict[str, str]]
+    phases: Dict[str, pd.DataFrame] = field(default_factory=dict)
+    phase_details: Dict[str, Dict[str, str]] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert mobility protocol to dictionary format."""
@@ -132,7 +139,12 @@ class MobilityProtocol(Protocol):
         return self.phases.get(phase_key)
 
     def update_phase_data(self, phase_key: str, data: pd.DataFrame) -> bool:
-        """Update phase data with validation."""
+        """Update phase data with validation.
+        
+        The phases mapping is replaced rather than modified, so this also
+        works on a frozen protocol: the new mapping is frozen like the old
+        one, and readers holding the old mapping keep seeing the old data.
+        """
         if phase_key not in PHASE_NAMES:
             return False
         
@@ -142,19 +154,43 @@ class MobilityProtocol(Protocol):
             if errors:
                 return False
         
-        self.phases[phase_key] = data
+        phases = {**self.phases, phase_key: data}
+        self.phases = freeze(phases) if isinstance(self.phases, MappingProxyType) else phases
         self.last_modified = datetime.now()
         return True
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
-def load_protocols() -> Dict[str, Protocol]:
-    """Load all protocol data.
+def freeze_protocol(protocol: Protocol) -> Protocol:
+    """Replace a protocol's dict and list fields with read-only copies.
     
+    Dicts become ``MappingProxyType`` views and lists become tuples, at every
+    level. pandas has no read-only DataFrame, so the frames in
+    ``progress_metrics`` and ``phases`` are shared as they are and must not
+    be modified in place; copies and derived frames are safe to change.
+    
+    Args:
+        protocol: Protocol to freeze in place
+        
     Returns:
-        Dictionary containing initialized protocol objects.
+        The same protocol; ``update_phase_data`` still works on it
     """
-    data_loader = DataLoader()
+    for protocol_field in fields(protocol):
+        value = getattr(protocol, protocol_field.name)
+        if isinstance(value, (dict, list)):
+            setattr(protocol, protocol_field.name, freeze(value))
+    return protocol
+
+# One catalog per process, shared by every session without copying
+@st.cache_resource
+def load_protocols() -> Mapping[str, Protocol]:
+    """Load all protocol data.
+    
+    The catalog is shared by all sessions, so it is frozen: protocols must be
+    treated as read-only and changed through ``update_protocol``, which
+    clears the cache.
     
+    Returns:
+        Read-only mapping containing initialized protocol objects.
+    """
     # Initialize LLLT Protocol
     lllt_data = data_loader.load_lllt_data()
     lllt_protocol = LLLTProtocol(
@@ -201,10 +237,10 @@ def load_protocols() -> Dict[str, Protocol]:
         )
         raise ValueError(error_msg)
     
-    return {
-        "lllt": lllt_protocol,
-        "mobility": mobility_protocol
-    }
+    return MappingProxyType({
+        "lllt": freeze_protocol(lllt_protocol),
+        "mobility": freeze_protocol(mobility_protocol)
+    })
 
 def get_protocol(protocol_key: str) -> Optional[Protocol]:
     """Get protocol by key with cache handling."""
@@ -226,5 +262,5 @@ def update_protocol(protocol_key: str, protocol: Protocol) -> bool:
     
     # Force cache invalidation
     load_protocols.clear()
-    DataLoader().clear_cache()
+    data_loader.clear_cache()
     return True 
\ No newline at end of file
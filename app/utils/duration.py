@@ -0,0 +1,128 @@
+"""Duration grammar for Sets/Reps/Duration prescriptions.
+
+One regular expression, compiled at import, understands every form used in
+the protocol tables and views:
+
+- ``"60 seconds"``, ``"5 minutes"``, ``"2 mins"``, ``"45s"``
+- ``"10 reps"``, ``"8–10 reps/arm"`` (ranges use the upper bound)
+- ``"3x10 pulses/side"``, ``"5 rounds"`` (counted like reps)
+- ``"3x60s"``, ``"3x90s/side"``, ``"3x30s hold"``, ``"2 sets x 30 seconds"``
+- ``"15 reps/side"``, ``"10 reps/direction/side"`` (each qualifier doubles)
+- ``"10 mins (muscles), 3 mins (face/scrotum)"`` (clauses add up)
+
+Results are cached per string, and the catalog stores them as columns when
+it loads, so views do not parse at interaction time.
+"""
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
+
+# Assumed time per repetition when a prescription counts reps or pulses
+SECONDS_PER_REP = 5
+
+# Assumed time per round of a sequence such as a Sun Salutation
+SECONDS_PER_ROUND = 60
+
+_UNIT_SECONDS = {"s": 1, "sec": 1, "second": 1, "m": 60, "min": 60, "minute": 60}
+
+# Counted units and the assumed seconds of one
+_COUNT_SECONDS = {"rep": SECONDS_PER_REP, "pulse": SECONDS_PER_REP, "round": SECONDS_PER_ROUND}
+
+# Qualifiers that repeat the work, e.g. "/side" or "each arm"
+_REPEAT_WORDS = ("side", "arm", "leg", "direction")
+
+_CLAUSE_RE = re.compile(
+    r"""
+    (?:(?P<sets>\d+)\s*(?:x|×|sets?\s*(?:x|×|of)?)\s*)?
+    (?P<amount>\d+)(?:\s*[-–]\s*(?P<amount_max>\d+))?
+    \s*(?P<unit>seconds?|secs?|s|minutes?|mins?|m|reps?|pulses?|rounds?)\b
+    (?P<qualifiers>(?:\s*(?:/|per\s+|each\s+)\s*[a-z]+)*)
+    """,
+    re.IGNORECASE | re.VERBOSE
+)
+_PARENTHETICAL_RE = re.compile(r"\([^)]*\)")
+_CLAUSE_SEPARATOR_RE = re.compile(r"[,+;]")
+
+@dataclass(frozen=True)
+class Prescription:
+    """A parsed prescription.
+
+    ``reps`` and ``set_seconds`` describe one set on one side; ``reps``
+    counts reps, pulses or rounds. ``seconds`` is the whole prescription
+    across sets, sides and clauses.
+    """
+    sets: int = 0
+    reps: int = 0
+    set_seconds: int = 0
+    sides: int = 1
+    seconds: int = 0
+
+    @property
+    def is_timed(self) -> bool:
+        """Whether the prescription is a hold or duration rather than reps."""
+        return self.reps == 0 and self.seconds > 0
+
+def _repeats(qualifiers: str) -> int:
+    """Multiplier of qualifiers such as ``/direction/side``."""
+    words = re.findall(r"[a-z]+", qualifiers.lower())
+    return 2 ** sum(1 for word in words if word.rstrip("s") in _REPEAT_WORDS)
+
+@lru_cache(maxsize=1024)
+def parse_prescription(text: str) -> Prescription:
+    """Parse a Sets/Reps/Duration string.
+
+    Args:
+        text: Prescription such as ``"3x90s/side"``
+
+    Returns:
+        The parsed prescription; all zero if nothing matched
+    """
+    if not isinstance(text, str):
+        return Prescription()
+
+    first = None
+    total = 0
+    for clause in _CLAUSE_SEPARATOR_RE.split(_PARENTHETICAL_RE.sub("", text)):
+        match = _CLAUSE_RE.search(clause)
+        if not match:
+            continue
+        sets = int(match.group("sets") or 1)
+        amount = int(match.group("amount_max") or match.group("amount"))
+        unit = match.group("unit").lower().rstrip("s") or "s"
+        sides = _repeats(match.group("qualifiers"))
+        if unit in _COUNT_SECONDS:
+            reps, set_seconds = amount, amount * _COUNT_SECONDS[unit]
+        else:
+            reps, set_seconds = 0, amount * _UNIT_SECONDS[unit]
+        total += sets * sides * set_seconds
+        if first is None:
+            first = (sets, reps, set_seconds, sides)
+
+    if first is None:
+        return Prescription()
+    sets, reps, set_seconds, sides = first
+    return Prescription(sets=sets, reps=reps, set_seconds=set_seconds, sides=sides, seconds=total)
+
+def parse_duration(duration_str: str, default_seconds: int = 60) -> int:
+    """Convert a prescription to seconds.
+
+    Args:
+        duration_str: Prescription such as ``"2 sets x 30 seconds"``
+        default_seconds: Returned when nothing could be parsed
+
+    Returns:
+        Total duration in seconds
+    """
+    return parse_prescription(duration_str).seconds or default_seconds
+
+def parse_reps(reps_str: str) -> Tuple[int, int]:
+    """Return ``(reps, sets)`` of a prescription such as ``"3x10 reps"``.
+
+    Raises:
+        ValueError: If the string is not a prescription
+    """
+    prescription = parse_prescription(reps_str)
+    if not prescription.sets:
+        raise ValueError(f"Not a prescription: {reps_str!r}")
+    return prescription.reps, prescription.sets
@@ -0,0 +1,223 @@
+"""Timer and rep counter engine.
+
+Plain Python with no Streamlit import: the state lives in small ``__slots__``
+objects and time comes from an injected clock, so the logic runs (and is
+tested and benchmarked) without a script run. The Streamlit modules
+(``app.utils.timer``, ``app.utils.rep_counter`` and
+``app.components.timer``) are thin adapters that load a state object from
+session state, call the engine and store it back.
+
+State field names are the session state keys the app has always used, so
+``from_mapping`` and ``store`` map them one to one.
+"""
+import time
+from typing import Any, Callable, Dict, Mapping, MutableMapping, Tuple, Type, TypeVar
+
+# Returns the current time in seconds
+Clock = Callable[[], float]
+
+# Events reported by the browser-side rep counter
+SET_COMPLETE = "set_complete"
+EXERCISE_COMPLETE = "exercise_complete"
+REP_EVENTS = (SET_COMPLETE, EXERCISE_COMPLETE)
+
+S = TypeVar("S", bound="SlotState")
+
+class SlotState:
+    """Base of the state objects; subclasses list their fields in ``__slots__``."""
+    __slots__ = ()
+    DEFAULTS: Dict[str, Any] = {}
+
+    def __init__(self, **values: Any):
+        for name in self.__slots__:
+            setattr(self, name, values.pop(name, self.DEFAULTS[name]))
+        if values:
+            raise TypeError(f"Unknown {type(self).__name__} fields: {', '.join(values)}")
+
+    @classmethod
+    def from_mapping(cls: Type[S], mapping: Mapping[str, Any]) -> S:
+        """Build a state from the fields present in ``mapping``."""
+        return cls(**{name: mapping[name] for name in cls.__slots__ if name in mapping})
+
+    def store(self, mapping: MutableMapping[str, Any]) -> None:
+        """Write every field to ``mapping``."""
+        for name in self.__slots__:
+            mapping[name] = getattr(self, name)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+class TimerState(SlotState):
+    """A countdown; times are clock readings in seconds."""
+    __slots__ = ("timer_active", "timer_start", "timer_duration", "timer_paused",
+                 "pause_time", "should_play_sound", "last_update")
+    DEFAULTS = {
+        "timer_active": False,
+        "timer_start": None,
+        "timer_duration": 0,
+        "timer_paused": False,
+        "pause_time": None,
+        "should_play_sound": False,
+        "last_update": None
+    }
+
+class RepState(SlotState):
+    """A rep counter over one or more sets."""
+    __slots__ = ("current_reps", "target_reps", "current_set", "target_sets")
+    DEFAULTS = {
+        "current_reps": 0,
+        "target_reps": 0,
+        "current_set": 1,
+        "target_sets": 1
+    }
+
+class TimerEngine:
+    """Countdown logic over ``TimerState``."""
+    __slots__ = ("clock",)
+
+    def __init__(self, clock: Clock = time.time):
+        self.clock = clock
+
+    def start(self, state: TimerState, duration_seconds: float) -> None:
+        """Start a new countdown."""
+        now = self.clock()
+        state.timer_active = True
+        state.timer_start = now
+        state.timer_duration = duration_seconds
+        state.timer_paused = False
+        state.pause_time = None
+        state.last_update = now
+        state.should_play_sound = False
+
+    def restart(self, state: TimerState) -> None:
+        """Start the countdown over with its current duration."""
+        self.start(state, state.timer_duration)
+
+    def stop(self, state: TimerState) -> None:
+        """Stop the countdown without completing it."""
+        state.timer_active = False
+        state.timer_start = None
+        state.timer_paused = False
+        state.pause_time = None
+
+    def pause(self, state: TimerState) -> None:
+        """Pause a running countdown."""
+        if state.timer_active and not state.timer_paused:
+            state.timer_paused = True
+            state.pause_time = self.clock()
+
+    def resume(self, state: TimerState) -> None:
+        """Resume a paused countdown, shifting its start by the pause."""
+        if state.timer_active and state.timer_paused:
+            state.timer_start += self.clock() - state.pause_time
+            state.timer_paused = False
+            state.pause_time = None
+
+    def elapsed(self, state: TimerState) -> float:
+        """Seconds run so far, excluding pauses."""
+        if state.timer_start is None:
+            return 0.0
+        now = state.pause_time if state.timer_paused else self.clock()
+        return max(0.0, now - state.timer_start)
+
+    def remaining(self, state: TimerState) -> float:
+        """Seconds left; zero once the countdown is over or inactive."""
+        if not state.timer_active:
+            return 0.0
+        return max(0.0, state.timer_duration - self.elapsed(state))
+
+    def progress(self, state: TimerState) -> float:
+        """Fraction of the countdown done, from 0 to 1."""
+        if not state.timer_duration:
+            return 1.0 if state.timer_active else 0.0
+        return min(1.0, self.elapsed(state) / state.timer_duration)
+
+    def update(self, state: TimerState, force_complete: bool = False) -> bool:
+        """Complete the countdown if it ran out; returns whether it did."""
+        if not state.timer_active or state.timer_paused:
+            return False
+        now = self.clock()
+        if force_complete or now - state.timer_start >= state.timer_duration:
+            state.timer_active = False
+            state.should_play_sound = True
+            return True
+        state.last_update = now
+        return False
+
+    def display(self, state: TimerState) -> str:
+        """Remaining time as ``MM:SS``."""
+        minutes, seconds = divmod(int(self.remaining(state)), 60)
+        return f"{minutes:02d}:{seconds:02d}"
+
+class RepEngine:
+    """Rep counter logic over ``RepState``."""
+    __slots__ = ()
+
+    def start(self, state: RepState, target_reps: int, target_sets: int = 1) -> None:
+        """Start counting towards new targets."""
+        state.current_reps = 0
+        state.target_reps = target_reps
+        state.current_set = 1
+        state.target_sets = target_sets
+
+    def increment(self, state: RepState) -> None:
+        """Count one rep, up to the set's target."""
+        if state.current_reps < state.target_reps:
+            state.current_reps += 1
+
+    def complete_set(self, state: RepState) -> None:
+        """Move on to the next set, if there is one."""
+        if state.current_set < state.target_sets:
+            state.current_set += 1
+            state.current_reps = 0
+
+    def sync(self, state: RepState, event: Mapping[str, Any]) -> None:
+        """Apply a set or exercise completion counted elsewhere.
+
+        Leaves the counter where ``increment`` and ``complete_set`` would
+        have, so ``display`` and the completion checks hold as before.
+
+        Args:
+            state: Counter to update
+            event: Rep counter event with the finished ``set``
+        """
+        finished_set = min(int(event["set"]), state.target_sets)
+        if event["event"] == EXERCISE_COMPLETE or finished_set >= state.target_sets:
+            state.current_set = state.target_sets
+            state.current_reps = state.target_reps
+        else:
+            state.current_set = finished_set + 1
+            state.current_reps = 0
+
+    def is_set_complete(self, state: RepState) -> bool:
+        """Whether the current set reached its target."""
+        return state.current_reps >= state.target_reps
+
+    def is_exercise_complete(self, state: RepState) -> bool:
+        """Whether the last set reached its target."""
+        return state.current_set >= state.target_sets and self.is_set_complete(state)
+
+    def completed_sets(self, state: RepState) -> int:
+        """Number of sets finished so far."""
+        if self.is_exercise_complete(state):
+            return state.target_sets
+        return state.current_set - 1
+
+    def display(self, state: RepState) -> Tuple[str, float]:
+        """Return the count as text and its progress percentage (0-100)."""
+        total_reps = state.target_reps * state.target_sets
+        completed_reps = (state.current_set - 1) * state.target_reps + state.current_reps
+        progress = (completed_reps / total_reps) * 100 if total_reps > 0 else 0
+
+        if state.target_sets > 1:
+            text = (f"Set {state.current_set}/{state.target_sets} - "
+                    f"Rep {state.current_reps}/{state.target_reps}")
+        else:
+            text = f"Rep {state.current_reps}/{state.target_reps}"
+        return text, progress
@@ -1,17 +1,29 @@
-"""Rep counter utilities for exercise tracking."""
+"""Rep counter utilities for exercise tracking.
+
+Streamlit adapter over ``app.utils.engine``: each function loads the counter
+from session state, applies the engine and stores the result.
+"""
 import streamlit as st
-from typing import Optional, Tuple
+from typing import Tuple
+
+from app.utils.duration import parse_reps
+from app.utils.engine import (
+    EXERCISE_COMPLETE,
+    REP_EVENTS,
+    SET_COMPLETE,
+    RepEngine,
+    RepState
+)
+
+_engine = RepEngine()
+
+def _load() -> RepState:
+    """Read the counter from session state."""
+    return RepState.from_mapping(st.session_state)
 
 def init_rep_counter() -> None:
     """Initialize rep counter session state variables."""
-    if "current_reps" not in st.session_state:
-        st.session_state.current_reps = 0
-    if "target_reps" not in st.session_state:
-        st.session_state.target_reps = 0
-    if "current_set" not in st.session_state:
-        st.session_state.current_set = 1
-    if "target_sets" not in st.session_state:
-        st.session_state.target_sets = 1
+    _load().store(st.session_state)
 
 def start_rep_counter(target_reps: int, target_sets: int = 1) -> None:
     """Start a new rep counter with the specified targets.
@@ -20,21 +32,46 @@ def start_rep_counter(target_reps: int, target_sets: int = 1) -> None:
         target_reps: The target number of repetitions.
         target_sets: The target number of sets (default: 1).
     """
-    st.session_state.current_reps = 0
-    st.session_state.target_reps = target_reps
-    st.session_state.current_set = 1
-    st.session_state.target_sets = target_sets
+    state = _load()
+    _engine.start(state, target_reps, target_sets)
+    state.store(st.session_state)
+
+def reset_rep_counter() -> None:
+    """Clear the counter back to its initial state."""
+    RepState().store(st.session_state)
 
 def increment_rep() -> None:
     """Increment the rep counter by one."""
-    if st.session_state.current_reps < st.session_state.target_reps:
-        st.session_state.current_reps += 1
+    state = _load()
+    _engine.increment(state)
+    state.store(st.session_state)
 
 def complete_set() -> None:
     """Complete the current set and move to the next one."""
-    if st.session_state.current_set < st.session_state.target_sets:
-        st.session_state.current_set += 1
-        st.session_state.current_reps = 0
+    state = _load()
+    _engine.complete_set(state)
+    state.store(st.session_state)
+
+def sync_rep_counter(event: dict) -> None:
+    """Apply a set or exercise completion counted in the browser.
+    
+    Leaves the counter where ``complete_set`` and ``increment_rep`` would
+    have, so ``get_rep_display`` and the completion checks hold as before.
+    
+    Args:
+        event: Rep counter event with the finished ``set`` and its ``reps``.
+    """
+    state = _load()
+    _engine.sync(state, event)
+    state.store(st.session_state)
+
+def get_completed_sets() -> int:
+    """Get the number of finished sets.
+    
+    Returns:
+        int: The number of sets completed so far.
+    """
+    return _engine.completed_sets(_load())
 
 def get_rep_display() -> Tuple[str, float]:
     """Get the current rep counter display information.
@@ -44,19 +81,7 @@ def get_rep_display() -> Tuple[str, float]:
             - The formatted rep/set display string
             - The progress percentage (0-100)
     """
-    total_reps = st.session_state.target_reps * st.session_state.target_sets
-    completed_reps = ((st.session_state.current_set - 1) * st.session_state.target_reps + 
-                     st.session_state.current_reps)
-    
-    progress = (completed_reps / total_reps) * 100 if total_reps > 0 else 0
-    
-    if st.session_state.target_sets > 1:
-        display = (f"Set {st.session_state.current_set}/{st.session_state.target_sets} - "
-                  f"Rep {st.session_state.current_reps}/{st.session_state.target_reps}")
-    else:
-        display = f"Rep {st.session_state.current_reps}/{st.session_state.target_reps}"
-    
-    return display, progress
+    return _engine.display(_load())
 
 def is_set_complete() -> bool:
     """Check if the current set is complete.
@@ -64,7 +89,7 @@ def is_set_complete() -> bool:
     Returns:
         bool: True if the current set is complete, False otherwise.
     """
-    return st.session_state.current_reps >= st.session_state.target_reps
+    return _engine.is_set_complete(_load())
 
 def is_exercise_complete() -> bool:
     """Check if all sets are complete.
@@ -72,24 +97,4 @@ def is_exercise_complete() -> bool:
     Returns:
         bool: True if all sets are complete, False otherwise.
     """
-    return (st.session_state.current_set >= st.session_state.target_sets and 
-            st.session_state.current_reps >= st.session_state.target_reps)
-
-def parse_reps(reps_str: str) -> Tuple[int, int]:
-    """Parse a reps string into target reps and sets.
-    
-    Args:
-        reps_str: String containing rep/set information (e.g., "10 reps", "3x10 reps").
-    
-    Returns:
-        Tuple[int, int]: A tuple containing (target_reps, target_sets).
-    """
-    parts = reps_str.lower().split()
-    
-    # Check for set notation (e.g., "3x10 reps")
-    if 'x' in parts[0]:
-        sets, reps = parts[0].split('x')
-        return int(reps), int(sets)
-    
-    # Single set notation (e.g., "10 reps")
-    return int(parts[0]), 1 
\ No newline at end of file
+    return _engine.is_exercise_complete(_load())
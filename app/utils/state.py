@@ -4,7 +4,9 @@ from typing import List, Optional, Dict, Any, Set
 from dataclasses import dataclass, field
 import pandas as pd
 
+from app.data.catalog import ProtocolCatalog, get_catalog
 from app.data.data_loader import DataLoader
+from app.data.exercise_index import get_exercise_index
 
 @dataclass
 class AppState:
@@ -25,10 +27,10 @@ class AppState:
     timer_paused: bool = False
     pause_time: Optional[datetime] = None
     
-    # Data
+    # Data; mobility rows are read from the catalog, by phase and session
     data_loader: DataLoader = field(default_factory=lambda: DataLoader())
-    mobility_data: Dict[str, Dict[str, pd.DataFrame]] = field(default_factory=dict)
     lllt_data: Dict[str, pd.DataFrame] = field(default_factory=dict)
+    catalog: Optional[ProtocolCatalog] = None
     
     def __post_init__(self):
         """Initialize session state and load data."""
@@ -46,6 +48,7 @@ class AppState:
             'timer_duration': 0,
             'timer_paused': False,
             'pause_time': None,
+            'last_update': None,
             'should_play_sound': False
         }
         
@@ -55,7 +58,7 @@ class AppState:
     
     def load_data(self):
         """Load all protocol data."""
-        self.mobility_data = self.data_loader.load_all_mobility_data()
+        self.catalog = get_catalog()
         self.lllt_data = self.data_loader.load_lllt_data()
     
     def switch_protocol(self, protocol: str):
@@ -87,35 +90,26 @@ class AppState:
         """Mark an exercise as completed."""
         if not exercise_id:
             return
-        self._completed_exercises.add(exercise_id)
+        self._completed_exercises.add(get_exercise_index().canonical_name(exercise_id))
         self.current_exercise = None
     
     def is_exercise_completed(self, exercise: Dict[str, Any]) -> bool:
         """Check if an exercise is completed."""
-        exercise_name = exercise.get('Exercise', exercise.get('name', ''))
-        return exercise_name in self._completed_exercises
+        return get_exercise_index().canonical_name(exercise) in self._completed_exercises
     
     def is_exercise_active(self, exercise: Dict[str, Any]) -> bool:
         """Check if an exercise is currently active."""
         if not exercise or not self.current_exercise:
             return False
-        exercise_name = exercise.get('Exercise', exercise.get('name', ''))
-        current_name = self.current_exercise.get('Exercise', self.current_exercise.get('name', ''))
-        return exercise_name == current_name
+        index = get_exercise_index()
+        return index.canonical_name(exercise) == index.canonical_name(self.current_exercise)
     
     def get_session_progress(self) -> Dict[str, Any]:
         """Get current session progress metrics."""
         if not self.session_start:
             return {"completed": 0, "total": 0, "duration": "00:00:00"}
         
-        total = 0
-        if self.selected_protocol == "mobility":
-            for phase_data in self.mobility_data.values():
-                for session_data in phase_data.values():
-                    total += len(session_data)
-        else:
-            total = len(self.lllt_data.get("lllt_days", pd.DataFrame()))
-        
+        total = self.total_count
         completed = len(self._completed_exercises)
         duration = datetime.now() - self.session_start
         
@@ -128,8 +122,7 @@ class AppState:
     def get_current_phase_data(self, session: str) -> pd.DataFrame:
         """Get data for current phase and session."""
         if self.selected_protocol == "mobility":
-            phase = "phase1"  # Default to phase 1 for now
-            return self.mobility_data[phase][session]
+            return self.catalog.session(session, phase=1)  # Default to phase 1 for now
         return pd.DataFrame()  # Empty DataFrame if not found
     
     def get_session_stats(self) -> Dict[str, Any]:
@@ -229,25 +222,18 @@ class AppState:
         """Mark an exercise as completed."""
         if exercise_name == self.current_exercise.get('name', ''):
             self.current_exercise = None
-        self._completed_exercises.add(exercise_name)
+        self._completed_exercises.add(get_exercise_index().canonical_name(exercise_name))
         if self.session_start:
             self.completion_percentage = (len(self._completed_exercises) / self.total_count) * 100
     
     @property
     def total_count(self) -> int:
         """Get the total count of exercises."""
-        if self.selected_protocol == "mobility":
-            total = 0
-            for phase_data in self.mobility_data.values():
-                for session_data in phase_data.values():
-                    total += len(session_data)
-            return total
-        else:
-            return len(self.lllt_data.get("lllt_days", pd.DataFrame()))
+        return self.catalog.count(self.selected_protocol)
     
     def add_completed_exercise(self, exercise: str) -> None:
         """Add an exercise to the completed set."""
-        self._completed_exercises.add(exercise)
+        self._completed_exercises.add(get_exercise_index().canonical_name(exercise))
     
     def clear_completed_exercises(self) -> None:
         """Clear all completed exercises."""
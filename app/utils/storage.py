@@ -6,7 +6,6 @@ import os
 import csv
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
-from ics import Calendar, Event
 
 def get_data_dir() -> str:
     """Get or create the data directory for storing local files."""
@@ -51,6 +50,54 @@ def load_session_progress(session_type: str) -> set:
     
     return set()
 
+def save_set_progress(session_type: str, exercise_id: int, completed_sets: int) -> None:
+    """Save the number of finished sets of one exercise for today's session."""
+    data_dir = get_data_dir()
+    today = datetime.now().strftime("%Y-%m-%d")
+    
+    # Kept apart from session_progress.json, whose entries are exercise lists
+    progress_file = os.path.join(data_dir, "set_progress.json")
+    if os.path.exists(progress_file):
+        with open(progress_file, 'r') as f:
+            progress_data = json.load(f)
+    else:
+        progress_data = {}
+    
+    progress_data.setdefault(today, {}).setdefault(session_type, {})[str(exercise_id)] = completed_sets
+    
+    with open(progress_file, 'w') as f:
+        json.dump(progress_data, f)
+
+def load_set_progress(session_type: str) -> Dict[int, int]:
+    """Load finished sets per exercise for today's session."""
+    data_dir = get_data_dir()
+    today = datetime.now().strftime("%Y-%m-%d")
+    progress_file = os.path.join(data_dir, "set_progress.json")
+    
+    if os.path.exists(progress_file):
+        with open(progress_file, 'r') as f:
+            progress_data = json.load(f)
+            sets = progress_data.get(today, {}).get(session_type, {})
+            return {int(exercise_id): completed for exercise_id, completed in sets.items()}
+    
+    return {}
+
+def clear_set_progress(session_type: str) -> None:
+    """Forget the finished sets of today's session."""
+    data_dir = get_data_dir()
+    today = datetime.now().strftime("%Y-%m-%d")
+    progress_file = os.path.join(data_dir, "set_progress.json")
+    
+    if not os.path.exists(progress_file):
+        return
+    with open(progress_file, 'r') as f:
+        progress_data = json.load(f)
+    
+    progress_data.get(today, {}).pop(session_type, None)
+    
+    with open(progress_file, 'w') as f:
+        json.dump(progress_data, f)
+
 def get_session_history(days: int = 7) -> Dict[str, Any]:
     """Get session completion history for the last N days."""
     data_dir = get_data_dir()
@@ -93,6 +140,8 @@ def export_history_to_csv(days: int = 30) -> str:
 
 def generate_calendar_events(days_ahead: int = 7) -> str:
     """Generate ICS file with scheduled sessions."""
+    from ics import Calendar, Event
+    
     cal = Calendar()
     
     # Add events for each session type
@@ -0,0 +1,133 @@
+"""Session timeline planning.
+
+A session's exercises are laid out once as a sequence of work and rest
+segments: every set and side of an exercise gets its own work segment, sets
+are separated by a short rest and exercises by a transition. One continuous
+timer then runs through the whole timeline, and only the exercise
+boundaries (``exercise_ends``) need to reach the server.
+"""
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping, Optional, Tuple
+
+from app.data.catalog import get_catalog
+from app.utils.duration import parse_prescription
+
+# Rest between the sets of one exercise and between exercises, in seconds
+REST_BETWEEN_SETS = 15
+TRANSITION_SECONDS = 10
+
+# Timer duration of exercises whose prescription has no duration or reps
+DEFAULT_EXERCISE_SECONDS = 60
+
+WORK = "work"
+REST = "rest"
+
+@dataclass(frozen=True)
+class Segment:
+    """One stretch of the timeline."""
+    exercise: int
+    kind: str
+    start: int
+    duration: int
+    set_number: int = 0
+    side: int = 0
+    label: str = ""
+
+    @property
+    def end(self) -> int:
+        """Offset at which the segment ends."""
+        return self.start + self.duration
+
+@dataclass(frozen=True)
+class SessionTimeline:
+    """Precomputed timeline of one session."""
+    names: Tuple[str, ...]
+    segments: Tuple[Segment, ...]
+    exercise_starts: Tuple[int, ...]
+    exercise_ends: Tuple[int, ...]
+
+    @property
+    def total_seconds(self) -> int:
+        """Duration of the whole session."""
+        return self.segments[-1].end if self.segments else 0
+
+    def segment_at(self, elapsed: float) -> Optional[Segment]:
+        """Return the segment running ``elapsed`` seconds in, if any."""
+        if not self.segments or elapsed >= self.total_seconds:
+            return None
+        starts = [segment.start for segment in self.segments]
+        return self.segments[bisect_right(starts, max(0.0, elapsed)) - 1]
+
+    def completed_count(self, elapsed: float) -> int:
+        """Number of exercises finished ``elapsed`` seconds in."""
+        return bisect_right(self.exercise_ends, elapsed)
+
+def _side_label(side: int, sides: int) -> str:
+    """Name a side, e.g. ``"left"`` for the first of two."""
+    if sides == 2:
+        return ("left", "right")[side - 1]
+    return f"side {side}/{sides}"
+
+def _work_label(name: str, set_number: int, sets: int, side: int, sides: int) -> str:
+    """Label a work segment, e.g. ``"Leg Swings · set 2/3 · right"``."""
+    parts = [name]
+    if sets > 1:
+        parts.append(f"set {set_number}/{sets}")
+    if sides > 1:
+        parts.append(_side_label(side, sides))
+    return " · ".join(parts)
+
+def _prescription(exercise: Mapping[str, Any]) -> Tuple[int, int, int]:
+    """Return ``(sets, sides, set_seconds)``, preferring catalog columns."""
+    if exercise.get("Set Seconds"):
+        return int(exercise["Sets"]), int(exercise["Sides"]), int(exercise["Set Seconds"])
+    text = exercise.get("Sets/Reps/Duration", exercise.get("sets_reps", ""))
+    prescription = parse_prescription(str(text))
+    if not prescription.set_seconds:
+        return 1, 1, DEFAULT_EXERCISE_SECONDS
+    return prescription.sets, prescription.sides, prescription.set_seconds
+
+def build_timeline(exercises: Iterable[Mapping[str, Any]],
+                   rest_between_sets: int = REST_BETWEEN_SETS,
+                   transition_seconds: int = TRANSITION_SECONDS) -> SessionTimeline:
+    """Lay out a session's exercises as one timeline.
+
+    Args:
+        exercises: Catalog rows or exercise dicts, in session order
+        rest_between_sets: Rest after each set but the last of an exercise
+        transition_seconds: Rest between consecutive exercises
+
+    Returns:
+        The session timeline
+    """
+    names = []
+    segments = []
+    starts = []
+    ends = []
+    offset = 0
+    for index, exercise in enumerate(exercises):
+        name = str(exercise.get("Exercise", exercise.get("name", "")))
+        if index and transition_seconds:
+            segments.append(Segment(index, REST, offset, transition_seconds, label=f"Next: {name}"))
+            offset += transition_seconds
+
+        sets, sides, set_seconds = _prescription(exercise)
+        names.append(name)
+        starts.append(offset)
+        for set_number in range(1, sets + 1):
+            if set_number > 1 and rest_between_sets:
+                segments.append(Segment(index, REST, offset, rest_between_sets, set_number,
+                                        label=f"Rest · {name}"))
+                offset += rest_between_sets
+            for side in range(1, sides + 1):
+                segments.append(Segment(index, WORK, offset, set_seconds, set_number, side,
+                                        _work_label(name, set_number, sets, side, sides)))
+                offset += set_seconds
+        ends.append(offset)
+
+    return SessionTimeline(tuple(names), tuple(segments), tuple(starts), tuple(ends))
+
+def plan_session(phase: int, session: str) -> SessionTimeline:
+    """Plan a mobility session from the protocol catalog."""
+    return build_timeline(get_catalog().session(session, phase=phase).to_dict("records"))
@@ -1,6 +1,18 @@
-"""Views package for the Health Protocol App."""
+"""Views package for the Health Protocol App.
 
-from .lllt_view import render as render_lllt
-from .mobility_view import render as render_mobility
+Views are imported on first access so loading the package does not pull in
+every page's dependencies.
+"""
+from importlib import import_module
 
-__all__ = ['render_lllt', 'render_mobility'] 
\ No newline at end of file
+_VIEWS = {
+    'render_lllt': 'app.views.lllt_view',
+    'render_mobility': 'app.views.mobility_view'
+}
+
+__all__ = ['render_lllt', 'render_mobility']
+
+def __getattr__(name):
+    if name in _VIEWS:
+        return import_module(_VIEWS[name]).render
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,8 @@ import streamlit as st
 import time
 from typing import Dict, Optional, Callable
 
+from app.utils.duration import parse_duration, parse_reps
+
 class ExerciseCard:
     @staticmethod
     def render(
@@ -53,11 +55,11 @@ class ExerciseCard:
                         if st.button("Start", key=f"start_{exercise['name']}", use_container_width=True):
                             if duration:
                                 # Parse duration string to seconds
-                                seconds = ExerciseCard._parse_duration(duration)
-                                st.session_state.timer_duration = seconds
+                                st.session_state.timer_duration = parse_duration(duration, default_seconds=0)
                             elif reps:
                                 st.session_state.rep_count = 0
-                                st.session_state.total_reps = int(reps.split()[0])
+                                # ``reps`` is a count ("10") or a prescription ("3x10")
+                                st.session_state.total_reps = parse_reps(f"{reps} reps")[0]
                             on_start()
                     else:
                         if st.button("Pause", key=f"pause_{exercise['name']}", use_container_width=True):
@@ -69,8 +71,7 @@ class ExerciseCard:
                     if is_active:
                         if st.button("Restart", key=f"restart_{exercise['name']}", use_container_width=True):
                             if duration:
-                                seconds = ExerciseCard._parse_duration(duration)
-                                st.session_state.timer_duration = seconds
+                                st.session_state.timer_duration = parse_duration(duration, default_seconds=0)
                                 st.session_state.timer_start = time.time()
                             else:
                                 st.session_state.rep_count = 0
@@ -84,12 +85,3 @@ class ExerciseCard:
                             on_complete()
             else:
                 st.success("✅ Completed")
-
-    @staticmethod
-    def _parse_duration(duration: str) -> int:
-        """Convert duration string to seconds."""
-        if "seconds" in duration:
-            return int(duration.split()[0])
-        elif "minutes" in duration:
-            return int(duration.split()[0]) * 60
-        return 0 
\ No newline at end of file
@@ -4,6 +4,7 @@ LLLT Protocol view module.
 import streamlit as st
 from datetime import datetime
 
+from app.components.checklist import checklist
 from app.data import (
     get_lllt_daily_data,
     get_weekly_schedule,
@@ -16,6 +17,15 @@ from app.utils.storage import (
     save_session_progress
 )
 
+def treatment_row(treatment: dict) -> dict:
+    """Display row of an LLLT treatment."""
+    return {
+        "Treatment": treatment['name'],
+        "Duration": f"{treatment['duration']} seconds",
+        "Intensity": treatment['intensity'],
+        "Equipment": treatment['equipment']
+    }
+
 def render():
     """Render the LLLT Protocol view."""
     st.title("LLLT Session")
@@ -35,33 +45,15 @@ def render():
     # Treatment List Table
     st.subheader("📋 Treatment List")
     
-    # Create the table header
-    header_cols = st.columns([0.5, 2, 1, 1, 1.5])
-    header_cols[0].markdown("**✓**")
-    header_cols[1].markdown("**Treatment**")
-    header_cols[2].markdown("**Duration**")
-    header_cols[3].markdown("**Intensity**")
-    header_cols[4].markdown("**Equipment**")
-    
-    # Create table rows
-    for idx, treatment in enumerate(daily_data):
-        cols = st.columns([0.5, 2, 1, 1, 1.5])
-        
-        # Checkbox column
-        is_completed = idx in st.session_state.completed_treatments
-        if cols[0].checkbox("Complete", key=f"lllt_check_{idx}", value=is_completed, label_visibility="collapsed"):
-            st.session_state.completed_treatments.add(idx)
-            save_session_progress(st.session_state.completed_treatments, 'lllt')
-        else:
-            if idx in st.session_state.completed_treatments:
-                st.session_state.completed_treatments.discard(idx)
-                save_session_progress(st.session_state.completed_treatments, 'lllt')
-        
-        # Treatment details columns
-        cols[1].markdown(treatment['name'])
-        cols[2].markdown(f"{treatment['duration']} seconds")
-        cols[3].markdown(treatment['intensity'])
-        cols[4].markdown(treatment['equipment'])
+    # One editable table; storage is written only when completion changed
+    completed = checklist(
+        [treatment_row(treatment) for treatment in daily_data],
+        st.session_state.completed_treatments,
+        key="lllt_checklist"
+    )
+    if completed != st.session_state.completed_treatments:
+        st.session_state.completed_treatments = completed
+        save_session_progress(completed, 'lllt')
     
     # Progress bar
     progress = len(st.session_state.completed_treatments) / len(daily_data)
@@ -2,17 +2,148 @@
 Mobility Protocol view module.
 """
 import streamlit as st
+import time
 from datetime import datetime
+from functools import partial
 
+from app.components.checklist import checklist, exercise_row
+from app.components.countdown import countdown_timer
+from app.components.rep_counter import rep_counter
 from app.data import (
     get_current_phase,
     get_current_session,
     get_current_exercises
 )
+from app.data.catalog import get_catalog, row_prescription
+from app.data.health import phase_number
+from app.utils.duration import Prescription
+from app.utils.rep_counter import (
+    EXERCISE_COMPLETE,
+    get_completed_sets,
+    reset_rep_counter,
+    start_rep_counter,
+    sync_rep_counter
+)
 from app.utils.storage import (
+    clear_set_progress,
     load_session_progress,
-    save_session_progress
+    load_set_progress,
+    save_session_progress,
+    save_set_progress
 )
+from app.utils.timeline import DEFAULT_EXERCISE_SECONDS, SessionTimeline, build_timeline
+
+def _mark_completed(indices, session: str) -> None:
+    """Record exercises as completed."""
+    st.session_state.completed_exercises.update(indices)
+    save_session_progress(st.session_state.completed_exercises, session)
+
+def _guided_elapsed() -> float:
+    """Seconds into the guided session, excluding pauses."""
+    if st.session_state.guided_paused_at is not None:
+        return st.session_state.guided_paused_at - st.session_state.guided_start
+    return time.time() - st.session_state.guided_start
+
+def _on_guided_event(timeline: SessionTimeline, session: str, event: dict) -> None:
+    """Record finished exercises and apply timer controls of the guided session."""
+    if st.session_state.get('guided_start') is None:
+        return
+    
+    action = event['event']
+    now = time.time()
+    if action == 'pause' and st.session_state.guided_paused_at is None:
+        st.session_state.guided_start = now - event['elapsed']
+        st.session_state.guided_paused_at = now
+    elif action == 'resume' and st.session_state.guided_paused_at is not None:
+        st.session_state.guided_start += now - st.session_state.guided_paused_at
+        st.session_state.guided_paused_at = None
+    elif action == 'restart':
+        st.session_state.guided_start = now
+        st.session_state.guided_paused_at = None
+    elif action in ('mark', 'complete'):
+        done = len(timeline.names) if action == 'complete' else timeline.completed_count(event['elapsed'])
+        _mark_completed(range(done), session)
+        if action == 'complete':
+            st.session_state.guided_start = None
+
+def render_guided_session(rows, current_session: str) -> None:
+    """Run the whole session on one timer that reports each finished exercise.
+    
+    Args:
+        rows: The session's catalog rows, with their parsed prescriptions
+        current_session: Session the progress is stored under
+    """
+    timeline = build_timeline(rows)
+    
+    st.markdown("### 🧭 Guided Session")
+    mins, secs = divmod(timeline.total_seconds, 60)
+    st.caption(f"{len(timeline.names)} exercises, {mins}:{secs:02d} including rests")
+    
+    if st.session_state.get('guided_start') is None:
+        if not st.button("▶️ Start Guided Session"):
+            return
+        st.session_state.guided_start = time.time()
+        st.session_state.guided_paused_at = None
+    
+    countdown_timer(
+        timeline.total_seconds,
+        _guided_elapsed(),
+        st.session_state.guided_paused_at is not None,
+        key="guided_session_timer",
+        on_event=partial(_on_guided_event, timeline, current_session),
+        run_id=st.session_state.guided_start,
+        segments=[(segment.start, segment.label) for segment in timeline.segments],
+        marks=timeline.exercise_ends,
+        height=180
+    )
+
+def _on_rep_event(index: int, session: str, event: dict) -> None:
+    """Store a set or exercise finished on the rep counter."""
+    if st.session_state.get('rep_exercise') != index:
+        return
+    
+    sync_rep_counter(event)
+    save_set_progress(session, index, get_completed_sets())
+    if event['event'] == EXERCISE_COMPLETE:
+        _mark_completed([index], session)
+
+def render_rep_counter(index: int, exercise: dict, prescription: Prescription, current_session: str) -> None:
+    """Count the reps of the selected exercise in the browser."""
+    target_reps = prescription.reps * prescription.sides
+    target_sets = max(1, prescription.sets)
+    
+    # Restart the counter when another exercise is selected, resuming stored sets
+    if st.session_state.get('rep_exercise') != index:
+        start_rep_counter(target_reps, target_sets)
+        st.session_state.rep_exercise = index
+        if index in st.session_state.completed_exercises:
+            sync_rep_counter({'event': EXERCISE_COMPLETE, 'set': target_sets})
+        else:
+            finished_sets = load_set_progress(current_session).get(index, 0)
+            st.session_state.current_set = min(finished_sets + 1, target_sets)
+    
+    st.subheader("🔢 Rep Counter")
+    rep_counter(
+        target_reps,
+        target_sets,
+        st.session_state.current_set,
+        st.session_state.current_reps,
+        key=f"rep_counter_{index}",
+        on_event=partial(_on_rep_event, index, current_session),
+        label=exercise['name']
+    )
+
+def reset_session(session: str) -> None:
+    """Clear today's progress of the session, stored and in session state."""
+    st.session_state.completed_exercises = set()
+    save_session_progress(set(), session)
+    clear_set_progress(session)
+    
+    # The rep counter and the guided timer start over
+    st.session_state.pop('rep_exercise', None)
+    reset_rep_counter()
+    st.session_state.guided_start = None
+    st.session_state.guided_paused_at = None
 
 def render():
     """Render the Mobility Protocol view."""
@@ -23,6 +154,10 @@ def render():
     current_session = get_current_session()
     exercises = get_current_exercises()
     
+    # The same exercises as catalog rows, whose prescriptions were parsed
+    # when the catalog was built
+    rows = get_catalog().session(current_session, phase=phase_number(current_phase)).to_dict("records")
+    
     # Display phase information
     st.header(f"Current: {current_phase} - {current_session.title()} Session")
     
@@ -33,39 +168,25 @@ def render():
     # Session Overview Table
     st.subheader("📋 Session Overview")
     
-    # Create the table header
-    header_cols = st.columns([0.5, 2, 1, 1, 2.5])
-    header_cols[0].markdown("**✓**")
-    header_cols[1].markdown("**Exercise**")
-    header_cols[2].markdown("**Sets/Reps**")
-    header_cols[3].markdown("**Equipment**")
-    header_cols[4].markdown("**Notes**")
-    
-    # Create table rows
-    for idx, exercise in enumerate(exercises):
-        cols = st.columns([0.5, 2, 1, 1, 2.5])
-        
-        # Checkbox column
-        is_completed = idx in st.session_state.completed_exercises
-        if cols[0].checkbox("Complete", key=f"check_{idx}", value=is_completed, label_visibility="collapsed"):
-            st.session_state.completed_exercises.add(idx)
-            save_session_progress(st.session_state.completed_exercises, current_session)
-        else:
-            if idx in st.session_state.completed_exercises:
-                st.session_state.completed_exercises.discard(idx)
-                save_session_progress(st.session_state.completed_exercises, current_session)
-        
-        # Exercise details columns
-        cols[1].markdown(exercise['name'])
-        cols[2].markdown(exercise['sets_reps'])
-        cols[3].markdown(exercise['equipment'])
-        cols[4].markdown(exercise['notes'])
+    # One editable table; storage is written only when completion changed
+    completed = checklist(
+        [exercise_row(exercise) for exercise in exercises],
+        st.session_state.completed_exercises,
+        key="mobility_checklist"
+    )
+    if completed != st.session_state.completed_exercises:
+        st.session_state.completed_exercises = completed
+        save_session_progress(completed, current_session)
     
     # Progress bar
     progress = len(st.session_state.completed_exercises) / len(exercises)
     st.progress(progress)
     st.caption(f"Completed: {len(st.session_state.completed_exercises)}/{len(exercises)} exercises")
     
+    # One timer through the whole session
+    if len(exercises) > 0:
+        render_guided_session(rows, current_session)
+    
     # Current Exercise Section
     if len(exercises) > 0:
         st.markdown("### 🎯 Current Exercise")
@@ -91,17 +212,15 @@ def render():
             if st.checkbox("Mark as complete when timer finishes", key=f"auto_{selected_exercise}"):
                 st.session_state[f"auto_complete_{selected_exercise}"] = True
         
+        # Rep counter for rep-based exercises
+        prescription = row_prescription(rows[selected_exercise])
+        if prescription.reps:
+            render_rep_counter(selected_exercise, exercise, prescription, current_session)
+        
         # Timer for current exercise
         st.subheader("⏱️ Exercise Timer")
         
-        # Parse duration from sets/reps if it contains time
-        duration_str = exercise['sets_reps'].lower()
-        if "seconds" in duration_str:
-            duration = int(duration_str.split()[0])
-        elif "mins" in duration_str or "minutes" in duration_str:
-            duration = int(duration_str.split()[0]) * 60
-        else:
-            duration = 60  # default for rep-based exercises
+        duration = prescription.seconds or DEFAULT_EXERCISE_SECONDS
         
         col1, col2 = st.columns(2)
         with col1:
@@ -121,7 +240,7 @@ def render():
     
     # Reset button
     if st.button("🔄 Reset Session"):
-        st.session_state.completed_exercises = set()
+        reset_session(current_session)
         st.rerun()
     
     # Session Guidelines
@@ -0,0 +1,132 @@
+"""Import-time benchmark and budget for the Streamlit entry points.
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter for
+each entry point, reports the cumulative import time of the module and of
+its heaviest dependencies, and fails when an entry point exceeds its budget
+or imports a module that should only load when a page needs it. A ``.py``
+entry point is run with ``runpy`` instead: ``import app`` finds the ``app``
+package, not ``app.py``.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py main_app --budget-ms 600 --repeat 5
+    python benchmarks/import_time.py app.py
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Entry point -> cumulative import budget in milliseconds (Streamlit alone
+# accounts for most of it) and modules it must not import before a page asks
+# for them. app.main builds AppState, and with it the pandas tables, up front.
+# A script's time is that of the imports its module body triggers.
+ENTRY_POINTS = {
+    "main_app": {"budget_ms": 1000, "forbidden": ("pandas", "plotly.express", "ics", "bs4")},
+    "app.main": {"budget_ms": 1500, "forbidden": ("plotly.express", "ics", "bs4")},
+    "app.py": {"budget_ms": 1000, "forbidden": ("pandas", "plotly.express", "ics", "bs4")},
+}
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+def measure_imports(module: str, python: str = sys.executable) -> Dict[str, int]:
+    """Import ``module``, or run a ``.py`` script, in a fresh interpreter.
+
+    Args:
+        module: Module to import or script path relative to the repository
+        python: Interpreter to run
+
+    Returns:
+        Cumulative import time in microseconds per imported module
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    is_script = module.endswith(".py")
+    code = f"import runpy; runpy.run_path({module!r})" if is_script else f"import {module}"
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{code} failed:\n{result.stderr[-2000:]}")
+
+    timings = {}
+    script_us = None
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        name, cumulative = match.group(4), int(match.group(2))
+        timings[name] = cumulative
+        # Top-level imports after runpy are the script's own
+        if is_script and len(match.group(3)) == 1:
+            if script_us is not None:
+                script_us += cumulative
+            elif name == "runpy":
+                script_us = 0
+    if is_script:
+        timings[module] = script_us or 0
+    return timings
+
+def benchmark(module: str, repeat: int = 3) -> Dict[str, int]:
+    """Return the fastest of ``repeat`` runs, which excludes cold disk caches."""
+    runs = [measure_imports(module) for _ in range(repeat)]
+    return min(runs, key=lambda timings: timings.get(module, 0))
+
+def check_budget(module: str, timings: Dict[str, int], budget_ms: Optional[float],
+                 forbidden: Sequence[str]) -> List[str]:
+    """Return budget violations for one entry point."""
+    problems = []
+    total_ms = timings.get(module, 0) / 1000
+    if budget_ms is not None and total_ms > budget_ms:
+        problems.append(f"{module}: {total_ms:.0f} ms exceeds the {budget_ms:.0f} ms budget")
+    for name in forbidden:
+        if name in timings:
+            problems.append(f"{module}: imports {name} at startup")
+    return problems
+
+def format_report(module: str, timings: Dict[str, int], top: int = 8) -> str:
+    """Render the slowest top-level dependencies of an entry point."""
+    roots: List[Tuple[str, int]] = [
+        (name, us) for name, us in timings.items()
+        if "." not in name and name != module
+    ]
+    roots.sort(key=lambda item: item[1], reverse=True)
+    lines = [f"{module}: {timings.get(module, 0) / 1000:.1f} ms"]
+    for name, us in roots[:top]:
+        lines.append(f"  {name:<32} {us / 1000:>8.1f} ms")
+    return "\n".join(lines)
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point; returns the process exit code."""
+    parser = argparse.ArgumentParser(description="Check entry point import times.")
+    parser.add_argument("modules", nargs="*", default=list(ENTRY_POINTS),
+                        help="Entry point modules (default: %(default)s)")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="Budget for every module (default: ENTRY_POINTS)")
+    parser.add_argument("--forbid", action="append", default=None,
+                        help="Module that must not be imported (repeatable, default: ENTRY_POINTS)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per module")
+    args = parser.parse_args(argv)
+
+    problems = []
+    for module in args.modules:
+        timings = benchmark(module, args.repeat)
+        print(format_report(module, timings))
+        defaults = ENTRY_POINTS.get(module, {})
+        budget = args.budget_ms if args.budget_ms is not None else defaults.get("budget_ms")
+        forbidden = args.forbid if args.forbid is not None else defaults.get("forbidden", ())
+        problems.extend(check_budget(module, timings, budget, forbidden))
+
+    for problem in problems:
+        print(f"FAIL {problem}")
+    return 1 if problems else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""Per-tick cost of a running timer, with and without a fragment.
+
+Before fragments, every timer refresh reran the whole page: theme CSS,
+every exercise expander and the timer. With ``st.fragment(run_every=...)``
+a refresh reruns only the timer block. Both are measured on the same page
+with Streamlit's ``AppTest``: a full run of the page script, and a rerun of
+just the fragments it registered, as the browser's ``run_every`` timer
+requests. Both include ``AppTest``'s own fixed overhead, reported as
+``empty``. The tick logic itself, without any Streamlit, is measured on
+``TimerEngine``.
+
+Usage:
+    python benchmarks/timer_tick.py
+    python benchmarks/timer_tick.py --runs 50 --phase 2
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import timeit
+from contextlib import contextmanager
+from functools import partial
+from typing import Dict, Iterator, Optional, Sequence
+
+from streamlit.logger import set_log_level
+from streamlit.testing.v1 import AppTest, local_script_runner
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from app.utils.engine import TimerEngine, TimerState
+
+_SETUP = f"""
+import sys
+sys.path.insert(0, {REPO_ROOT!r})
+import streamlit as st
+"""
+
+# The themed mobility page plus the timer; counts its full runs
+PAGE_SCRIPT = _SETUP + """
+from app.components.timer import TimerComponent
+from app.data.catalog import get_catalog
+from app.utils.theme import setup_theme
+
+st.session_state.page_runs = st.session_state.get("page_runs", 0) + 1
+setup_theme()
+catalog = get_catalog()
+for session in catalog.sessions(PHASE):
+    st.header(f"{session.title()} Routine")
+    for row in catalog.session(session, phase=PHASE).to_dict("records"):
+        with st.expander(row["Exercise"], expanded=True):
+            st.markdown(str(row["Sets/Reps/Duration"]))
+            tab1, tab2 = st.tabs(["Equipment & Notes", "How to Perform"])
+            with tab1:
+                st.markdown(str(row["Equipment"]))
+                st.markdown(str(row["Key Notes"]))
+            with tab2:
+                st.markdown("-")
+TimerComponent().render(300)
+"""
+
+EMPTY_SCRIPT = _SETUP
+
+@contextmanager
+def fragment_reruns(app: AppTest) -> Iterator[None]:
+    """Make ``app.run()`` rerun only the fragments registered so far.
+
+    ``AppTest`` has no public way to rerun a fragment, so this queues the
+    fragment IDs on its runs the way a ``run_every`` refresh does.
+
+    Raises:
+        RuntimeError: If this Streamlit's ``AppTest`` keeps no fragments
+    """
+    storage = getattr(app, "_fragment_storage", None)
+    if storage is None:
+        raise RuntimeError("This Streamlit version's AppTest cannot rerun fragments")
+    rerun_data = local_script_runner.RerunData
+    local_script_runner.RerunData = partial(rerun_data, fragment_id_queue=list(storage._fragments),
+                                            is_auto_rerun=True)
+    try:
+        yield
+    finally:
+        local_script_runner.RerunData = rerun_data
+
+def measure_script(source: str, runs: int = 20, fragment: bool = False) -> Dict[str, float]:
+    """Run a script repeatedly in ``AppTest``.
+
+    Args:
+        source: Script source
+        runs: Timed runs after one warm-up run
+        fragment: Time reruns of the script's fragments instead of full runs
+
+    Returns:
+        Median milliseconds per run and the number of top-level elements
+        the last run sent
+
+    Raises:
+        RuntimeError: If the script raises
+    """
+    app = AppTest.from_string(source, default_timeout=60)
+    app.run()
+    if app.exception:
+        raise RuntimeError(app.exception[0].message)
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        if fragment:
+            with fragment_reruns(app):
+                app.run()
+        else:
+            app.run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {"ms": statistics.median(timings), "elements": len(list(app.main))}
+
+def measure_engine(runs: int = 100000) -> float:
+    """Return microseconds per engine tick (an update plus the display)."""
+    engine = TimerEngine()
+    state = TimerState()
+    engine.start(state, 300)
+
+    def tick():
+        engine.update(state)
+        engine.display(state)
+
+    return timeit.timeit(tick, number=runs) / runs * 1e6
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point; returns the process exit code."""
+    parser = argparse.ArgumentParser(description="Measure per-tick timer cost.")
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs per script")
+    parser.add_argument("--phase", type=int, default=2, help="Mobility phase rendered on the page")
+    args = parser.parse_args(argv)
+
+    # AppTest runs outside a server, which Streamlit warns about on every run
+    set_log_level("error")
+
+    page = PAGE_SCRIPT.replace("PHASE", str(args.phase))
+    results = {
+        "full rerun": measure_script(page, args.runs),
+        "fragment": measure_script(page, args.runs, fragment=True),
+        "empty": measure_script(EMPTY_SCRIPT, args.runs)
+    }
+    for name, result in results.items():
+        print(f"{name:<12} {result['ms']:>8.1f} ms/tick {result['elements']:>5} elements")
+
+    print(f"{'engine':<12} {measure_engine() / 1000:>8.4f} ms/tick")
+
+    overhead = results["empty"]["ms"]
+    full = results["full rerun"]["ms"] - overhead
+    fragment = results["fragment"]["ms"] - overhead
+    if fragment > 0:
+        print(f"Excluding AppTest overhead a fragment tick costs {fragment:.1f} ms "
+              f"instead of {full:.1f} ms ({full / fragment:.0f}x less)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,19 @@
-"""Data modules for the Health Protocol Dashboard."""
+"""Data modules for the Health Protocol Dashboard.
 
-from .lllt_data import get_lllt_daily_data, get_supplement_data
-from .mobility_data import (
-    get_mobility_phases,
-    get_phase_details,
-    get_progress_metrics,
-    get_key_adjustments
-)
+The re-exported functions are imported on first access, so importing a
+light submodule (``data.frozen``, ``data.lllt_data``) does not load pandas
+and BeautifulSoup through ``data.mobility_data``.
+"""
+from importlib import import_module
+
+_EXPORTS = {
+    'get_lllt_daily_data': 'data.lllt_data',
+    'get_supplement_data': 'data.lllt_data',
+    'get_mobility_phases': 'data.mobility_data',
+    'get_phase_details': 'data.mobility_data',
+    'get_progress_metrics': 'data.mobility_data',
+    'get_key_adjustments': 'data.mobility_data'
+}
 
 __all__ = [
     'get_lllt_daily_data',
@@ -15,4 +22,9 @@ __all__ = [
     'get_phase_details',
     'get_progress_metrics',
     'get_key_adjustments'
-] 
\ No newline at end of file
+]
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
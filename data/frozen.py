@@ -0,0 +1,29 @@
+"""Immutable containers for module-level protocol data."""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+def freeze(value: Any) -> Any:
+    """Return a read-only copy of nested protocol data.
+    
+    Dicts become ``MappingProxyType`` views and lists become tuples, at every
+    level, so the data can be shared by all callers without copying.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+def thaw(value: Any) -> Any:
+    """Return a plain dict and list copy of frozen protocol data.
+    
+    pandas reads a ``MappingProxyType`` as a sequence of its keys rather than
+    as columns, so frozen data is thawed before it becomes a DataFrame.
+    """
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
@@ -1,6 +1,19 @@
-import pandas as pd
-from datetime import datetime
+import argparse
+import json
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+if __package__ in (None, ""):
+    # Run as a script: make the repo's top-level data package importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.html_postprocess import REPORT_FILENAME, format_size_report, postprocess_pages
+from data.mobility_data import compile_protocol_sidecar
 
 # CSS Styles
 CSS_STYLES = """
@@ -98,9 +111,9 @@ CSS_STYLES = """
 </style>
 """
 
-# Load the data
-lllt_supplements_df = pd.read_csv('data/lllt_supplements.csv')
-lllt_daily_df = pd.read_csv('data/lllt_daily.csv')
+# Default locations, relative to the repository root
+DATA_DIR = 'data'
+OUTPUT_DIR = 'data/protocols'
 
 # Foundation Phase Mobility Data (from notebook)
 foundation_mobility = [
@@ -118,7 +131,83 @@ foundation_mobility = [
     }
 ]
 
-def create_html_content(day_type, phase_name, supplements_data, mobility_data):
+# Phase matrix: every phase is rendered once per day type in lllt_daily.csv
+PHASES: Dict[str, Dict[str, Any]] = {
+    "foundation": {
+        "name": "Foundation Phase",
+        "mobility": foundation_mobility
+    },
+    "development": {
+        "name": "Development (Months 4-9)",
+        "focus": "Dynamic Control",
+        "mobility": {
+            "Key Exercises": "Primary Series Poses, Backbends",
+            "PNF Technique": "Hold-Relax-Contract",
+            "Equipment": ["Yoga Mat", "Blocks", "Strap"]
+        }
+    },
+    "advanced": {
+        "name": "Advanced (Months 10-18)",
+        "focus": "Deep Flexibility",
+        "mobility": {
+            "Key Exercises": "Advanced Asanas, Inversions",
+            "PNF Technique": "Contract-Relax-Antagonist-Contract",
+            "Equipment": ["Yoga Mat", "Blocks", "Strap", "Wall"]
+        }
+    }
+}
+
+def _mobility_table_html(exercises: List[Dict[str, str]]) -> str:
+    """Render a list of exercises as the mobility table."""
+    html_content = """
+            <table>
+                <tr>
+                    <th>Exercise</th>
+                    <th>Sets/Reps/Duration</th>
+                    <th>Equipment</th>
+                    <th>Key Notes</th>
+                </tr>
+    """
+    
+    for exercise in exercises:
+        html_content += f"""
+                <tr>
+                    <td>{exercise['Exercise']}</td>
+                    <td>{exercise['Sets/Reps/Duration']}</td>
+                    <td>{exercise['Equipment']}</td>
+                    <td>{exercise['Key Notes']}</td>
+                </tr>
+        """
+    
+    html_content += """
+            </table>"""
+    return html_content
+
+def _mobility_overview_html(overview: Dict[str, Any]) -> str:
+    """Render a phase overview (key exercises, PNF technique, equipment)."""
+    equipment_items = "".join(f"""<li>{item}</li>
+        """ for item in overview['Equipment'])
+    return f"""
+            <div class="info-box">
+                <p><strong>Key Exercises:</strong> {overview['Key Exercises']}</p>
+                <p><strong>PNF Technique:</strong> {overview['PNF Technique']}</p>
+            </div>
+            
+            <h3>Required Equipment</h3>
+            <ul class="equipment-list">
+            {equipment_items}
+            </ul>"""
+
+def create_html_content(day_type, phase_name, supplements_data, mobility_data,
+                        focus=None, updated=None):
+    """Render one protocol page.
+    
+    ``mobility_data`` is either a list of exercise rows (rendered as a table)
+    or a phase overview dict with key exercises, PNF technique and equipment.
+    """
+    updated = updated or datetime.now()
+    focus_html = f"""
+                <p><strong>Focus:</strong> {focus}</p>""" if focus else ""
     html_content = f"""
     <!DOCTYPE html>
     <html lang="en">
@@ -131,14 +220,14 @@ def create_html_content(day_type, phase_name, supplements_data, mobility_data):
     <body>
         <div class="header">
             <h1>Health Protocol - {day_type}</h1>
-            <div class="date">Last updated: {datetime.now().strftime('%B %d, %Y')}</div>
+            <div class="date">Last updated: {updated.strftime('%B %d, %Y')}</div>
         </div>
         
         <div class="section">
             <h2>Daily Overview</h2>
             <div class="info-box">
                 <p><strong>Day Type:</strong> {day_type}</p>
-                <p><strong>Phase:</strong> {phase_name}</p>
+                <p><strong>Phase:</strong> {phase_name}</p>{focus_html}
             </div>
         </div>
         
@@ -166,28 +255,14 @@ def create_html_content(day_type, phase_name, supplements_data, mobility_data):
         </div>
         
         <div class="section">
-            <h2>Mobility Exercises</h2>
-            <table>
-                <tr>
-                    <th>Exercise</th>
-                    <th>Sets/Reps/Duration</th>
-                    <th>Equipment</th>
-                    <th>Key Notes</th>
-                </tr>
-    """
+            <h2>Mobility Exercises</h2>"""
     
-    for exercise in mobility_data:
-        html_content += f"""
-                <tr>
-                    <td>{exercise['Exercise']}</td>
-                    <td>{exercise['Sets/Reps/Duration']}</td>
-                    <td>{exercise['Equipment']}</td>
-                    <td>{exercise['Key Notes']}</td>
-                </tr>
-        """
+    if isinstance(mobility_data, dict):
+        html_content += _mobility_overview_html(mobility_data)
+    else:
+        html_content += _mobility_table_html(mobility_data)
     
     html_content += """
-            </table>
         </div>
         
         <div class="section">
@@ -204,25 +279,112 @@ def create_html_content(day_type, phase_name, supplements_data, mobility_data):
     
     return html_content
 
-# Create output directory
-output_dir = 'data/protocols'
-os.makedirs(output_dir, exist_ok=True)
+def protocol_filename(phase_key: str, day_type: str) -> str:
+    """Return the output file name for a phase/day type pair."""
+    return f"{phase_key}_{day_type.lower().replace(' ', '_')}.html"
+
+def _iter_jobs(day_types: Sequence[str], phases: Sequence[str]) -> Iterator[Tuple[str, str]]:
+    """Yield (phase, day type) pairs of the requested matrix."""
+    for phase_key in phases:
+        for day_type in day_types:
+            yield phase_key, day_type
 
-# Generate HTML files for foundation phase
-for _, day in lllt_daily_df.iterrows():
-    day_type = day['Day Type']
-    
-    # Create the HTML content
-    html_content = create_html_content(
-        day_type,
-        "Foundation Phase",
-        lllt_supplements_df,
-        foundation_mobility
+def build_protocols(data_dir: str = DATA_DIR, output_dir: str = OUTPUT_DIR,
+                    phases: Optional[Sequence[str]] = None,
+                    day_types: Optional[Sequence[str]] = None,
+                    max_workers: Optional[int] = None,
+                    minify: bool = False, compress: bool = False) -> List[str]:
+    """Generate protocol pages for the phase x day type matrix.
+    
+    Every page also gets a parsed JSON sidecar (see
+    ``data.mobility_data.compile_protocol_sidecar``).
+    
+    Args:
+        data_dir: Directory containing lllt_supplements.csv and lllt_daily.csv
+        output_dir: Directory the HTML files are written to
+        phases: Phase keys to build (default: all of PHASES)
+        day_types: Day types to build (default: all rows of lllt_daily.csv)
+        max_workers: Thread pool size used to render and write pages
+        minify: Minify the written pages in place
+        compress: Write a ``.gz`` sibling next to every page
+        
+    Returns:
+        Paths of the generated files, in matrix order
+    """
+    phases = list(phases) if phases else list(PHASES)
+    unknown = [phase for phase in phases if phase not in PHASES]
+    if unknown:
+        raise ValueError(f"Unknown phases: {unknown}")
+    
+    supplements_df = pd.read_csv(os.path.join(data_dir, 'lllt_supplements.csv'))
+    if day_types is None:
+        daily_df = pd.read_csv(os.path.join(data_dir, 'lllt_daily.csv'))
+        day_types = daily_df['Day Type'].tolist()
+    
+    os.makedirs(output_dir, exist_ok=True)
+    updated = datetime.now()
+    
+    def render(job: Tuple[str, str]) -> str:
+        phase_key, day_type = job
+        phase = PHASES[phase_key]
+        html_content = create_html_content(
+            day_type,
+            phase["name"],
+            supplements_df,
+            phase["mobility"],
+            focus=phase.get("focus"),
+            updated=updated
+        )
+        filename = os.path.join(output_dir, protocol_filename(phase_key, day_type))
+        with open(filename, 'w') as f:
+            f.write(html_content)
+        return filename
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        files = list(executor.map(render, _iter_jobs(day_types, phases)))
+    
+    if minify or compress:
+        postprocess_pages(files, minify=minify, compress=compress,
+                          report_path=os.path.join(output_dir, REPORT_FILENAME))
+    
+    # Precompile the final pages so the app never parses their HTML
+    for filename in files:
+        compile_protocol_sidecar(filename)
+    
+    return files
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Command line entry point for the protocol page build."""
+    parser = argparse.ArgumentParser(description="Generate protocol HTML pages.")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="Directory with the LLLT CSV files")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR, help="Directory to write HTML files to")
+    parser.add_argument("--phase", action="append", choices=list(PHASES), dest="phases",
+                        help="Phase to build (repeatable, default: all)")
+    parser.add_argument("--day-type", action="append", dest="day_types",
+                        help="Day type to build, e.g. 'LLLT Days' (repeatable, default: all)")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker threads")
+    parser.add_argument("--minify", action="store_true", help="Minify the generated pages")
+    parser.add_argument("--gzip", action="store_true", help="Write precompressed .gz siblings")
+    args = parser.parse_args(argv)
+    
+    files = build_protocols(
+        data_dir=args.data_dir,
+        output_dir=args.output_dir,
+        phases=args.phases,
+        day_types=args.day_types,
+        max_workers=args.workers,
+        minify=args.minify,
+        compress=args.gzip
     )
     
-    # Save the file
-    filename = f"{output_dir}/foundation_{day_type.lower().replace(' ', '_')}.html"
-    with open(filename, 'w') as f:
-        f.write(html_content)
+    print(f"Generated {len(files)} protocol files in {args.output_dir}:")
+    for file in files:
+        print(f"- {file}")
+    
+    if args.minify or args.gzip:
+        with open(os.path.join(args.output_dir, REPORT_FILENAME)) as f:
+            print()
+            print(format_size_report(json.load(f)))
 
-print("HTML files have been generated for the Foundation Phase in the data/protocols directory.") 
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Post-processing for generated protocol pages: minification, gzip and size report."""
+
+import gzip
+import json
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+# Blocks whose content needs its own treatment (or none at all)
+_RAW_BLOCK_RE = re.compile(
+    r"(<(pre|textarea|script|style)\b[^>]*>.*?</\2\s*>)",
+    re.IGNORECASE | re.DOTALL
+)
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_PUNCT_RE = re.compile(r"\s*([{};,>])\s*")
+_INDENT_BETWEEN_TAGS_RE = re.compile(r">\s*\n\s*<")
+_LEADING_INDENT_RE = re.compile(r"^\s*\n\s*(?=<)")
+_TRAILING_INDENT_RE = re.compile(r"(?<=>)\s*\n\s*$")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+REPORT_FILENAME = "size_report.json"
+
+def _minify_css(css: str) -> str:
+    """Drop comments and insignificant whitespace from a stylesheet."""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _WHITESPACE_RE.sub(" ", css)
+    css = _CSS_PUNCT_RE.sub(r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+def _minify_script(script: str) -> str:
+    """Strip indentation and blank lines, keeping line breaks for ASI safety."""
+    lines = (line.strip() for line in script.splitlines())
+    return "\n".join(line for line in lines if line)
+
+def _minify_block(block: str, tag: str) -> str:
+    """Minify the body of a raw block while keeping its tags intact."""
+    tag = tag.lower()
+    if tag in ("pre", "textarea"):
+        return block
+    open_end = block.index(">") + 1
+    close_start = block.lower().rindex("</")
+    body = block[open_end:close_start]
+    body = _minify_css(body) if tag == "style" else _minify_script(body)
+    return block[:open_end] + body + block[close_start:]
+
+def _minify_markup(markup: str) -> str:
+    """Remove indentation between tags and collapse remaining whitespace.
+
+    Segments are delimited by raw blocks, so indentation at either end sits
+    next to a tag as well.
+    """
+    markup = _INDENT_BETWEEN_TAGS_RE.sub("><", markup)
+    markup = _LEADING_INDENT_RE.sub("", markup)
+    markup = _TRAILING_INDENT_RE.sub("", markup)
+    return _WHITESPACE_RE.sub(" ", markup)
+
+def minify_html(html: str) -> str:
+    """Return ``html`` without indentation and redundant whitespace.
+
+    Whitespace that only indents markup across lines is removed; other runs
+    collapse to a single space. Inline CSS is compacted, scripts lose their
+    indentation and ``<pre>``/``<textarea>`` content is left untouched.
+    """
+    parts = []
+    last = 0
+    for match in _RAW_BLOCK_RE.finditer(html):
+        parts.append(_minify_markup(html[last:match.start()]))
+        parts.append(_minify_block(match.group(1), match.group(2)))
+        last = match.end()
+    parts.append(_minify_markup(html[last:]))
+    return "".join(parts).strip()
+
+def write_gzip(path: str, data: bytes) -> str:
+    """Write ``data`` to a ``.gz`` sibling of ``path`` and return its path.
+
+    The gzip header mtime is fixed so unchanged pages produce identical files.
+    """
+    gz_path = f"{path}.gz"
+    with open(gz_path, "wb") as f:
+        with gzip.GzipFile(filename="", mode="wb", fileobj=f, compresslevel=9, mtime=0) as gz:
+            gz.write(data)
+    return gz_path
+
+def postprocess_pages(paths: Iterable[str], minify: bool = True, compress: bool = True,
+                      report_path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Minify and/or precompress generated files in place.
+
+    Args:
+        paths: Files to process
+        minify: Rewrite each HTML file with minified markup
+        compress: Write a ``.gz`` sibling next to each file
+        report_path: Optional JSON file receiving the per-page size report
+
+    Returns:
+        One report entry per page with original, minified and gzip byte sizes
+    """
+    report = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+        original_bytes = len(html.encode("utf-8"))
+
+        if minify and path.endswith(".html"):
+            html = minify_html(html)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(html)
+        data = html.encode("utf-8")
+
+        entry = {
+            "page": os.path.basename(path),
+            "original_bytes": original_bytes,
+            "minified_bytes": len(data),
+            "gzip_bytes": None,
+            "saved_bytes": original_bytes - len(data)
+        }
+        if compress:
+            gz_path = write_gzip(path, data)
+            entry["gzip_bytes"] = os.path.getsize(gz_path)
+            entry["saved_bytes"] = original_bytes - entry["gzip_bytes"]
+        entry["saved_percent"] = round(100 * entry["saved_bytes"] / original_bytes, 1) if original_bytes else 0.0
+        report.append(entry)
+
+    if report_path:
+        with open(report_path, "w") as f:
+            json.dump(report, f, indent=2)
+
+    return report
+
+def format_size_report(report: List[Dict[str, Any]]) -> str:
+    """Render a size report as a plain text table."""
+    lines = [f"{'Page':<32} {'Original':>10} {'Minified':>10} {'Gzip':>10} {'Saved':>8}"]
+    for entry in report:
+        gzip_bytes = entry["gzip_bytes"] if entry["gzip_bytes"] is not None else "-"
+        lines.append(
+            f"{entry['page']:<32} {entry['original_bytes']:>10} {entry['minified_bytes']:>10} "
+            f"{gzip_bytes:>10} {entry['saved_percent']:>7}%"
+        )
+    total_original = sum(entry["original_bytes"] for entry in report)
+    total_saved = sum(entry["saved_bytes"] for entry in report)
+    lines.append(f"Total: {total_saved} of {total_original} bytes saved")
+    return "\n".join(lines)
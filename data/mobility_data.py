@@ -1,13 +1,29 @@
 """Mobility protocol data and schedules."""
 
 import pandas as pd
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 from bs4 import BeautifulSoup
+import json
 import os
+import threading
+
+PROTOCOLS_DIR = "data/protocols"
+
+# Parsed protocol documents keyed by (path, mtime_ns, size)
+_protocol_cache: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+_protocol_cache_lock = threading.Lock()
+
+def protocol_path(protocol_type: str = "foundation", day_type: str = "lllt_days") -> str:
+    """Return the path of a protocol HTML file."""
+    return os.path.join(PROTOCOLS_DIR, f"{protocol_type}_{day_type}.html")
+
+def sidecar_path(html_path: str) -> str:
+    """Return the JSON sidecar path of a protocol HTML file."""
+    return os.path.splitext(html_path)[0] + ".json"
 
 def load_protocol_html(protocol_type: str = "foundation", day_type: str = "lllt_days") -> str:
     """Load protocol HTML file."""
-    file_path = f"data/protocols/{protocol_type}_{day_type}.html"
+    file_path = protocol_path(protocol_type, day_type)
     with open(file_path, 'r') as f:
         return f.read()
 
@@ -49,10 +65,75 @@ def parse_protocol_html(html_content: str) -> Dict[str, Any]:
     
     return protocol_data
 
+def compile_protocol_sidecar(html_path: str) -> Dict[str, Any]:
+    """Parse a protocol HTML file once and store the result in its JSON sidecar.
+    
+    Args:
+        html_path: Protocol HTML file
+        
+    Returns:
+        The parsed protocol data
+    """
+    stat = os.stat(html_path)
+    with open(html_path, 'r') as f:
+        protocol_data = parse_protocol_html(f.read())
+    
+    with open(sidecar_path(html_path), 'w') as f:
+        json.dump({
+            "source_mtime_ns": stat.st_mtime_ns,
+            "source_size": stat.st_size,
+            "protocol": protocol_data
+        }, f, indent=2)
+    return protocol_data
+
+def _load_sidecar(html_path: str, stat: os.stat_result) -> Dict[str, Any]:
+    """Return the sidecar data if it was compiled from the current HTML file."""
+    try:
+        with open(sidecar_path(html_path), 'r') as f:
+            sidecar = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if (sidecar.get("source_mtime_ns"), sidecar.get("source_size")) != (stat.st_mtime_ns, stat.st_size):
+        return {}
+    return sidecar.get("protocol", {})
+
+def load_protocol(protocol_type: str = "foundation", day_type: str = "lllt_days") -> Dict[str, Any]:
+    """Load parsed protocol data without re-parsing unchanged HTML.
+    
+    Parsed documents are cached per process by path, mtime and size. On a
+    cache miss the JSON sidecar is used if it matches the HTML file;
+    otherwise the HTML is parsed and the sidecar recompiled.
+    
+    Returns:
+        Protocol data with ``supplements`` and ``exercises`` lists; the lists
+        are copies and may be modified by the caller
+    """
+    html_path = protocol_path(protocol_type, day_type)
+    stat = os.stat(html_path)
+    key = (os.path.abspath(html_path), stat.st_mtime_ns, stat.st_size)
+    
+    with _protocol_cache_lock:
+        protocol_data = _protocol_cache.get(key)
+    
+    if protocol_data is None:
+        protocol_data = _load_sidecar(html_path, stat)
+        if not protocol_data:
+            try:
+                protocol_data = compile_protocol_sidecar(html_path)
+            except OSError:
+                # Read-only data directory; the per-process cache still applies
+                with open(html_path, 'r') as f:
+                    protocol_data = parse_protocol_html(f.read())
+        with _protocol_cache_lock:
+            for stale in [k for k in _protocol_cache if k[0] == key[0]]:
+                del _protocol_cache[stale]
+            _protocol_cache[key] = protocol_data
+    
+    return {name: [dict(row) for row in rows] for name, rows in protocol_data.items()}
+
 def get_current_protocol() -> Dict[str, Any]:
     """Get current protocol data."""
-    html_content = load_protocol_html()
-    return parse_protocol_html(html_content)
+    return load_protocol()
 
 def get_phase_details(phase_name: str) -> Dict[str, Any]:
     """Get details for a specific phase from the CSV data."""
@@ -80,68 +161,70 @@ def get_supplements() -> List[Dict[str, str]]:
     protocol = get_current_protocol()
     return protocol["supplements"]
 
+# Exercise details by name, built once at import
+EXERCISE_DETAILS = {
+    # Phase 1 exercises
+    "Hip Mobility": {
+        "sets_reps": "3 sets x 10 reps each side",
+        "equipment": "None",
+        "notes": "Focus on controlled movement",
+        "duration": "60 seconds"
+    },
+    "Shoulder Mobility": {
+        "sets_reps": "3 sets x 8 reps each side",
+        "equipment": "Resistance band",
+        "notes": "Full range of motion",
+        "duration": "60 seconds"
+    },
+    "Spine Mobility": {
+        "sets_reps": "2 sets x 10 reps",
+        "equipment": "Yoga mat",
+        "notes": "Keep movements smooth",
+        "duration": "60 seconds"
+    },
+    # Phase 2 exercises
+    "Plank with Rotation": {
+        "sets_reps": "3 sets x 30 seconds",
+        "equipment": "Yoga mat",
+        "notes": "Keep core engaged",
+        "duration": "30 seconds"
+    },
+    "Bird Dog": {
+        "sets_reps": "3 sets x 10 each side",
+        "equipment": "Yoga mat",
+        "notes": "Maintain alignment",
+        "duration": "45 seconds"
+    },
+    "Dead Bug": {
+        "sets_reps": "3 sets x 10 reps",
+        "equipment": "Yoga mat",
+        "notes": "Press lower back down",
+        "duration": "45 seconds"
+    },
+    # Phase 3 exercises
+    "Yoga Flow": {
+        "sets_reps": "2 sets x 5 minutes",
+        "equipment": "Yoga mat",
+        "notes": "Flow with breath",
+        "duration": "300 seconds"
+    },
+    "Animal Flow": {
+        "sets_reps": "2 sets x 3 minutes",
+        "equipment": "None",
+        "notes": "Smooth transitions",
+        "duration": "180 seconds"
+    },
+    "Mobility Sequence": {
+        "sets_reps": "1 set x 10 minutes",
+        "equipment": "None",
+        "notes": "Combine movements",
+        "duration": "600 seconds"
+    }
+}
+
 def get_exercise_details(exercise_name: str) -> Dict[str, Any]:
     """Get details for a specific exercise."""
-    exercise_details = {
-        # Phase 1 exercises
-        "Hip Mobility": {
-            "sets_reps": "3 sets x 10 reps each side",
-            "equipment": "None",
-            "notes": "Focus on controlled movement",
-            "duration": "60 seconds"
-        },
-        "Shoulder Mobility": {
-            "sets_reps": "3 sets x 8 reps each side",
-            "equipment": "Resistance band",
-            "notes": "Full range of motion",
-            "duration": "60 seconds"
-        },
-        "Spine Mobility": {
-            "sets_reps": "2 sets x 10 reps",
-            "equipment": "Yoga mat",
-            "notes": "Keep movements smooth",
-            "duration": "60 seconds"
-        },
-        # Phase 2 exercises
-        "Plank with Rotation": {
-            "sets_reps": "3 sets x 30 seconds",
-            "equipment": "Yoga mat",
-            "notes": "Keep core engaged",
-            "duration": "30 seconds"
-        },
-        "Bird Dog": {
-            "sets_reps": "3 sets x 10 each side",
-            "equipment": "Yoga mat",
-            "notes": "Maintain alignment",
-            "duration": "45 seconds"
-        },
-        "Dead Bug": {
-            "sets_reps": "3 sets x 10 reps",
-            "equipment": "Yoga mat",
-            "notes": "Press lower back down",
-            "duration": "45 seconds"
-        },
-        # Phase 3 exercises
-        "Yoga Flow": {
-            "sets_reps": "2 sets x 5 minutes",
-            "equipment": "Yoga mat",
-            "notes": "Flow with breath",
-            "duration": "300 seconds"
-        },
-        "Animal Flow": {
-            "sets_reps": "2 sets x 3 minutes",
-            "equipment": "None",
-            "notes": "Smooth transitions",
-            "duration": "180 seconds"
-        },
-        "Mobility Sequence": {
-            "sets_reps": "1 set x 10 minutes",
-            "equipment": "None",
-            "notes": "Combine movements",
-            "duration": "600 seconds"
-        }
-    }
-    return exercise_details.get(exercise_name, {})
+    return dict(EXERCISE_DETAILS.get(exercise_name, {}))
 
 def get_mobility_phases() -> Dict[str, List[Dict[str, Any]]]:
     """Return mobility exercise phases."""
@@ -0,0 +1,154 @@
+"""Local static server for the generated protocol pages.
+
+Serves a protocols directory with content-hash ETags, ``If-None-Match``
+revalidation, precompressed ``.gz`` siblings for clients that accept gzip and
+long-lived cache headers for content-hashed assets.
+"""
+
+import argparse
+import email.utils
+import hashlib
+import os
+import re
+import threading
+from functools import partial
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Sequence, Tuple
+
+DEFAULT_DIRECTORY = 'data/protocols'
+
+# Assets carrying a content hash in their name, e.g. search.3f2a9c1b.js
+HASHED_ASSET_RE = re.compile(r"\.[0-9a-f]{8,}\.[A-Za-z0-9]+$")
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+
+class ETagCache:
+    """Content-hash ETags, recomputed only when a file's mtime or size changes."""
+
+    def __init__(self):
+        self._etags: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: str, stat: os.stat_result) -> str:
+        """Return the quoted ETag for ``path``."""
+        with self._lock:
+            cached = self._etags.get(path)
+            if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                return cached[2]
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(partial(f.read, 65536), b''):
+                digest.update(chunk)
+        etag = f'"{digest.hexdigest()[:32]}"'
+
+        with self._lock:
+            self._etags[path] = (stat.st_mtime_ns, stat.st_size, etag)
+        return etag
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Check whether an Accept-Encoding header allows a gzip response."""
+    for coding in accept_encoding.split(','):
+        name, _, params = coding.strip().partition(';')
+        if name.strip().lower() in ('gzip', '*'):
+            q = params.strip().replace(' ', '')
+            return q not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000')
+    return False
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against ``etag`` (weak comparison)."""
+    if if_none_match.strip() == '*':
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(','))
+    return any(tag.removeprefix('W/') == etag for tag in candidates)
+
+def cache_control(path: str) -> str:
+    """Return the Cache-Control value for a served file."""
+    return IMMUTABLE_CACHE if HASHED_ASSET_RE.search(os.path.basename(path)) else REVALIDATE_CACHE
+
+class ProtocolRequestHandler(SimpleHTTPRequestHandler):
+    """Request handler adding ETag, gzip negotiation and cache headers."""
+
+    etag_cache = ETagCache()
+
+    def send_head(self):
+        """Send response headers and return the file to copy, if any."""
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            index = os.path.join(path, 'index.html')
+            if not self.path.split('?', 1)[0].endswith('/') or not os.path.isfile(index):
+                # Redirects and directory listings are handled upstream
+                return super().send_head()
+            path = index
+
+        if not os.path.isfile(path):
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        served_path = path
+        gz_path = f"{path}.gz"
+        if accepts_gzip(self.headers.get('Accept-Encoding', '')) and os.path.isfile(gz_path):
+            served_path = gz_path
+
+        stat = os.stat(served_path)
+        etag = self.etag_cache.get(served_path, stat)
+
+        if etag_matches(self.headers.get('If-None-Match', ''), etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._send_cache_headers(path, etag)
+            self.end_headers()
+            return None
+
+        try:
+            f = open(served_path, 'rb')
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', self.guess_type(path))
+        self.send_header('Content-Length', str(stat.st_size))
+        if served_path == gz_path:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Last-Modified', email.utils.formatdate(stat.st_mtime, usegmt=True))
+        self._send_cache_headers(path, etag)
+        self.end_headers()
+        return f
+
+    def _send_cache_headers(self, path: str, etag: str) -> None:
+        """Send the validator and caching headers shared by 200 and 304."""
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', cache_control(path))
+        self.send_header('Vary', 'Accept-Encoding')
+
+def create_server(directory: str = DEFAULT_DIRECTORY, host: str = '127.0.0.1',
+                  port: int = 8000) -> ThreadingHTTPServer:
+    """Create (but do not start) a server for ``directory``."""
+    if not os.path.isdir(directory):
+        raise FileNotFoundError(f"Protocols directory not found: {directory}")
+    handler = partial(ProtocolRequestHandler, directory=os.path.abspath(directory))
+    return ThreadingHTTPServer((host, port), handler)
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Command line entry point for the protocol server."""
+    parser = argparse.ArgumentParser(description="Serve generated protocol pages.")
+    parser.add_argument("--directory", "-d", default=DEFAULT_DIRECTORY,
+                        help="Generated protocols directory")
+    parser.add_argument("--bind", "-b", default="127.0.0.1",
+                        help="Address to bind (use 0.0.0.0 to reach it from a phone)")
+    parser.add_argument("--port", "-p", type=int, default=8000, help="Port to listen on")
+    args = parser.parse_args(argv)
+
+    server = create_server(args.directory, args.bind, args.port)
+    host, port = server.server_address[:2]
+    print(f"Serving {args.directory} at http://{host}:{port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down.")
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""Prebuilt client-side search index for the generated protocol site.
+
+The index is written as a small content-hashed script that assigns
+``window.PROTOCOL_SEARCH_INDEX``, so it works from ``file://`` as well as
+from a server and can be cached forever. ``SEARCH_BOX_HTML`` carries the
+search field and the script that queries it in the browser; the script
+drops the same stop words and one-character terms as ``tokenize``.
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence
+
+INDEX_SCRIPT_PREFIX = "search_index"
+
+# Words too common in the protocol notes to be useful search terms
+STOP_WORDS = frozenset({
+    "a", "an", "and", "as", "at", "by", "for", "from", "if", "in", "into",
+    "is", "of", "on", "or", "the", "to", "with"
+})
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+def tokenize(text: Any) -> List[str]:
+    """Split text into lowercase search terms."""
+    if not isinstance(text, str):
+        return []
+    return [
+        token for token in _TOKEN_RE.findall(text.lower())
+        if len(token) > 1 and token not in STOP_WORDS
+    ]
+
+def build_search_index(records: Iterable[Dict[str, Any]],
+                       fields: Sequence[str] = ("name", "equipment", "notes")) -> Dict[str, Any]:
+    """Build a compact inverted index.
+
+    Args:
+        records: Dicts with ``name``, ``label`` and ``href`` plus the indexed fields
+        fields: Record fields whose terms are indexed
+
+    Returns:
+        ``docs`` as ``[name, label, href]`` rows, a sorted ``terms`` list and
+        ``postings`` holding the sorted doc ids of each term
+    """
+    docs = []
+    postings: Dict[str, set] = {}
+    for doc_id, record in enumerate(records):
+        docs.append([record["name"], record["label"], record["href"]])
+        for field in fields:
+            for term in tokenize(record.get(field)):
+                postings.setdefault(term, set()).add(doc_id)
+
+    terms = sorted(postings)
+    return {
+        "docs": docs,
+        "terms": terms,
+        "postings": [sorted(postings[term]) for term in terms]
+    }
+
+def write_search_index(index: Dict[str, Any], output_dir: Path) -> str:
+    """Write the index script into ``output_dir`` and return its file name.
+
+    The file name carries a hash of the content; stale index scripts from
+    earlier builds are removed.
+    """
+    payload = json.dumps(index, separators=(",", ":"))
+    script = f"window.PROTOCOL_SEARCH_INDEX={payload};\n"
+    digest = hashlib.sha256(script.encode("utf-8")).hexdigest()[:12]
+    filename = f"{INDEX_SCRIPT_PREFIX}.{digest}.js"
+
+    output_dir = Path(output_dir)
+    for stale in output_dir.glob(f"{INDEX_SCRIPT_PREFIX}.*.js"):
+        if stale.name != filename:
+            stale.unlink()
+    (output_dir / filename).write_text(script, encoding="utf-8")
+    return filename
+
+SEARCH_BOX_HTML = """
+        <div class="protocol-search">
+            <style>
+                .protocol-search input {
+                    width: 100%;
+                    box-sizing: border-box;
+                    padding: 12px 15px;
+                    font-size: 1.1em;
+                    border: 2px solid var(--secondary-color);
+                    border-radius: 5px;
+                }
+                .protocol-search ul {
+                    list-style: none;
+                    padding: 0;
+                }
+                .protocol-search li {
+                    padding: 8px 0;
+                    border-bottom: 1px solid var(--border-color);
+                }
+                .protocol-search li span {
+                    color: #666;
+                    font-size: 0.9em;
+                }
+            </style>
+            <input id="protocol-search" type="search" placeholder="Search exercises, equipment, notes..." autocomplete="off">
+            <ul id="protocol-search-results"></ul>
+            <script src="{index_script}"></script>
+            <script>
+                (function () {
+                    var index = window.PROTOCOL_SEARCH_INDEX;
+                    var input = document.getElementById("protocol-search");
+                    var results = document.getElementById("protocol-search-results");
+                    var stopWords = {stop_words};
+                    if (!index) {
+                        return;
+                    }
+                    function firstTermFrom(prefix) {
+                        var lo = 0, hi = index.terms.length;
+                        while (lo < hi) {
+                            var mid = (lo + hi) >> 1;
+                            if (index.terms[mid] < prefix) {
+                                lo = mid + 1;
+                            } else {
+                                hi = mid;
+                            }
+                        }
+                        return lo;
+                    }
+                    function docsMatching(prefix) {
+                        var ids = {};
+                        for (var i = firstTermFrom(prefix); i < index.terms.length && index.terms[i].lastIndexOf(prefix, 0) === 0; i++) {
+                            index.postings[i].forEach(function (id) {
+                                ids[id] = true;
+                            });
+                        }
+                        return ids;
+                    }
+                    input.addEventListener("input", function () {
+                        var tokens = (input.value.toLowerCase().match(/[a-z0-9]+/g) || []).filter(function (token) {
+                            return token.length > 1 && stopWords.indexOf(token) === -1;
+                        });
+                        var hits = null;
+                        results.textContent = "";
+                        tokens.forEach(function (token) {
+                            var ids = docsMatching(token);
+                            if (hits === null) {
+                                hits = ids;
+                                return;
+                            }
+                            Object.keys(hits).forEach(function (id) {
+                                if (!ids[id]) {
+                                    delete hits[id];
+                                }
+                            });
+                        });
+                        Object.keys(hits || {}).slice(0, 50).forEach(function (id) {
+                            var doc = index.docs[id];
+                            var item = document.createElement("li");
+                            var link = document.createElement("a");
+                            var label = document.createElement("span");
+                            link.href = doc[2];
+                            link.textContent = doc[0];
+                            label.textContent = " " + doc[1];
+                            item.appendChild(link);
+                            item.appendChild(label);
+                            results.appendChild(item);
+                        });
+                    });
+                })();
+            </script>
+        </div>
+"""
+
+def search_box_html(index_script: str) -> str:
+    """Return the search field markup wired to ``index_script``."""
+    return (SEARCH_BOX_HTML
+            .replace("{index_script}", index_script)
+            .replace("{stop_words}", json.dumps(sorted(STOP_WORDS))))
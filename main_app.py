@@ -1,10 +1,8 @@
 import streamlit as st
-import plotly.express as px
-import pandas as pd
 from datetime import datetime
 
-# Import views
-from app.views import render_mobility, render_lllt
+# Views, pandas and plotly are imported where they are first needed so a cold
+# start only loads what the selected page uses (see benchmarks/import_time.py)
 
 # Import data functions
 from app.data import (
@@ -13,6 +11,12 @@ from app.data import (
     get_current_exercises
 )
 
+# Import components
+from app.components.checklist import checklist, exercise_row
+
+# Import theme utilities
+from app.utils.theme import link_stylesheet
+
 # Import storage utilities
 from app.utils.storage import (
     load_session_progress,
@@ -35,33 +39,15 @@ def render_current_session():
     
     st.subheader(f"Current Session: {current_phase} - {current_session.title()}")
     
-    # Create the table header
-    header_cols = st.columns([0.5, 2, 1, 1, 2.5])
-    header_cols[0].markdown("**✓**")
-    header_cols[1].markdown("**Exercise**")
-    header_cols[2].markdown("**Sets/Reps**")
-    header_cols[3].markdown("**Equipment**")
-    header_cols[4].markdown("**Notes**")
-    
-    # Create table rows
-    for idx, exercise in enumerate(exercises):
-        cols = st.columns([0.5, 2, 1, 1, 2.5])
-        
-        # Checkbox column
-        is_completed = idx in st.session_state.completed_exercises
-        if cols[0].checkbox("Complete", key=f"home_check_{idx}", value=is_completed, label_visibility="collapsed"):
-            st.session_state.completed_exercises.add(idx)
-            save_session_progress(st.session_state.completed_exercises, current_session)
-        else:
-            if idx in st.session_state.completed_exercises:
-                st.session_state.completed_exercises.discard(idx)
-                save_session_progress(st.session_state.completed_exercises, current_session)
-        
-        # Exercise details columns
-        cols[1].markdown(exercise['name'])
-        cols[2].markdown(exercise['sets_reps'])
-        cols[3].markdown(exercise['equipment'])
-        cols[4].markdown(exercise['notes'])
+    # One editable table; storage is written only when completion changed
+    completed = checklist(
+        [exercise_row(exercise) for exercise in exercises],
+        st.session_state.completed_exercises,
+        key="home_checklist"
+    )
+    if completed != st.session_state.completed_exercises:
+        st.session_state.completed_exercises = completed
+        save_session_progress(completed, current_session)
     
     # Progress bar
     progress = len(st.session_state.completed_exercises) / len(exercises)
@@ -79,6 +65,9 @@ def render_progress_history():
         st.info("No progress history available yet. Complete some exercises to see your progress!")
         return
     
+    import pandas as pd
+    import plotly.express as px
+    
     # Show current streak
     st.metric("🔥 Current Streak", f"{stats['streak']} days")
     
@@ -145,28 +134,12 @@ def main():
         layout="wide"
     )
     
-    # Add custom CSS for mobile responsiveness
-    st.markdown("""
-        <style>
-        /* Make the layout more responsive */
-        @media (max-width: 768px) {
-            .main .block-container {
-                padding-left: 1rem;
-                padding-right: 1rem;
-            }
-            /* Adjust column widths for mobile */
-            div[data-testid="column"] {
-                width: 100% !important;
-                flex: 1 1 auto !important;
-                min-width: auto !important;
-            }
-            /* Make sidebar collapsible on mobile */
-            .css-1d391kg {
-                width: auto !important;
-            }
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    # Mobile responsiveness; a cached stylesheet, so reruns carry no CSS
+    link_stylesheet("main_app.css")
+    
+    # Refresh cached protocol data when its files change
+    from app.data.watcher import data_watcher
+    data_watcher.start()
     
     st.title("Health Protocol App")
     
@@ -184,10 +157,12 @@ def main():
             label_visibility="collapsed"
         )
     
-    # Render the selected view
+    # Render the selected view, importing only that view
     if page == "LLLT Session":
+        from app.views.lllt_view import render as render_lllt
         render_lllt()
     elif page == "Mobility Training":
+        from app.views.mobility_view import render as render_mobility
         render_mobility()
     else:  # Home
         render_progress_history()
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from typing import List, Dict, Any
 import pandas as pd
 import os
+
+from data.frozen import thaw
 from .base import BaseProtocol
 
 @dataclass
@@ -14,9 +16,9 @@ class LLLTProtocol(BaseProtocol):
     def to_dataframe(self) -> Dict[str, pd.DataFrame]:
         """Convert LLLT data to DataFrames"""
         return {
-            'daily': pd.DataFrame(self.daily_schedule),
-            'supplements': pd.DataFrame(self.supplement_schedule),
-            'weekly': pd.DataFrame(self.weekly_schedule)
+            'daily': pd.DataFrame(thaw(self.daily_schedule)),
+            'supplements': pd.DataFrame(thaw(self.supplement_schedule)),
+            'weekly': pd.DataFrame(thaw(self.weekly_schedule))
         }
     
     def validate(self) -> bool:
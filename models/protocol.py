@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 import pandas as pd
 
+from data.frozen import thaw
+
 @dataclass
 class Protocol:
     """Base class for all health protocols"""
@@ -24,8 +26,8 @@ class LLLTProtocol(Protocol):
     
     def to_dataframe(self) -> Dict[str, pd.DataFrame]:
         """Convert LLLT data to DataFrames"""
-        daily_df = pd.DataFrame(self.daily_schedule)
-        supplement_df = pd.DataFrame(self.supplement_schedule)
+        daily_df = pd.DataFrame(thaw(self.daily_schedule))
+        supplement_df = pd.DataFrame(thaw(self.supplement_schedule))
         
         return {
             'daily': daily_df,
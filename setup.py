@@ -27,6 +27,8 @@ setup(
     entry_points={
         "console_scripts": [
             "health-protocol=app.main:main",
+            "health-protocol-build=data.html_generator:main",
+            "health-protocol-serve=data.protocol_server:main",
         ],
     },
     author="Daniel Fugisawa",
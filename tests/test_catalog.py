@@ -0,0 +1,78 @@
+"""Tests for the long-format protocol catalog."""
+from app.data.catalog import EVERY_DAY, LLLT_DAY_TYPE, UNPHASED, build_catalog, row_prescription
+from app.data.health import get_phase_exercises
+from app.utils.duration import parse_prescription
+
+def write_table(path, header, rows):
+    lines = [header] + [",".join(row) for row in rows]
+    path.write_text("\n".join(lines) + "\n")
+
+def exercise(name, sets_reps, equipment, notes=""):
+    return {"name": name, "sets_reps": sets_reps, "equipment": equipment, "notes": notes}
+
+# Exercise dicts by phase and session, as in app.data.health
+MOBILITY = {
+    2: {"pre_bed": [exercise("Hero Pose", "2x60s", "Yoga chair")]},
+    1: {"pre_bed": [exercise("Legs Up Wall", "5 mins", "Wall")],
+        "morning": [exercise("Cat-Cow", "2 mins", "Mat", "Breathe"),
+                    exercise("Wall Angels", "60 seconds", "Wall")]}
+}
+
+def write_protocols(data_dir):
+    write_table(data_dir / "lllt_days_df.csv", "Session,Target,Device Mode,Time,Body Area",
+                [("Evening", "Body", "Pulsating", "10 mins", "Muscles"),
+                 ("Morning", "Hair", "Pulsating", "15 mins", "Scalp")])
+
+def test_catalog_index_is_sorted_and_categorical(tmp_path):
+    write_protocols(tmp_path)
+    catalog = build_catalog(tmp_path, MOBILITY)
+
+    assert catalog.frame.index.names == ["protocol", "phase", "session"]
+    assert catalog.frame.index.is_monotonic_increasing
+    assert catalog.frame["Equipment"].dtype == "category"
+    assert catalog.phases() == (1, 2)
+    assert catalog.sessions(1) == ("morning", "prebed")
+    assert catalog.sessions(UNPHASED, protocol="lllt") == ("morning", "evening")
+
+def test_catalog_slices(tmp_path):
+    write_protocols(tmp_path)
+    catalog = build_catalog(tmp_path, MOBILITY)
+
+    morning = catalog.session("Morning", phase=1)
+    assert list(morning["Exercise"]) == ["Cat-Cow", "Wall Angels"]
+    assert list(morning.index) == [0, 1]
+    assert list(catalog.phase(2)["Exercise"]) == ["Hero Pose"]
+    assert catalog.session("pre_bed", phase=1).loc[0, "Sets/Reps/Duration"] == "5 mins"
+    assert catalog.session("lunch", phase=1).empty
+    assert catalog.phase(9).empty
+    assert catalog.count("mobility") == 4
+    assert catalog.count("lllt") == 2
+
+    lllt_day = catalog.day_type(LLLT_DAY_TYPE)
+    assert len(lllt_day) == 6
+    assert set(catalog.day_type("Rest Days")["Day Type"]) == {EVERY_DAY}
+    assert catalog.session("evening", phase=UNPHASED, protocol="lllt").loc[0, "Exercise"] == "Muscles"
+
+def test_catalog_stores_parsed_prescriptions(tmp_path):
+    write_protocols(tmp_path)
+    catalog = build_catalog(tmp_path, MOBILITY)
+
+    morning = catalog.session("morning", phase=1)
+    assert list(morning["Seconds"]) == [120, 60]
+    assert catalog.phase(2).iloc[0][["Sets", "Set Seconds", "Sides", "Seconds"]].tolist() == [2, 60, 1, 120]
+    assert catalog.session("morning", phase=UNPHASED, protocol="lllt").loc[0, "Seconds"] == 900
+
+def test_row_prescription_reads_the_parsed_columns(tmp_path):
+    write_protocols(tmp_path)
+    catalog = build_catalog(tmp_path, MOBILITY)
+
+    row = catalog.phase(2).iloc[0]
+    assert row_prescription(row) == parse_prescription("2x60s")
+
+def test_default_catalog_holds_the_exercises_the_views_show():
+    catalog = build_catalog()
+
+    for phase in catalog.phases():
+        for session in ("morning", "lunch", "pre_bed"):
+            exercises = get_phase_exercises(f"Phase {phase}", session)
+            assert list(catalog.session(session, phase=phase)["Exercise"]) == [e["name"] for e in exercises]
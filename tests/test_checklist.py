@@ -0,0 +1,40 @@
+"""Tests for the exercise checklist table."""
+import streamlit as st
+
+from app.components.checklist import DONE_COLUMN, checklist, exercise_row
+
+EXERCISES = [
+    {"name": "Cat-Cow", "sets_reps": "2 mins", "equipment": "Mat", "notes": "Breathe"},
+    {"name": "Wall Angels", "sets_reps": "10 reps", "equipment": "Wall", "notes": ""},
+    {"name": "Hero Pose", "sets_reps": "2x60s", "equipment": "Yoga chair", "notes": ""}
+]
+
+def test_checklist_returns_ticked_rows(monkeypatch):
+    calls = []
+
+    def data_editor(table, **kwargs):
+        calls.append((table.copy(), kwargs))
+        # The user ticks Hero Pose and unticks Cat-Cow
+        table[DONE_COLUMN] = [False, False, True]
+        return table
+
+    monkeypatch.setattr(st, "data_editor", data_editor)
+
+    completed = checklist([exercise_row(exercise) for exercise in EXERCISES], {0}, key="list")
+
+    table, kwargs = calls[0]
+    assert completed == {2}
+    assert list(table.columns) == [DONE_COLUMN, "Exercise", "Sets/Reps", "Equipment", "Notes"]
+    assert table[DONE_COLUMN].tolist() == [True, False, False]
+    assert DONE_COLUMN not in kwargs["disabled"]
+
+def test_editor_key_follows_completion(monkeypatch):
+    keys = []
+    monkeypatch.setattr(st, "data_editor", lambda table, **kwargs: keys.append(kwargs["key"]) or table)
+    rows = [exercise_row(exercise) for exercise in EXERCISES]
+
+    assert checklist(rows, {1, 0}, key="list") == {0, 1}
+    checklist(rows, {0, 1}, key="list")
+    checklist(rows, set(), key="list")
+
+    assert keys[0] == keys[1] != keys[2]
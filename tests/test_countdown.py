@@ -0,0 +1,33 @@
+"""Tests for the client-side countdown component."""
+import streamlit as st
+
+from app.components import countdown
+
+def test_countdown_passes_timer_state(monkeypatch):
+    calls = []
+    monkeypatch.setattr(countdown, "_component", lambda **kwargs: calls.append(kwargs))
+
+    countdown.countdown_timer(90, -1.5, False, key="timer", on_event=print, run_id=1700000000.5,
+                              segments=[(0, "Cat-Cow"), (60, "Rest")], marks=[60])
+
+    kwargs = calls[0]
+    assert (kwargs["duration"], kwargs["elapsed"], kwargs["paused"]) == (90.0, 0.0, False)
+    assert kwargs["runId"] == "1700000000.5"
+    assert kwargs["key"] == "timer"
+    assert kwargs["segments"] == [[0.0, "Cat-Cow"], [60.0, "Rest"]]
+    assert kwargs["marks"] == [60.0]
+    assert (countdown.FRONTEND_DIR / "index.html").is_file()
+
+def test_events_reach_the_handler_once_per_change(monkeypatch):
+    calls = []
+    events = []
+    monkeypatch.setattr(countdown, "_component", lambda **kwargs: calls.append(kwargs))
+    countdown.countdown_timer(60, 0, False, key="timer_events", on_event=events.append)
+    on_change = calls[0]["on_change"]
+
+    st.session_state["timer_events"] = {"event": "pause", "elapsed": 12.0, "seq": "a-1"}
+    on_change()
+    st.session_state["timer_events"] = {"event": "tick", "elapsed": 13.0, "seq": "a-2"}
+    on_change()
+
+    assert events == [{"event": "pause", "elapsed": 12.0, "seq": "a-1"}]
@@ -0,0 +1,37 @@
+"""Tests for the cached audio cues."""
+import wave
+
+from app.components import countdown, cues
+
+def test_cue_files_are_short_wavs():
+    for name, filename in cues.CUES.items():
+        with wave.open(str(cues.FRONTEND_DIR / filename)) as cue:
+            assert cue.getnframes() / cue.getframerate() < 1, name
+        assert (cues.FRONTEND_DIR / filename).stat().st_size < 8 * 1024
+    assert (cues.FRONTEND_DIR / "index.html").is_file()
+
+def test_cues_are_referenced_not_embedded(monkeypatch):
+    calls = []
+    monkeypatch.setattr(countdown, "_component", lambda **kwargs: calls.append(kwargs))
+
+    countdown.countdown_timer(60, 0, False, key="timer", on_event=print)
+    countdown.countdown_timer(60, 0, False, key="quiet", on_event=print, sound=False)
+
+    assert calls[0]["cues"] == {"complete": "../app.components.cues.audio_cue/complete.wav",
+                                "mark": "../app.components.cues.audio_cue/mark.wav"}
+    assert calls[1]["cues"] == {}
+
+def test_audio_cue_sends_only_the_file_name(monkeypatch):
+    class FakeComponent:
+        name = "app.components.cues.audio_cue"
+
+        def __call__(self, **kwargs):
+            calls.append(kwargs)
+
+    calls = []
+    monkeypatch.setattr(cues, "_component", FakeComponent())
+
+    cues.audio_cue("complete", token=1700000000.5, key="cue")
+
+    assert calls == [{"file": "complete.wav", "token": "1700000000.5", "key": "cue", "height": 0,
+                      "default": None}]
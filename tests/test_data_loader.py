@@ -0,0 +1,101 @@
+"""Tests for the caches in app.data_loader and app.data.data_loader."""
+import os
+
+import pandas as pd
+import pytest
+
+from app.data import data_loader as csv_loader
+from app.data_loader import DataLoader
+
+def test_datasets_are_cached_separately():
+    loader = DataLoader()
+    
+    first = loader.load_lllt_data()
+    assert loader.load_lllt_data() is first
+    assert loader.get_treatment_data("Upper Back") is first["daily_schedule"]["Upper Back"]
+    loader.load_mobility_data()
+    
+    assert loader.cache_stats == {
+        "lllt": {"hits": 2, "misses": 1},
+        "mobility": {"hits": 0, "misses": 1}
+    }
+
+def test_expired_and_cleared_datasets_reload(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("app.data_loader.time.monotonic", lambda: now[0])
+    loader = DataLoader(cache_duration=60)
+    
+    first = loader.load_mobility_data()
+    now[0] += 59
+    assert loader.load_mobility_data() is first
+    now[0] += 1
+    second = loader.load_mobility_data()
+    assert second is not first
+    
+    loader.clear_cache("mobility")
+    assert loader.load_mobility_data() is not second
+    assert loader.cache_stats["mobility"] == {"hits": 1, "misses": 3}
+
+def test_cache_duration_must_be_non_negative():
+    loader = DataLoader()
+    loader.cache_duration = 0
+    
+    assert loader.load_lllt_data() is not loader.load_lllt_data()
+    with pytest.raises(ValueError):
+        loader.cache_duration = -1
+
+@pytest.fixture
+def count_reads(monkeypatch):
+    csv_loader.clear_csv_cache()
+    calls = []
+    read_csv = pd.read_csv
+    
+    def counting_read_csv(path, *args, **kwargs):
+        calls.append(path)
+        return read_csv(path, *args, **kwargs)
+    
+    monkeypatch.setattr(csv_loader.pd, "read_csv", counting_read_csv)
+    yield calls
+    csv_loader.clear_csv_cache()
+
+def test_csv_parsed_once_across_loaders(tmp_path, count_reads):
+    (tmp_path / "phase1_morning_df.csv").write_text("Exercise,Equipment\nWall Angels,Wall\n")
+    
+    first = csv_loader.DataLoader(tmp_path).load_phase_data(1, "morning")
+    first.loc[0, "Exercise"] = "Changed"
+    second = csv_loader.DataLoader(tmp_path).load_phase_data(1, "morning")
+    
+    assert len(count_reads) == 1
+    assert second.loc[0, "Exercise"] == "Wall Angels"
+    assert csv_loader.DataLoader(tmp_path).load_phase_data(2, "morning").empty
+
+def test_changed_csv_is_reparsed(tmp_path, count_reads):
+    path = tmp_path / "supplements_df.csv"
+    path.write_text("Supplement\nCreatine\n")
+    loader = csv_loader.DataLoader(tmp_path)
+    loader.load_supplements_data()
+    
+    path.write_text("Supplement\nCreatine\nZinc\n")
+    os.utime(path, ns=(1, 1))
+    
+    assert len(loader.load_supplements_data()) == 2
+    assert len(count_reads) == 2
+    assert len(csv_loader._csv_cache) == 1
+
+def test_mobility_tables_load_on_first_access(tmp_path, count_reads):
+    for phase, session in [(1, "morning"), (1, "prebed"), (2, "lunch")]:
+        (tmp_path / f"phase{phase}_{session}_df.csv").write_text("Exercise\nWall Angels\n")
+    (tmp_path / "supplements_df.csv").write_text("Supplement\nCreatine\n")
+    
+    data = csv_loader.DataLoader(tmp_path).load_all_mobility_data()
+    
+    assert list(data) == ["phase1", "phase2"]
+    assert list(data["phase1"]) == ["morning", "prebed"]
+    assert count_reads == []
+    
+    prebed = data["phase1"]["pre_bed"]
+    assert data["phase1"]["prebed"] is prebed
+    assert len(count_reads) == 1
+    assert "evening" not in data["phase1"]
+    with pytest.raises(KeyError):
+        data["phase1"]["lunch"]
@@ -0,0 +1,31 @@
+"""Tests for the shared duration grammar."""
+import pytest
+
+from app.utils.duration import Prescription, parse_duration, parse_prescription, parse_reps
+
+@pytest.mark.parametrize("text, expected", [
+    ("3x60s", Prescription(sets=3, reps=0, set_seconds=60, sides=1, seconds=180)),
+    ("15 reps/side", Prescription(sets=1, reps=15, set_seconds=75, sides=2, seconds=150)),
+    ("2 sets x 30 seconds", Prescription(sets=2, reps=0, set_seconds=30, sides=1, seconds=60)),
+    ("3x90s/side", Prescription(sets=3, reps=0, set_seconds=90, sides=2, seconds=540)),
+    ("10 reps/direction/side", Prescription(sets=1, reps=10, set_seconds=50, sides=4, seconds=200)),
+    ("8–10 reps/arm", Prescription(sets=1, reps=10, set_seconds=50, sides=2, seconds=100)),
+    ("3x30s hold", Prescription(sets=3, reps=0, set_seconds=30, sides=1, seconds=90)),
+    ("3x10 pulses/side", Prescription(sets=3, reps=10, set_seconds=50, sides=2, seconds=300)),
+    ("5 rounds", Prescription(sets=1, reps=5, set_seconds=300, sides=1, seconds=300)),
+])
+def test_grammar(text, expected):
+    assert parse_prescription(text) == expected
+
+def test_clauses_add_up_and_parentheticals_are_ignored():
+    assert parse_duration("10 mins (muscles), 3 mins (face/scrotum)") == 780
+    assert parse_duration("15 mins (scalp only)") == 900
+
+def test_defaults_and_reps():
+    assert parse_duration("invalid") == 60
+    assert parse_duration("invalid", default_seconds=0) == 0
+    assert parse_prescription("2 mins").is_timed
+    assert parse_reps("2x6 reps/side") == (6, 2)
+    assert parse_reps("10 reps") == (10, 1)
+    with pytest.raises(ValueError):
+        parse_reps("as needed")
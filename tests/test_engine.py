@@ -0,0 +1,86 @@
+"""Tests for the Streamlit-free timer and rep counter engine."""
+import pytest
+
+from app.utils.engine import (
+    EXERCISE_COMPLETE,
+    SET_COMPLETE,
+    RepEngine,
+    RepState,
+    TimerEngine,
+    TimerState
+)
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+def test_timer_counts_down_and_pauses():
+    clock = FakeClock()
+    engine = TimerEngine(clock)
+    state = TimerState()
+
+    engine.start(state, 65)
+    clock.now += 5
+    assert engine.display(state) == "01:00"
+
+    engine.pause(state)
+    clock.now += 30
+    assert engine.elapsed(state) == 5
+    engine.resume(state)
+    assert state.timer_start == 1030
+    clock.now += 10
+    assert engine.progress(state) == pytest.approx(15 / 65)
+
+    assert not engine.update(state)
+    clock.now += 50
+    assert engine.update(state)
+    assert not state.timer_active and state.should_play_sound
+    assert engine.display(state) == "00:00"
+
+def test_timer_restart_and_stop():
+    clock = FakeClock()
+    engine = TimerEngine(clock)
+    state = TimerState()
+    engine.start(state, 30)
+    clock.now += 20
+
+    engine.restart(state)
+    assert (state.timer_start, state.timer_duration) == (1020, 30)
+
+    engine.stop(state)
+    assert state == TimerState(timer_duration=30, last_update=1020)
+
+def test_state_round_trips_through_a_mapping():
+    session = {"current_set": 2, "unrelated": "kept"}
+    state = RepState.from_mapping(session)
+    assert (state.current_set, state.target_sets) == (2, 1)
+
+    state.target_sets = 3
+    state.store(session)
+    assert session == {"current_reps": 0, "target_reps": 0, "current_set": 2, "target_sets": 3,
+                       "unrelated": "kept"}
+    with pytest.raises(AttributeError):
+        state.extra = 1
+    with pytest.raises(TypeError):
+        RepState(extra=1)
+
+def test_rep_engine():
+    engine = RepEngine()
+    state = RepState()
+    engine.start(state, 10, 2)
+    for _ in range(12):
+        engine.increment(state)
+    assert engine.display(state) == ("Set 1/2 - Rep 10/10", 50)
+    assert engine.is_set_complete(state) and not engine.is_exercise_complete(state)
+
+    engine.complete_set(state)
+    assert engine.completed_sets(state) == 1
+    engine.sync(state, {"event": SET_COMPLETE, "set": 2})
+    assert engine.is_exercise_complete(state)
+
+    engine.start(state, 8, 3)
+    engine.sync(state, {"event": EXERCISE_COMPLETE, "set": 1})
+    assert engine.completed_sets(state) == 3
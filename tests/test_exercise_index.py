@@ -0,0 +1,37 @@
+"""Tests for the global exercise index."""
+from app.data.catalog import build_catalog
+from app.data.exercise_index import build_exercise_index, exercise_id
+
+def exercise(name, sets_reps, equipment="None", notes=""):
+    return {"name": name, "sets_reps": sets_reps, "equipment": equipment, "notes": notes}
+
+def test_index_merges_phases_and_sessions(tmp_path):
+    catalog = build_catalog(tmp_path, {
+        1: {"morning": [exercise("Dynamic Cat-Cow", "2 mins", "Mat", "Breathe")]},
+        2: {"pre_bed": [exercise("Dynamic Cat Cow", "3 mins", "Mat", "Slow"),
+                        exercise("Wall Angels", "60 seconds", "Wall")]}
+    })
+    demos = {"Dynamic Cat-Cow": {"youtube": "https://example.com/cat-cow"}}
+    
+    index = build_exercise_index(catalog, demos)
+    
+    assert sorted(index) == ["dynamic-cat-cow", "wall-angels"]
+    record = index["  dynamic cat-cow "]
+    assert record.name == "Dynamic Cat-Cow"
+    assert record.phases == (1, 2)
+    assert record.sessions == ("morning", "prebed")
+    assert record.duration_seconds == 120
+    assert record.duration_for(2, "prebed") == 180
+    assert record.duration_for(3, "lunch") == 120
+    assert record.demo == demos["Dynamic Cat-Cow"]
+    assert index.find({"Exercise": "WALL ANGELS"}).equipment == "Wall"
+    assert index.find("Unknown") is None
+
+def test_canonical_name_and_demo_lookup(tmp_path):
+    catalog = build_catalog(tmp_path, {1: {"lunch": [exercise("90/90 Hip Switch", "10 reps/side")]}})
+    index = build_exercise_index(catalog, {"Sun Salutation A": {"how_to": ["Start in Mountain Pose"]}})
+    
+    assert exercise_id("90/90 Hip Switch") == "90-90-hip-switch"
+    assert index.canonical_name({"name": "90 90 hip switch"}) == "90/90 Hip Switch"
+    assert index.canonical_name("Test Exercise") == "Test Exercise"
+    assert index.demo("sun salutation a") == {"how_to": ["Start in Mountain Pose"]}
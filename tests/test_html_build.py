@@ -0,0 +1,138 @@
+"""Tests for the protocol page build."""
+import gzip
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from data import html_generator
+from data.html_generator import PHASES, build_protocols, main
+from data.html_postprocess import REPORT_FILENAME, minify_html
+from data.search_index import STOP_WORDS, build_search_index, search_box_html, write_search_index
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+def test_import_has_no_side_effects():
+    """Importing the module must not load data."""
+    assert not hasattr(html_generator, "lllt_daily_df")
+    assert not hasattr(html_generator, "lllt_supplements_df")
+
+def test_build_full_matrix(tmp_path):
+    """Every phase is rendered for every day type."""
+    files = build_protocols(data_dir=str(DATA_DIR), output_dir=str(tmp_path))
+    
+    assert len(files) == len(PHASES) * 3
+    names = {Path(f).name for f in files}
+    assert "foundation_lllt_days.html" in names
+    assert "development_rest_days.html" in names
+    assert "advanced_flexible_day.html" in names
+    
+    html = (tmp_path / "advanced_rest_days.html").read_text()
+    assert "Advanced (Months 10-18)" in html
+    assert "<li>Wall</li>" in html
+
+def test_build_subset(tmp_path):
+    """Only the requested phases and day types are written."""
+    files = build_protocols(
+        data_dir=str(DATA_DIR),
+        output_dir=str(tmp_path),
+        phases=["foundation"],
+        day_types=["Rest Days"]
+    )
+    
+    assert [Path(f).name for f in files] == ["foundation_rest_days.html"]
+    assert "Camel Pose (Dynamic Pulses)" in Path(files[0]).read_text()
+
+def test_build_unknown_phase(tmp_path):
+    with pytest.raises(ValueError):
+        build_protocols(data_dir=str(DATA_DIR), output_dir=str(tmp_path), phases=["expert"])
+
+def test_main_cli(tmp_path, capsys):
+    main(["--data-dir", str(DATA_DIR), "--output-dir", str(tmp_path), "--phase", "development"])
+    
+    assert len(list(tmp_path.glob("development_*.html"))) == 3
+    assert "Generated 3 protocol files" in capsys.readouterr().out
+
+@pytest.mark.parametrize("script", ["data/html_generator.py", "app/data/html_generator.py"])
+def test_generators_run_as_scripts(script, tmp_path):
+    """The generators still run by path, from any directory."""
+    result = subprocess.run([sys.executable, str(DATA_DIR.parent / script), "--help"],
+                            cwd=tmp_path, capture_output=True, text=True)
+    
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.startswith("usage:")
+
+def test_minify_html():
+    html = """
+    <html>
+        <head>
+            <style>
+                body {
+                    margin: 0;   /* reset */
+                }
+            </style>
+        </head>
+        <body>
+            <p><strong>Phase:</strong>   Foundation</p>
+            <pre>  keep
+  this</pre>
+        </body>
+    </html>
+    """
+    minified = minify_html(html)
+    
+    assert minified.startswith("<html><head><style>body{margin:0}</style>")
+    assert "<p><strong>Phase:</strong> Foundation</p>" in minified
+    assert "<pre>  keep\n  this</pre>" in minified
+
+def test_build_minified_and_compressed(tmp_path):
+    files = build_protocols(
+        data_dir=str(DATA_DIR),
+        output_dir=str(tmp_path),
+        phases=["advanced"],
+        minify=True,
+        compress=True
+    )
+    
+    report = json.loads((tmp_path / REPORT_FILENAME).read_text())
+    assert [entry["page"] for entry in report] == [Path(f).name for f in files]
+    for file, entry in zip(files, report):
+        page = Path(file).read_bytes()
+        with gzip.open(f"{file}.gz") as gz:
+            assert gz.read() == page
+        assert entry["minified_bytes"] == len(page)
+        assert entry["gzip_bytes"] < entry["minified_bytes"] < entry["original_bytes"]
+
+def test_search_index(tmp_path):
+    records = [
+        {"name": "Wall Angels", "label": "Phase 1 / Lunch", "href": "phase1_protocol.html#lunch-1",
+         "equipment": "Wall", "notes": "Keep lower back flat."},
+        {"name": "Supported Bridge Pose", "label": "Phase 1 / Morning", "href": "phase1_protocol.html#morning-8",
+         "equipment": "Yoga block", "notes": None}
+    ]
+    
+    index = build_search_index(records)
+    
+    assert index["terms"] == sorted(index["terms"])
+    assert "the" not in index["terms"]
+    postings = dict(zip(index["terms"], index["postings"]))
+    assert postings["wall"] == [0]
+    assert postings["block"] == [1]
+    assert index["docs"][1] == ["Supported Bridge Pose", "Phase 1 / Morning", "phase1_protocol.html#morning-8"]
+    
+    (tmp_path / "search_index.000000000000.js").write_text("stale")
+    filename = write_search_index(index, tmp_path)
+    
+    assert [p.name for p in tmp_path.glob("search_index.*.js")] == [filename]
+    assert (tmp_path / filename).read_text().startswith("window.PROTOCOL_SEARCH_INDEX={")
+    assert write_search_index(index, tmp_path) == filename
+
+def test_search_box_drops_stop_words():
+    """The browser filters query terms like ``tokenize`` does."""
+    html = search_box_html("search_index.abc.js")
+    
+    assert '<script src="search_index.abc.js"></script>' in html
+    assert f"var stopWords = {json.dumps(sorted(STOP_WORDS))};" in html
+    assert "token.length > 1 && stopWords.indexOf(token) === -1" in html
@@ -0,0 +1,23 @@
+"""Startup import budget for the Streamlit entry points."""
+from benchmarks.import_time import ENTRY_POINTS, check_budget, measure_imports
+
+def test_main_app_defers_heavy_imports():
+    timings = measure_imports("main_app")
+    
+    assert "main_app" in timings
+    # Only the module budget is machine independent enough for a test
+    assert check_budget("main_app", timings, None, ENTRY_POINTS["main_app"]["forbidden"]) == []
+
+def test_app_script_defers_heavy_imports():
+    timings = measure_imports("app.py")
+    
+    assert timings["app.py"] > 0
+    assert check_budget("app.py", timings, None, ENTRY_POINTS["app.py"]["forbidden"]) == []
+
+def test_check_budget_reports_violations():
+    timings = {"main_app": 2_000_000, "pandas": 400_000}
+    
+    assert check_budget("main_app", timings, 1000, ("pandas", "bs4")) == [
+        "main_app: 2000 ms exceeds the 1000 ms budget",
+        "main_app: imports pandas at startup"
+    ]
@@ -0,0 +1,58 @@
+"""Tests for cached protocol parsing in data.mobility_data."""
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from data import mobility_data
+from data.html_generator import build_protocols
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+@pytest.fixture
+def protocols_dir(tmp_path, monkeypatch):
+    output_dir = tmp_path / "protocols"
+    build_protocols(data_dir=str(DATA_DIR), output_dir=str(output_dir),
+                    phases=["foundation"], day_types=["LLLT Days"])
+    monkeypatch.setattr(mobility_data, "PROTOCOLS_DIR", str(output_dir))
+    mobility_data._protocol_cache.clear()
+    yield output_dir
+    mobility_data._protocol_cache.clear()
+
+def count_parses(monkeypatch):
+    calls = []
+    parse = mobility_data.parse_protocol_html
+    
+    def counting_parse(html_content):
+        calls.append(html_content)
+        return parse(html_content)
+    
+    monkeypatch.setattr(mobility_data, "parse_protocol_html", counting_parse)
+    return calls
+
+def test_build_writes_sidecars(protocols_dir, monkeypatch):
+    parses = count_parses(monkeypatch)
+    sidecar = json.loads((protocols_dir / "foundation_lllt_days.json").read_text())
+    
+    protocol = mobility_data.get_current_protocol()
+    
+    assert protocol == sidecar["protocol"]
+    assert protocol["exercises"] and protocol["supplements"]
+    assert parses == []
+
+def test_changed_html_is_parsed_once(protocols_dir, monkeypatch):
+    parses = count_parses(monkeypatch)
+    html_path = protocols_dir / "foundation_lllt_days.html"
+    html_path.write_text(html_path.read_text().replace("Camel Pose", "Camel Pulse"))
+    os.utime(html_path, ns=(1, 1))
+    
+    first = mobility_data.get_current_protocol()
+    first["exercises"].clear()
+    second = mobility_data.get_supplements()
+    mobility_data._protocol_cache.clear()
+    third = mobility_data.get_current_protocol()
+    
+    assert len(parses) == 1
+    assert second
+    assert third["exercises"][0]["name"].startswith("Camel Pulse")
@@ -0,0 +1,54 @@
+"""Tests for the frozen module-level protocol data."""
+from types import MappingProxyType
+
+import pytest
+
+from app.data import health as app_health
+from data import health, lllt_data
+from data.frozen import freeze, thaw
+from models.lllt import LLLTProtocol
+
+def test_freeze_nested_data():
+    frozen = freeze({"morning": [{"name": "Wall Angels", "steps": ["Stand tall"]}]})
+    
+    assert isinstance(frozen, MappingProxyType)
+    assert frozen["morning"][0]["steps"] == ("Stand tall",)
+    with pytest.raises(TypeError):
+        frozen["morning"][0]["name"] = "Changed"
+
+def test_thaw_restores_plain_containers():
+    data = {"morning": [{"name": "Wall Angels", "steps": ["Stand tall"]}]}
+    
+    assert thaw(freeze(data)) == data
+    assert type(thaw(freeze(data))["morning"]) is list
+
+def test_lllt_dataframes_from_frozen_data():
+    protocol = LLLTProtocol(
+        name="LLLT Protocol",
+        description="",
+        daily_schedule=lllt_data.get_lllt_daily_data(),
+        supplement_schedule=lllt_data.get_supplement_data(),
+        weekly_schedule=lllt_data.get_weekly_schedule()
+    )
+    
+    daily = protocol.to_dataframe()["daily"]
+    
+    # One column per area, as from the unfrozen dict
+    assert list(daily.columns) == ["Head", "Neck", "Back"]
+    assert daily.shape == (2, 3)
+
+def test_getters_return_shared_read_only_data():
+    assert lllt_data.get_lllt_daily_data() is lllt_data.get_lllt_daily_data()
+    assert health.get_mobility_phase2() is health.MOBILITY_PHASE2
+    with pytest.raises(AttributeError):
+        lllt_data.get_supplement_data().append({})
+
+def test_current_exercises_memoized_per_phase_and_session(monkeypatch):
+    monkeypatch.setattr(app_health, "get_current_phase", lambda: "Phase 2")
+    monkeypatch.setattr(app_health, "get_current_session", lambda: "lunch")
+    
+    exercises = app_health.get_current_exercises()
+    
+    assert exercises is app_health.get_current_exercises()
+    assert exercises == app_health.PHASE2_EXERCISES["lunch"]
+    assert app_health.get_phase_exercises("Phase 1", "unknown") == ()
@@ -0,0 +1,75 @@
+"""Tests for the generated protocols server."""
+import gzip
+import http.client
+import threading
+
+import pytest
+
+from data.protocol_server import IMMUTABLE_CACHE, accepts_gzip, create_server, etag_matches
+
+PAGE = b"<html><body>Protocol</body></html>"
+
+@pytest.fixture
+def server(tmp_path):
+    """Serve a small protocols directory on a free port."""
+    (tmp_path / "index.html").write_bytes(PAGE)
+    (tmp_path / "index.html.gz").write_bytes(gzip.compress(PAGE))
+    (tmp_path / "search.0123abcd.js").write_bytes(b"var x = 1;")
+    
+    httpd = create_server(str(tmp_path), port=0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+
+def request(port, path, headers=None):
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    conn.request("GET", path, headers=headers or {})
+    response = conn.getresponse()
+    body = response.read()
+    conn.close()
+    return response, body
+
+def test_etag_and_not_modified(server):
+    response, body = request(server, "/")
+    etag = response.getheader("ETag")
+    
+    assert response.status == 200
+    assert body == PAGE
+    assert etag
+    assert response.getheader("Cache-Control") == "no-cache"
+    
+    response, body = request(server, "/index.html", {"If-None-Match": etag})
+    assert response.status == 304
+    assert body == b""
+    assert response.getheader("ETag") == etag
+
+def test_serves_precompressed_page(server):
+    plain, _ = request(server, "/index.html")
+    response, body = request(server, "/index.html", {"Accept-Encoding": "br, gzip"})
+    
+    assert response.getheader("Content-Encoding") == "gzip"
+    assert response.getheader("Content-Type") == "text/html"
+    assert response.getheader("Vary") == "Accept-Encoding"
+    assert gzip.decompress(body) == PAGE
+    assert response.getheader("ETag") != plain.getheader("ETag")
+
+def test_hashed_asset_is_immutable(server):
+    response, _ = request(server, "/search.0123abcd.js")
+    
+    assert response.status == 200
+    assert response.getheader("Cache-Control") == IMMUTABLE_CACHE
+
+def test_missing_file(server):
+    response, _ = request(server, "/missing.html")
+    assert response.status == 404
+
+def test_header_helpers():
+    assert accepts_gzip("gzip, deflate")
+    assert accepts_gzip("*")
+    assert not accepts_gzip("gzip;q=0")
+    assert not accepts_gzip("br")
+    assert etag_matches('W/"abc", "def"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"abc"', '"def"')
@@ -0,0 +1,54 @@
+"""Tests for the shared protocol catalog in app.protocols."""
+import pandas as pd
+import pytest
+
+from app.protocols import LLLTProtocol, MobilityProtocol, freeze_protocol
+
+def test_freeze_protocol_makes_mappings_read_only():
+    protocol = freeze_protocol(MobilityProtocol(
+        name="Mobility",
+        description="Progressive mobility",
+        progress_metrics=pd.DataFrame(),
+        phases={"phase1": pd.DataFrame({"name": ["Wall Angels"]})},
+        phase_details={"phase1": {"name": "Foundation"}}
+    ))
+    
+    assert protocol.get_phase_data("phase1")["name"].tolist() == ["Wall Angels"]
+    assert protocol.to_dict()["phase_details"] == {"foundational_mobility": {"name": "Foundation"}}
+    with pytest.raises(TypeError):
+        protocol.phases["phase2"] = pd.DataFrame()
+    with pytest.raises(TypeError):
+        protocol.phase_details["phase1"]["name"] = "Changed"
+
+def test_freeze_protocol_freezes_lists():
+    protocol = freeze_protocol(LLLTProtocol(
+        name="LLLT",
+        description="Light therapy",
+        progress_metrics=pd.DataFrame(),
+        daily_schedule={"scalp": [{"name": "Cap"}]},
+        supplement_schedule=[{"name": "Zinc"}]
+    ))
+    
+    assert protocol.supplement_schedule[0]["name"] == "Zinc"
+    with pytest.raises(AttributeError):
+        protocol.supplement_schedule.append({"name": "Iron"})
+    with pytest.raises(AttributeError):
+        protocol.daily_schedule["scalp"].append({"name": "Panel"})
+
+def test_update_phase_data_on_frozen_protocol_copies_phases(monkeypatch):
+    monkeypatch.setattr("app.protocols.DataValidator.validate_exercise", lambda exercise: [])
+    protocol = freeze_protocol(MobilityProtocol(
+        name="Mobility",
+        description="Progressive mobility",
+        progress_metrics=pd.DataFrame(),
+        phases={"phase1": pd.DataFrame({"name": ["Wall Angels"]})}
+    ))
+    old_phases = protocol.phases
+    
+    assert protocol.update_phase_data("phase2", pd.DataFrame({"name": ["Deep Squat"]}))
+    
+    assert list(old_phases) == ["phase1"]
+    assert list(protocol.phases) == ["phase1", "phase2"]
+    with pytest.raises(TypeError):
+        protocol.phases["phase3"] = pd.DataFrame()
+    assert not protocol.update_phase_data("phase4", pd.DataFrame())
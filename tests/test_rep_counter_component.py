@@ -0,0 +1,101 @@
+"""Tests for the client-side rep counter component."""
+import pytest
+import streamlit as st
+
+from app.components import rep_counter as component
+from app.utils.rep_counter import (
+    EXERCISE_COMPLETE,
+    SET_COMPLETE,
+    get_completed_sets,
+    get_rep_display,
+    is_exercise_complete,
+    start_rep_counter,
+    sync_rep_counter
+)
+from app.utils.storage import (
+    load_session_progress,
+    load_set_progress,
+    save_session_progress,
+    save_set_progress
+)
+from app.views.mobility_view import reset_session
+
+class SessionState(dict):
+    """Session state stand-in with attribute access."""
+    __getattr__ = dict.__getitem__
+    __setattr__ = dict.__setitem__
+
+@pytest.fixture
+def session_state(monkeypatch):
+    state = SessionState()
+    monkeypatch.setattr(st, "session_state", state)
+    return state
+
+def test_rep_counter_passes_counter_state(monkeypatch):
+    calls = []
+    monkeypatch.setattr(component, "_component", lambda **kwargs: calls.append(kwargs))
+
+    component.rep_counter(15, 3, 2, 4, key="reps", on_event=print, label="Squats")
+
+    kwargs = calls[0]
+    assert (kwargs["targetReps"], kwargs["targetSets"]) == (15, 3)
+    assert (kwargs["currentSet"], kwargs["currentReps"]) == (2, 4)
+    assert kwargs["label"] == "Squats"
+    assert (component.FRONTEND_DIR / "index.html").is_file()
+
+def test_only_completion_events_reach_the_handler(monkeypatch, session_state):
+    calls = []
+    events = []
+    monkeypatch.setattr(component, "_component", lambda **kwargs: calls.append(kwargs))
+    component.rep_counter(10, 2, 1, 0, key="reps_events", on_event=events.append)
+    on_change = calls[0]["on_change"]
+
+    session_state["reps_events"] = {"event": SET_COMPLETE, "set": 1, "reps": 10, "seq": "a-1"}
+    on_change()
+    session_state["reps_events"] = {"event": "rep", "set": 2, "reps": 1, "seq": "a-2"}
+    on_change()
+
+    assert [event["seq"] for event in events] == ["a-1"]
+
+def test_sync_matches_rep_display(session_state):
+    start_rep_counter(15, 3)
+
+    sync_rep_counter({"event": SET_COMPLETE, "set": 1, "reps": 15})
+    assert get_rep_display() == ("Set 2/3 - Rep 0/15", pytest.approx(100 / 3))
+    assert get_completed_sets() == 1
+
+    sync_rep_counter({"event": EXERCISE_COMPLETE, "set": 3, "reps": 12})
+    assert get_rep_display() == ("Set 3/3 - Rep 15/15", 100)
+    assert is_exercise_complete()
+    assert get_completed_sets() == 3
+
+def test_set_progress_is_stored_per_session(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    save_set_progress("morning", 2, 1)
+    save_set_progress("morning", 2, 2)
+    save_set_progress("evening", 0, 1)
+
+    assert load_set_progress("morning") == {2: 2}
+    assert load_set_progress("lunch") == {}
+
+def test_reset_session_clears_progress_and_counters(monkeypatch, tmp_path, session_state):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    save_session_progress({0, 1}, "morning")
+    save_set_progress("morning", 2, 1)
+    save_set_progress("evening", 0, 1)
+    start_rep_counter(10, 3)
+    sync_rep_counter({"event": SET_COMPLETE, "set": 1, "reps": 10})
+    session_state.update(completed_exercises={0, 1}, rep_exercise=2,
+                         guided_start=100.0, guided_paused_at=130.0)
+
+    reset_session("morning")
+
+    assert session_state.completed_exercises == set()
+    assert load_session_progress("morning") == set()
+    assert load_set_progress("morning") == {}
+    assert load_set_progress("evening") == {0: 1}
+    assert "rep_exercise" not in session_state
+    assert (session_state.current_set, session_state.current_reps) == (1, 0)
+    assert session_state.guided_start is None
+    assert session_state.guided_paused_at is None
@@ -1,7 +1,11 @@
 """Tests for application state management."""
 import pytest
 from datetime import datetime, timedelta
+from pathlib import Path
 
+import pandas as pd
+
+from app.data.catalog import get_catalog
 from app.utils.state import AppState
 
 @pytest.fixture
@@ -88,4 +92,16 @@ def test_get_session_stats(state):
     stats = state.get_session_stats()
     assert stats["completed_count"] == 1
     assert stats["active_exercise"] is None
-    assert isinstance(stats["session_duration"], timedelta) 
\ No newline at end of file
+    assert isinstance(stats["session_duration"], timedelta) 
+
+def test_mobility_rows_come_from_the_catalog(monkeypatch):
+    """Test that mobility sessions are catalog slices, not a second copy."""
+    # The loader reads its LLLT tables from ./data
+    monkeypatch.chdir(Path(__file__).resolve().parent.parent / "app")
+    state = AppState(selected_protocol="mobility")
+    
+    assert not hasattr(state, "mobility_data")
+    pd.testing.assert_frame_equal(
+        state.get_current_phase_data("morning"),
+        get_catalog().session("morning", phase=1)
+    )
@@ -0,0 +1,37 @@
+"""Tests for the linked theme stylesheets."""
+import os
+
+import pytest
+import streamlit as st
+
+from app.utils import theme
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_pages_link_stylesheets_instead_of_embedding_css(monkeypatch):
+    calls = []
+    monkeypatch.setattr(st, "markdown", lambda body, **kwargs: calls.append(body))
+
+    theme.setup_theme()
+    theme.apply_custom_css()
+
+    assert len(calls) == 1
+    assert calls[0].startswith('<link rel="stylesheet" href="app/static/theme.css?v=')
+    assert "<style>" not in calls[0]
+
+@pytest.mark.parametrize("name", ["app.css", "main_app.css", "theme.css"])
+def test_stylesheets_are_served_from_static(name):
+    path = os.path.join(theme.STATIC_DIR, name)
+
+    assert os.path.dirname(path) == os.path.join(REPO_ROOT, "static")
+    with open(path) as f:
+        assert "<style>" not in f.read()
+    assert theme.stylesheet_url(name) == f"app/static/{name}?v={int(os.path.getmtime(path))}"
+
+def test_config_enables_static_serving():
+    tomllib = pytest.importorskip("tomllib")
+    with open(os.path.join(REPO_ROOT, ".streamlit", "config.toml"), "rb") as f:
+        config = tomllib.load(f)
+
+    assert config["server"]["enableStaticServing"] is True
+    assert config["theme"]["primaryColor"] == "#5A70DD"
@@ -0,0 +1,35 @@
+"""Tests for session timeline planning."""
+from app.utils.timeline import REST, WORK, build_timeline, plan_session
+
+EXERCISES = [
+    {"name": "Cat-Cow", "sets_reps": "2 mins"},
+    {"name": "Hip Switch", "sets_reps": "2x30s/side"},
+    {"name": "Breathing", "sets_reps": "as long as needed"},
+]
+
+def test_timeline_offsets_sides_and_rests():
+    timeline = build_timeline(EXERCISES, rest_between_sets=15, transition_seconds=10)
+    
+    # 120 s, transition, 2 sets x 2 sides x 30 s with one rest, transition, default 60 s
+    assert timeline.exercise_starts == (0, 130, 275)
+    assert timeline.exercise_ends == (120, 265, 335)
+    assert timeline.total_seconds == 335
+    kinds = [segment.kind for segment in timeline.segments if segment.exercise == 1]
+    assert kinds == [REST, WORK, WORK, REST, WORK, WORK]
+    assert timeline.segment_at(160).label == "Hip Switch · set 1/2 · right"
+    assert timeline.segment_at(200).kind == REST
+    assert timeline.segment_at(335) is None
+
+def test_completed_count_follows_exercise_ends():
+    timeline = build_timeline(EXERCISES)
+    
+    assert timeline.completed_count(0) == 0
+    assert timeline.completed_count(timeline.exercise_ends[0]) == 1
+    assert timeline.completed_count(timeline.total_seconds) == 3
+
+def test_plan_session_uses_catalog_columns():
+    timeline = plan_session(2, "pre_bed")
+    
+    assert timeline.names
+    assert timeline.total_seconds >= sum(end - start for start, end in
+                                         zip(timeline.exercise_starts, timeline.exercise_ends))
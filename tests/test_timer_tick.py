@@ -0,0 +1,25 @@
+"""Fragment-scoped timer refresh."""
+import streamlit as st
+from streamlit.runtime.state import SessionStateProxy
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.timer_tick import PAGE_SCRIPT, fragment_reruns
+
+def test_timer_refresh_reruns_only_the_timer(monkeypatch):
+    # AppTest needs the real session state, not the conftest dict
+    monkeypatch.setattr(st, "session_state", SessionStateProxy())
+    app = AppTest.from_string(PAGE_SCRIPT.replace("PHASE", "1"), default_timeout=60)
+
+    app.run()
+    assert not app.exception
+    assert app.expander
+
+    with fragment_reruns(app):
+        app.run()
+
+    # The page body did not run again; the refresh sent only the timer
+    assert not app.exception
+    assert app.session_state.page_runs == 1
+    assert not app.expander
+    assert len(app.get("progress")) == 1
+    assert app.markdown[0].value.startswith("**Time Remaining:**")
@@ -0,0 +1,52 @@
+"""Tests for dashboard HTML generation."""
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pandas as pd
+
+from visualization import html_generator
+from visualization.html_generator import HTMLGenerator
+
+def test_table_rendering_escapes_cells():
+    df = pd.DataFrame({
+        "Exercise": ["Cat <Cow>", "Bridge & Hold"],
+        "Sets": [3, None]
+    })
+    
+    table = HTMLGenerator._render_table(df)
+    
+    assert table.startswith('<table class="protocol-table"><thead><tr><th>Exercise</th><th>Sets</th>')
+    assert "<tr><td>Cat &lt;Cow&gt;</td><td>3.0</td></tr>" in table
+    assert "<tr><td>Bridge &amp; Hold</td><td></td></tr>" in table
+
+def test_unchanged_sections_are_not_rerendered():
+    HTMLGenerator._fragment_cache.clear()
+    morning = pd.DataFrame({"Exercise": ["Cat-Cow"], "Notes": [["breathe"]]})
+    lunch = pd.DataFrame({"Exercise": ["Wall Angels"]})
+    
+    with patch.object(HTMLGenerator, "_render_table", wraps=HTMLGenerator._render_table) as render:
+        first = HTMLGenerator.generate_dashboard({"Morning": morning, "Lunch": lunch})
+        assert render.call_count == 2
+        
+        second = HTMLGenerator.generate_dashboard({"Morning": morning.copy(), "Lunch": lunch})
+        assert render.call_count == 2
+        assert second == first
+        
+        lunch.loc[0, "Exercise"] = "Chin Tucks"
+        third = HTMLGenerator.generate_dashboard({"Morning": morning, "Lunch": lunch})
+        assert render.call_count == 3
+        assert "Chin Tucks" in third
+
+def test_fragment_cache_is_bounded_across_threads(monkeypatch):
+    HTMLGenerator._fragment_cache.clear()
+    monkeypatch.setattr(html_generator, "_FRAGMENT_CACHE_SIZE", 8)
+    tables = [pd.DataFrame({"Exercise": [f"Exercise {i}"]}) for i in range(32)]
+    
+    def render(i):
+        return HTMLGenerator.generate_protocol_html(tables[i % len(tables)], f"Section {i % 12}")
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        fragments = list(executor.map(render, range(200)))
+    
+    assert len(HTMLGenerator._fragment_cache) == 8
+    assert all(f"Exercise {i % 32}" in fragment for i, fragment in enumerate(fragments))
@@ -0,0 +1,56 @@
+"""Tests for filesystem-driven cache invalidation."""
+import threading
+
+from app.data import data_loader as csv_loader
+from app.data.watcher import DataWatcher, data_watcher
+
+def test_notify_runs_matching_callbacks(tmp_path):
+    watcher = DataWatcher()
+    csv_changes, all_changes = [], []
+    try:
+        assert watcher.watch(tmp_path, csv_changes.append, suffixes=(".csv",))
+        assert watcher.watch(tmp_path, csv_changes.append, suffixes=(".csv",))
+        assert watcher.watch(tmp_path, all_changes.append)
+        assert not watcher.watch(tmp_path / "missing", all_changes.append)
+        
+        watcher.notify(tmp_path / "phase1_lunch_df.csv")
+        watcher.notify(tmp_path / "protocols.xlsx")
+        watcher.notify(tmp_path / "other" / "phase1_lunch_df.csv")
+    finally:
+        watcher.stop()
+    
+    assert csv_changes == [tmp_path / "phase1_lunch_df.csv"]
+    assert all_changes == [tmp_path / "phase1_lunch_df.csv", tmp_path / "protocols.xlsx"]
+
+def test_file_change_reaches_callback(tmp_path):
+    watcher = DataWatcher()
+    changed = threading.Event()
+    path = tmp_path / "supplements_df.csv"
+    path.write_text("Supplement\nCreatine\n")
+    try:
+        watcher.watch(tmp_path, lambda p: p.name == path.name and changed.set())
+        assert not watcher.running
+        watcher.start()
+        watcher.start()
+        path.write_text("Supplement\nZinc\n")
+        assert changed.wait(5)
+    finally:
+        watcher.stop()
+
+def test_registering_does_not_start_observer(tmp_path):
+    watcher = DataWatcher()
+    
+    assert watcher.watch(tmp_path, print)
+    assert not watcher.running
+    csv_loader.DataLoader(tmp_path)
+    assert not data_watcher.running
+
+def test_invalidate_csv_refreshes_lazy_tables(tmp_path):
+    path = tmp_path / "phase1_morning_df.csv"
+    path.write_text("Exercise\nWall Angels\n")
+    data = csv_loader.DataLoader(tmp_path).load_all_mobility_data()
+    first = data["phase1"]["morning"]
+    
+    assert data["phase1"]["morning"] is first
+    csv_loader.invalidate_csv(path)
+    assert data["phase1"]["morning"] is not first
@@ -1,34 +1,110 @@
+import hashlib
+import html
 import pandas as pd
-from typing import Dict, List
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple
 import json
 
+# Shared table styles, emitted once per dashboard
+TABLE_STYLE = """
+<style>
+    .protocol-table th {
+        background-color: #f4f4f4;
+    }
+    .protocol-table td {
+        padding: 8px;
+    }
+</style>
+"""
+
+# Rendered section fragments keyed by (title, DataFrame content hash); shared
+# by every generator and thread, so the LRU updates hold a lock
+_FRAGMENT_CACHE_SIZE = 128
+_fragment_cache_lock = threading.Lock()
+
+def _escape(values: pd.Series) -> pd.Series:
+    """HTML-escape a whole column at once."""
+    return (values
+        .str.replace("&", "&amp;", regex=False)
+        .str.replace("<", "&lt;", regex=False)
+        .str.replace(">", "&gt;", regex=False)
+        .str.replace('"', "&quot;", regex=False)
+    )
+
 class HTMLGenerator:
     """Generate HTML visualizations for health protocols"""
     
+    _fragment_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+    
+    @staticmethod
+    def _content_hash(df: pd.DataFrame) -> str:
+        """Calculate a checksum of the DataFrame's columns and values."""
+        try:
+            values = pd.util.hash_pandas_object(df, index=False).values.tobytes()
+        except TypeError:
+            # Unhashable cells (lists, dicts) fall back to their string form
+            values = pd.util.hash_pandas_object(df.astype(str), index=False).values.tobytes()
+        columns = repr((list(df.columns), [str(dtype) for dtype in df.dtypes])).encode()
+        return hashlib.md5(columns + values).hexdigest()
+    
+    @staticmethod
+    def _render_table(df: pd.DataFrame) -> str:
+        """Render a DataFrame as an HTML table, column by column."""
+        header = "".join(
+            "<th>" + _escape(pd.Series(df.columns, dtype=object).astype(str)) + "</th>"
+        )
+        
+        if df.empty:
+            body = ""
+        else:
+            rows = pd.Series("<tr>", index=df.index, dtype=object)
+            for column in range(df.shape[1]):
+                values = df.iloc[:, column]
+                cells = _escape(values.astype(str).where(values.notna(), ""))
+                rows = rows + "<td>" + cells + "</td>"
+            body = "".join((rows + "</tr>").tolist())
+        
+        return (
+            '<table class="protocol-table">'
+            f"<thead><tr>{header}</tr></thead>"
+            f"<tbody>{body}</tbody>"
+            "</table>"
+        )
+    
     @staticmethod
     def generate_protocol_html(df: pd.DataFrame, title: str) -> str:
-        """Generate HTML table with custom styling"""
-        html_template = f"""
+        """Generate HTML table with custom styling.
+        
+        Fragments are cached by title and DataFrame content, so unchanged
+        sections are not re-rendered.
+        """
+        cache = HTMLGenerator._fragment_cache
+        key = (title, HTMLGenerator._content_hash(df))
+        with _fragment_cache_lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+        
+        # Rendered outside the lock, so threads render different sections at once
+        fragment = f"""
         <div class="protocol-container">
-            <h2>{title}</h2>
-            {{table}}
+            <h2>{html.escape(title)}</h2>
+            {HTMLGenerator._render_table(df)}
         </div>
         """
         
-        styled_df = (df.style
-            .set_table_styles([
-                {'selector': 'th', 'props': [('background-color', '#f4f4f4')]},
-                {'selector': 'td', 'props': [('padding', '8px')]}
-            ])
-            .hide()
-        )
-        
-        return html_template.format(table=styled_df.to_html())
+        with _fragment_cache_lock:
+            cache[key] = fragment
+            cache.move_to_end(key)
+            if len(cache) > _FRAGMENT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return fragment
     
     @staticmethod
     def generate_dashboard(protocols: Dict[str, pd.DataFrame]) -> str:
         """Generate complete HTML dashboard"""
-        html_parts = []
+        html_parts = [TABLE_STYLE]
         for protocol_name, df in protocols.items():
             html_parts.append(HTMLGenerator.generate_protocol_html(df, protocol_name))
         